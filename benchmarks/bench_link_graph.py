@@ -0,0 +1,67 @@
+"""Time building and incrementally updating the wikilink traceability graph
+
+Run from the repository root:
+
+    python -m benchmarks.bench_link_graph [notes] [edits]
+
+Builds a synthetic vault of requirement notes plus one design note per
+three requirements (in a subfolder, each linking to its three
+requirements, leaving every other block of three unlinked), then times a
+cold graph build, an unchanged rescan and a rescan after a few edits.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import requirement_table, write_vault
+from link_graph import LinkGraph
+
+
+def write_design_notes(vault_dir, filenames):
+    design_dir = os.path.join(vault_dir, "Design")
+    os.makedirs(design_dir)
+    paths = []
+    for start in range(0, len(filenames), 6):
+        links = " ".join(f"[[{name[:-3]}]]" for name in filenames[start:start + 3])
+        path = os.path.join(design_dir, f"Design_{start // 6:05d}.md")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# Design {start // 6}\n\nCovers {links}\n")
+        paths.append(path)
+    return paths
+
+
+def timed(vault_dir):
+    start = time.perf_counter()
+    graph = LinkGraph.load(vault_dir, vault_dir)
+    parsed, removed = graph.update()
+    graph.save()
+    return graph, parsed, time.perf_counter() - start
+
+
+def main(count=30000, edits=5):
+    with tempfile.TemporaryDirectory() as vault_dir:
+        write_vault(vault_dir, count)
+        filenames = list(requirement_table(count)['filename'])
+        design = write_design_notes(vault_dir, filenames)
+
+        graph, cold_parsed, cold = timed(vault_dir)
+        _, warm_parsed, warm = timed(vault_dir)
+        for path in design[:edits]:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(f"\nAlso [[{filenames[-1][:-3]}]]\n")
+        graph, edit_parsed, edited = timed(vault_dir)
+
+        start = time.perf_counter()
+        linked = sum(graph.linked(vault_dir, filenames))
+        coverage = time.perf_counter() - start
+
+    print(f"notes:             {len(filenames)} requirements + {len(design)} design notes")
+    print(f"cold build:        {cold:.3f}s ({cold_parsed} parsed)")
+    print(f"unchanged rescan:  {warm:.3f}s ({warm_parsed} parsed)")
+    print(f"after {edits} edits:     {edited:.3f}s ({edit_parsed} parsed)")
+    print(f"coverage:          {coverage:.3f}s ({linked} linked)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,60 @@
+"""Compare serial and process-pool parsing of several RTM workbooks
+
+Run from the repository root:
+
+    python -m benchmarks.bench_multi_source [workbooks] [rows]
+
+The pool can only beat the serial pass with more than one CPU core.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from openpyxl import Workbook
+
+from excel_sources import iter_source_rows, load_sources
+
+
+def write_workbook(path, rows, prefix):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Requirements")
+    for i in range(5):
+        ws.append([f"Header {i}"])
+    for i in range(rows):
+        ws.append([f"{prefix}-{i:05d}", f"Category {i % 12}", f"Topic {i % 40}", None,
+                   f"Short description {i}", f"Long description for requirement {i}",
+                   ('High', 'Medium', 'Low')[i % 3]])
+    wb.save(path)
+
+
+def timed(sources, jobs):
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_source_rows(sources, jobs))
+    return time.perf_counter() - start, count
+
+
+def main(workbooks=10, rows=5000):
+    with tempfile.TemporaryDirectory() as directory:
+        for n in range(workbooks):
+            write_workbook(os.path.join(directory, f"rtm_{n:02d}.xlsx"), rows, f"WS{n:02d}")
+        sources_file = os.path.join(directory, "sources.json")
+        with open(sources_file, 'w', encoding='utf-8') as f:
+            json.dump([{"path": "rtm_*.xlsx"}], f)
+        sources = load_sources(sources_file)
+
+        one, _ = timed([dict(sources[0], path=os.path.join(directory, "rtm_00.xlsx"))], 1)
+        serial, count = timed(sources, 1)
+        pooled, pooled_count = timed(sources, workbooks)
+    assert count == pooled_count == workbooks * rows
+
+    print(f"workbooks:   {workbooks} x {rows} rows ({os.cpu_count()} CPUs)")
+    print(f"one:         {one:.3f}s")
+    print(f"serial:      {serial:.3f}s")
+    print(f"pool:        {pooled:.3f}s")
+    print(f"speedup:     {serial / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
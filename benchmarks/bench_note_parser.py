@@ -0,0 +1,97 @@
+"""Compare the full-read note parser with the bounded head/tail parser
+
+Run from the repository root:
+
+    python -m benchmarks.bench_note_parser [notes] [notes_kb]
+
+notes_kb is the size of each note's free-form ## Notes section.
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+
+from note_parser import empty_requirement_data, parse_requirement_note
+from note_sync import read_source_hash
+from note_template import DEFAULT_TEMPLATE, NoteTemplate
+from requirement_table import build_requirement_table
+from benchmarks.bench_requirement_table import make_raw_rows
+
+
+_CELL_SPLIT_RE = re.compile(r'(?<!\\)\|')
+
+
+def legacy_parse(filepath):
+    """The pre-bounded parser: whole file, every line stripped, substring checks"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    req_data = empty_requirement_data(filepath)
+    in_table = False
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith('| Attribute | Value |'):
+            in_table = True
+            continue
+        elif line.startswith('|---') and in_table:
+            continue
+        elif in_table and line.startswith('|') and '|' in line[1:]:
+            parts = [part.strip().strip('*') for part in _CELL_SPLIT_RE.split(line)[1:-1]]
+            if len(parts) >= 2:
+                attribute = parts[0].lower()
+                value = parts[1].replace('\\|', '|')
+                if 'requirement id' in attribute:
+                    req_data['requirement_id'] = value
+                elif 'category' in attribute or 'functional activity' in attribute:
+                    req_data['category'] = value
+                elif 'topic' in attribute:
+                    req_data['topic'] = value
+                elif 'short description' in attribute:
+                    req_data['short_description'] = value
+                elif 'description overview' in attribute:
+                    req_data['description'] = value
+                elif 'priority' in attribute:
+                    req_data['priority'] = value
+        elif in_table and not line.startswith('|'):
+            break
+    req_data['source_hash'] = read_source_hash(content)
+    return req_data
+
+
+def write_vault(directory, count, notes_kb):
+    """Synthetic notes from the default template with a padded ## Notes section"""
+    table = build_requirement_table(make_raw_rows(count))
+    table = table[table['valid']]
+    filler = ("Meeting notes, decisions and links. " * 30 + "\n") * max(1, notes_kb)
+    paths = []
+    for filename, content in zip(table['filename'],
+                                 NoteTemplate(DEFAULT_TEMPLATE).render_table(table, "2024-01-01T00:00:00")):
+        content = content.replace("*Add your additional notes and details here...*", filler)
+        path = os.path.join(directory, filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        paths.append(path)
+    return paths
+
+
+def timed(func, paths):
+    start = time.perf_counter()
+    results = [func(path) for path in paths]
+    return time.perf_counter() - start, results
+
+
+def main(count=2000, notes_kb=64):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_vault(directory, count, notes_kb)
+        legacy, expected = timed(legacy_parse, paths)
+        bounded, parsed = timed(parse_requirement_note, paths)
+    assert parsed == expected, "bounded parser output differs from legacy parser"
+
+    print(f"notes:       {len(paths)} (~{notes_kb} KB of ## Notes each)")
+    print(f"legacy:      {legacy:.3f}s")
+    print(f"bounded:     {bounded:.3f}s")
+    print(f"speedup:     {legacy / bounded:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,53 @@
+"""Compare rewriting a single overview note with an unchanged sharded overview
+
+Run from the repository root:
+
+    python -m benchmarks.bench_overview [requirements]
+"""
+import sys
+import tempfile
+import time
+
+from sync_engine import SyncEngine
+
+
+def make_requirements(count):
+    return [{
+        'requirement_id': f"REQ-{i:06d}",
+        'category': f"Category {i % 12}",
+        'topic': f"Topic {i % 40}",
+        'short_description': f"Short description {i}",
+        'description': f"Long description for requirement {i} " * 4,
+        'priority': ('High', 'Medium', 'Low')[i % 3],
+        'filename': f"REQ-{i:06d}_Short_description_{i}.md",
+    } for i in range(count)]
+
+
+def timed(engine, requirements):
+    start = time.perf_counter()
+    engine.generate_overview(requirements)
+    return time.perf_counter() - start
+
+
+def main(count=50000):
+    requirements = make_requirements(count)
+    with tempfile.TemporaryDirectory() as vault:
+        engine = SyncEngine('', vault)
+        engine.overview_shard_threshold = 0
+        single = timed(engine, requirements)
+
+        engine.overview_shard_threshold = 1
+        first = timed(engine, requirements)
+        unchanged = timed(engine, requirements)
+        requirements[0] = dict(requirements[0], priority='Critical')
+        one_changed = timed(engine, requirements)
+
+    print(f"requirements:       {count}")
+    print(f"single note:        {single:.3f}s")
+    print(f"sharded, first run: {first:.3f}s")
+    print(f"sharded, unchanged: {unchanged:.3f}s")
+    print(f"sharded, 1 changed: {one_changed:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,73 @@
+"""Compare per-row note rendering with the compiled note template
+
+Run from the repository root:
+
+    python -m benchmarks.bench_render [rows]
+"""
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.bench_requirement_table import make_raw_rows
+from note_sync import SOURCE_HASH_KEY, attribute_rows, render_attribute_table, source_hash
+from note_template import DEFAULT_TEMPLATE, NoteTemplate
+from requirement_table import build_requirement_table
+
+
+def legacy_content(row_data, creation_date):
+    """The pre-template create_md_content: a list of lines per note"""
+    content = []
+    req_id = str(row_data['A']).strip() if pd.notna(row_data['A']) else "Unknown ID"
+    short_desc = str(row_data['E']).strip() if pd.notna(row_data['E']) else "No Description"
+    content.append(f"# {req_id} - {short_desc}")
+    content.append("")
+    attributes = attribute_rows(row_data)
+    content.extend(render_attribute_table(attributes))
+    content.append("")
+    content.append("---")
+    content.append("")
+    content.append("## Notes")
+    content.append("*Add your additional notes and details here...*")
+    content.append("")
+    content.append("<!-- CREATION_METADATA")
+    content.append(f"created_by: excel_to_obsidian_converter")
+    content.append(f"creation_date: {creation_date}")
+    content.append(f"{SOURCE_HASH_KEY}: {source_hash(attributes)}")
+    content.append("-->")
+    content.append("")
+    return "\n".join(content)
+
+
+def legacy_pass(table, creation_date):
+    return [legacy_content(req._asdict(), creation_date) for req in table.itertuples()]
+
+
+def template_pass(table, creation_date):
+    return NoteTemplate(DEFAULT_TEMPLATE).render_table(table, creation_date)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main(count=50000):
+    table = build_requirement_table(make_raw_rows(count))
+    table = table[table['valid']]
+    creation_date = datetime.now().isoformat()
+
+    legacy, expected = timed(legacy_pass, table, creation_date)
+    compiled, rendered = timed(template_pass, table, creation_date)
+    assert rendered == expected, "compiled template output differs from legacy rendering"
+
+    print(f"notes:       {len(table)}")
+    print(f"legacy:      {legacy:.3f}s")
+    print(f"template:    {compiled:.3f}s")
+    print(f"speedup:     {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
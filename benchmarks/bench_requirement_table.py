@@ -0,0 +1,70 @@
+"""Compare legacy per-row requirement validation with the vectorized table
+
+Run from the repository root:
+
+    python -m benchmarks.bench_requirement_table [rows]
+"""
+import sys
+import time
+import pandas as pd
+
+from excel_reader import COLUMNS
+from requirement_table import build_requirement_table, sanitize_filename
+
+
+def make_raw_rows(count):
+    """Synthetic raw cells shaped like the RTM sheet, with some invalid rows"""
+    records = []
+    for i in range(count):
+        records.append({
+            'A': None if i % 97 == 0 else f"REQ-{i:05d}",
+            'B': f"Category {i % 12}",
+            'C': f"Topic {i % 40}",
+            'E': None if i % 89 == 0 else f"Short description {i}: sync / export",
+            'F': f"Long description for requirement {i} | with pipes\nand newlines",
+            'G': ('High', 'Medium', 'Low')[i % 3],
+        })
+    return pd.DataFrame.from_records(records, columns=COLUMNS).astype(object)
+
+
+def legacy_pass(raw):
+    """The pre-table code path: iterrows filter, then pd.notna/str per cell"""
+    meaningful_rows = []
+    for idx, row in raw.iterrows():
+        if not (pd.isna(row['A']) and pd.isna(row['C']) and pd.isna(row['E']) and pd.isna(row['F'])):
+            meaningful_rows.append((idx, row))
+
+    results = []
+    for idx, row in meaningful_rows:
+        req_id = str(row['A']).strip() if pd.notna(row['A']) and str(row['A']).strip() else ""
+        short_desc = str(row['E']).strip() if pd.notna(row['E']) and str(row['E']).strip() else ""
+        if not req_id or not short_desc:
+            results.append((idx, None))
+            continue
+        results.append((idx, sanitize_filename(f"{req_id}_{short_desc}") + ".md"))
+    return results
+
+
+def table_pass(raw):
+    table = build_requirement_table(raw)
+    return list(zip(table.index, table['filename']))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(count=50000):
+    raw = make_raw_rows(count)
+    legacy = timed(legacy_pass, raw)
+    vectorized = timed(table_pass, raw)
+    print(f"rows:        {count}")
+    print(f"legacy:      {legacy:.3f}s")
+    print(f"vectorized:  {vectorized:.3f}s")
+    print(f"speedup:     {legacy / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,69 @@
+"""Micro-benchmark for filename sanitizing on realistic requirement titles
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sanitize_filename [titles]
+"""
+import random
+import re
+import sys
+import time
+import pandas as pd
+
+from requirement_table import (requirement_filename, requirement_filenames,
+                               sanitize_filename, sanitize_filenames)
+
+
+WORDS = ["Customer", "order", "intake", "Approval", "workflow", "für", "Lieferant",
+         "réception", "des", "marchandises", "año", "fiscal", "仓库", "管理", "Ångström",
+         "e-mail", "PO/SO", "A|B", "<draft>", "Q3:", "\"quoted\"", "what?", "v2.0",
+         "100%", "R&D", "cost*center", "C:\\path", "naïve", "Zürich", "—", "…"]
+
+
+def legacy_sanitize_filename(text):
+    """The original two-re.sub implementation, kept for comparison"""
+    text = re.sub(r'[<>:"/\\|?*]', '_', text)
+    text = re.sub(r'\s+', '_', text)
+    text = text.strip('._')
+    return text[:100]
+
+
+def make_titles(count, seed=42):
+    rng = random.Random(seed)
+    titles = []
+    for i in range(count):
+        words = rng.choices(WORDS, k=rng.randint(3, 14))
+        spacer = rng.choice([" ", "  ", "\t", " \u00a0"])
+        titles.append((f"REQ-{rng.choice(['FIN', 'SCM', 'HR', 'MFG'])}-{i:05d}", spacer.join(words)))
+    return titles
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(count=100000):
+    titles = make_titles(count)
+    ids = pd.Series([req_id for req_id, _ in titles], dtype=object)
+    descs = pd.Series([desc for _, desc in titles], dtype=object)
+
+    legacy_time, legacy = timed(lambda: [legacy_sanitize_filename(f"{i}_{d}") + ".md" for i, d in titles])
+    single_time, single = timed(lambda: [sanitize_filename(f"{i}_{d}") + ".md" for i, d in titles])
+    pandas_time, pandas_ops = timed(lambda: (sanitize_filenames(ids + '_' + descs) + '.md').tolist())
+    requirement_filename.cache_clear()
+    column_cold_time, column = timed(lambda: requirement_filenames(ids, descs).tolist())
+    column_warm_time, _ = timed(lambda: requirement_filenames(ids, descs).tolist())
+
+    assert legacy == single == pandas_ops == column, "implementations disagree"
+
+    print(f"titles:                    {count}")
+    print(f"legacy (2x re.sub):        {legacy_time:.3f}s")
+    print(f"single regex pass:         {single_time:.3f}s  ({legacy_time / single_time:.1f}x)")
+    print(f"pandas str ops on column:  {pandas_time:.3f}s  ({legacy_time / pandas_time:.1f}x)")
+    print(f"memoized column, cold:     {column_cold_time:.3f}s  ({legacy_time / column_cold_time:.1f}x)")
+    print(f"memoized column, warm:     {column_warm_time:.3f}s  ({legacy_time / column_warm_time:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
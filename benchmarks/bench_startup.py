@@ -0,0 +1,106 @@
+"""Startup-time budget check: CLI --help and the GUI's first window
+
+Run from the repository root:
+
+    python -m benchmarks.bench_startup [--runs N] [--cli-budget S] [--window-budget S]
+
+Each measurement starts a fresh interpreter and takes the best of N runs:
+
+- cli_help: python cli.py --help
+- first_window: import main, build the window and draw it once
+  (skipped when there is no display)
+
+Both also verify that pandas and openpyxl were not imported. Exits with
+status 1 when a measurement is over its budget or a heavy library was
+loaded, so it can guard against startup regressions in CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+# Seconds, including interpreter startup
+CLI_HELP_BUDGET = 0.5
+FIRST_WINDOW_BUDGET = 1.0
+
+# Must stay unloaded until an operation reads a workbook
+HEAVY_MODULES = ('pandas', 'openpyxl', 'numpy')
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Child scripts print the heavy modules they ended up importing
+_REPORT = "import sys; print('HEAVY:' + ','.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,)
+
+_CLI_HELP = """
+import cli
+try:
+    cli.build_parser().parse_args(['--help'])
+except SystemExit:
+    pass
+""" + _REPORT
+
+# The background warm-up is turned off: it would load pandas right after
+# the first draw, which is the point of it but not what is measured here
+_FIRST_WINDOW = """
+import tkinter
+import config
+config.PRELOAD_EXCEL_LIBRARIES = False
+try:
+    import main
+    app = main.RequirementsConverter()
+except tkinter.TclError:
+    print('HEAVY:NO_DISPLAY')
+    raise SystemExit
+app.root.update()
+""" + _REPORT + """
+app.root.destroy()
+"""
+
+
+def measure(script, runs):
+    """Best wall time of running script in a fresh interpreter, and the heavy modules it loaded"""
+    best = None
+    loaded = ''
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", script], cwd=REPO_DIR, capture_output=True,
+                                text=True, check=True)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+        loaded = next((line[6:] for line in result.stdout.splitlines() if line.startswith('HEAVY:')), '')
+    return best, loaded
+
+
+def check(name, script, budget, runs):
+    """Print one measurement against its budget; returns False if over budget"""
+    seconds, loaded = measure(script, runs)
+    if loaded == 'NO_DISPLAY':
+        print(f"  {name:<14} skipped (no display)")
+        return True
+    ok = seconds <= budget and not loaded
+    line = f"  {name:<14} {seconds:7.3f}s  (budget {budget:.3f}s)"
+    if loaded:
+        line += f"  imported {loaded}"
+    print(line + ("" if ok else "  OVER BUDGET"))
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement (default: 5)")
+    parser.add_argument("--cli-budget", type=float, default=CLI_HELP_BUDGET,
+                        help=f"seconds allowed for cli.py --help (default: {CLI_HELP_BUDGET})")
+    parser.add_argument("--window-budget", type=float, default=FIRST_WINDOW_BUDGET,
+                        help=f"seconds allowed until the first window (default: {FIRST_WINDOW_BUDGET})")
+    args = parser.parse_args(argv)
+
+    print(f"Startup (best of {args.runs}):")
+    ok = check("cli_help", _CLI_HELP, args.cli_budget, args.runs)
+    ok = check("first_window", _FIRST_WINDOW, args.window_budget, args.runs) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
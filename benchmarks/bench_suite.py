@@ -0,0 +1,186 @@
+"""Stage-by-stage benchmark of the sync pipeline on synthetic data
+
+Run from the repository root (headless, no Tk needed):
+
+    python -m benchmarks.bench_suite [--sizes 1000 10000 100000] [--output FILE] [--compare FILE]
+
+For each size a synthetic RTM workbook is generated (see synthetic.py) and
+every stage is timed on its own:
+
+- excel_load: stream the workbook's rows
+- filename_generation: sanitized note filenames (memo cleared first)
+- row_validation: normalized requirement tables (ID/short description checks)
+- existence_check: one vault snapshot plus the per-table existence masks
+- note_render / note_write: render every note and write it to an empty folder
+- vault_parse: parse every note of a synthetic vault (note cache off)
+- vault_parse_cached: the same scan answered from a warm note cache
+- overview_build: the overview from the parsed notes
+
+Results are printed and saved as JSON; --compare prints each stage's ratio
+to an earlier results file so regressions show up between versions.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import config
+from benchmarks.synthetic import write_rtm, write_vault
+from excel_reader import iter_requirement_rows
+from note_template import NoteTemplate
+from note_writer import write_notes
+from requirement_table import iter_requirement_tables, requirement_filename
+from sync_engine import SyncEngine
+from vault_index import VaultIndex
+
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+STAGES = ('excel_load', 'filename_generation', 'row_validation', 'existence_check', 'note_render',
+          'note_write', 'vault_parse', 'vault_parse_cached', 'overview_build')
+
+
+class StageTimer:
+    """Collects the wall time of named stages"""
+
+    def __init__(self):
+        self.seconds = {}
+
+    def __call__(self, stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.seconds[stage] = round(time.perf_counter() - start, 4)
+        return result
+
+
+def _filenames(rows):
+    requirement_filename.cache_clear()
+    names = []
+    for _, row in rows:
+        req_id = str(row['A']).strip() if row['A'] is not None else ''
+        short_desc = str(row['E']).strip() if row['E'] is not None else ''
+        if req_id and short_desc:
+            names.append(requirement_filename(req_id, short_desc))
+    return names
+
+
+def _existence(vault_dir, tables):
+    vault = VaultIndex.scan(vault_dir)
+    return sum(int((table['valid'] & vault.existing_mask(table['filename'])).sum()) for table in tables)
+
+
+def _render(tables, creation_date):
+    template = NoteTemplate.load(None)
+    notes = []
+    for table in tables:
+        valid = table[table['valid']]
+        notes.extend(zip(valid['filename'], template.render_table(valid, creation_date)))
+    return notes
+
+
+def run_size(rows, workdir):
+    """Time every stage for a synthetic RTM of the given size
+
+    The existence check and vault parse run against a synthetic vault
+    holding every other requirement's note; new notes are written to an
+    empty directory.
+    """
+    timer = StageTimer()
+    excel_file = os.path.join(workdir, f"rtm_{rows}.xlsx")
+    vault_dir = os.path.join(workdir, f"vault_{rows}")
+    new_dir = os.path.join(workdir, f"new_{rows}")
+    os.makedirs(new_dir)
+    write_rtm(excel_file, rows)
+    write_vault(vault_dir, rows, every=2, jobs=config.WRITE_JOBS)
+
+    raw_rows = timer('excel_load', lambda: list(iter_requirement_rows(excel_file)))
+    timer('filename_generation', _filenames, raw_rows)
+    tables = timer('row_validation', lambda: list(iter_requirement_tables(iter(raw_rows))))
+    existing = timer('existence_check', _existence, vault_dir, tables)
+    notes = timer('note_render', _render, tables, datetime.now().isoformat())
+    outcomes = timer('note_write', write_notes,
+                     [(os.path.join(new_dir, filename), content) for filename, content in notes],
+                     config.WRITE_JOBS)
+
+    engine = SyncEngine(excel_file, vault_dir, use_note_cache=False)
+    parsed = timer('vault_parse', engine.get_all_requirement_files)
+    engine.use_note_cache = True
+    engine.get_all_requirement_files()  # fills the cache
+    timer('vault_parse_cached', engine.get_all_requirement_files)
+    overview = timer('overview_build', engine.generate_overview, parsed)
+
+    return {
+        'rows': rows,
+        'counts': {
+            'requirements': sum(len(table) for table in tables),
+            'valid': sum(int(table['valid'].sum()) for table in tables),
+            'existing': existing,
+            'notes_written': sum(1 for outcome in outcomes if outcome is None),
+            'notes_parsed': len(parsed),
+            'overview_shards': len(overview['shard_files']),
+        },
+        'stages': timer.seconds,
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    before = {entry['rows']: entry['stages'] for entry in (baseline or {}).get('results', [])}
+    for entry in results['results']:
+        print(f"\n{entry['rows']} rows")
+        for stage in STAGES:
+            seconds = entry['stages'][stage]
+            line = f"  {stage:<20} {seconds:9.3f}s"
+            old = before.get(entry['rows'], {}).get(stage)
+            if old:
+                line += f"   {seconds / old:5.2f}x vs {baseline.get('revision') or 'baseline'}"
+            print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="synthetic RTM row counts (default: 1000 10000 100000)")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="JSON results file (default: bench_results.json)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {
+        'revision': _git_revision(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'results': [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.sizes:
+            print(f"Benchmarking {rows} rows...", file=sys.stderr)
+            results['results'].append(run_size(rows, workdir))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print_results(results, baseline)
+    print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
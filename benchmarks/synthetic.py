@@ -0,0 +1,92 @@
+"""Synthetic RTM workbooks and vaults for benchmarks
+
+Workbooks use the layout read_excel_requirements expects: five header
+rows, then one requirement per row from row 6 in columns A-G (D unused).
+Vaults hold notes rendered by the note template, exactly as
+create_md_content writes them.
+
+Generate test data by hand from the repository root:
+
+    python -m benchmarks.synthetic RTM.xlsx VAULT_DIR [rows]
+"""
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+from excel_reader import COLUMNS, DATA_START_ROW
+from note_template import NoteTemplate
+from note_writer import write_notes
+from requirement_table import build_requirement_table
+
+
+HEADER = ("Requirement ID", "Category/Functional Activity", "Topic", "Notes",
+          "Short Description", "Description Overview", "Priority")
+
+PRIORITIES = ('High', 'Medium', 'Low')
+
+# Every INVALID_EVERY-th row lacks an ID and every BLANK_EVERY-th row is
+# empty, like the gaps in a real RTM
+INVALID_EVERY = 97
+BLANK_EVERY = 251
+
+
+def synthetic_rows(count):
+    """(A, B, C, D, E, F, G) cell tuples for count sheet rows"""
+    for i in range(count):
+        if i % BLANK_EVERY == BLANK_EVERY - 1:
+            yield (None,) * 7
+            continue
+        yield (None if i % INVALID_EVERY == INVALID_EVERY - 1 else f"REQ-{i:06d}",
+               f"Category {i % 12}",
+               f"Topic {i % 40}",
+               None,
+               f"Short description {i}: sync / export",
+               f"Long description for requirement {i} | with pipes, accents (é) "
+               f"and a second sentence to make it realistic.",
+               PRIORITIES[i % 3])
+
+
+def write_rtm(path, count):
+    """Write a synthetic RTM workbook with count data rows"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Requirements")
+    for i in range(DATA_START_ROW - 2):
+        ws.append([f"Requirements Traceability Matrix ({i + 1})"])
+    ws.append(HEADER)
+    for row in synthetic_rows(count):
+        ws.append(row)
+    wb.save(path)
+
+
+def requirement_table(count):
+    """The normalized requirement table of a synthetic RTM (all valid rows kept)"""
+    records = [dict(zip("ABCDEFG", row)) for row in synthetic_rows(count)]
+    raw = pd.DataFrame.from_records(records, columns=COLUMNS,
+                                    index=pd.RangeIndex(DATA_START_ROW, DATA_START_ROW + count))
+    table = build_requirement_table(raw.astype(object))
+    return table[table['valid']]
+
+
+def write_vault(directory, count, every=1, jobs=8):
+    """Write the notes of a synthetic RTM's rows into directory
+
+    Only every n-th valid row gets a note, so existence checks see a mix
+    of existing and missing notes. Returns the number of notes written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    table = requirement_table(count).iloc[::every]
+    contents = NoteTemplate.load(directory).render_table(table, datetime.now().isoformat())
+    write_notes([(os.path.join(directory, filename), content)
+                 for filename, content in zip(table['filename'], contents)], jobs)
+    return len(table)
+
+
+if __name__ == "__main__":
+    rtm_path, vault_dir = sys.argv[1:3]
+    rows = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    write_rtm(rtm_path, rows)
+    print(f"{rtm_path}: {rows} rows")
+    print(f"{vault_dir}: {write_vault(vault_dir, rows)} notes")
@@ -0,0 +1,168 @@
+"""Headless command-line entry point (no tkinter) for batch/CI runs
+
+    python cli.py check    [--excel FILE] [--vault DIR] [--jobs N] [--json]
+    python cli.py create   [--excel FILE] [--vault DIR] [--jobs N] [--json] [--no-overview] [--dry-run]
+    python cli.py update   [--excel FILE] [--vault DIR] [--jobs N] [--json] [--no-overview] [--dry-run]
+    python cli.py overview [--vault DIR] [--jobs N] [--json]
+    python cli.py watch    [--excel FILE] [--vault DIR] [--jobs N] [--interval S] [--debounce S] [--sync]
+    python cli.py export   [--excel FILE] [--vault DIR] [--jobs N] [--json] [--output DIR] [--format F] [--dry-run]
+    python cli.py search   QUERY [--vault DIR] [--jobs N] [--json] [--limit N] [--raw]
+
+--excel may also name a JSON sources file listing several workbooks/sheets
+(see excel_sources.py).
+
+Every command also accepts --profile cprofile|tracemalloc to run it under
+that profiler; the per-stage timing summary is always logged.
+
+Exit codes: 0 on success, 1 on error, 2 when check finds missing,
+invalid or duplicate requirements. watch runs until interrupted with Ctrl+C.
+"""
+import argparse
+import json
+import logging
+import sys
+
+import config
+from instrumentation import PYTHON_PROFILERS
+from log_sink import get_file_logger
+from requirement_export import EXPORT_FORMATS
+from sync_engine import SyncEngine
+from vault_watch import VaultWatcher
+
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_INCOMPLETE = 2
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Sync requirements from an Excel RTM into an Obsidian vault without the GUI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--vault", default=config.DEFAULT_OBSIDIAN_VAULT,
+                        help="Obsidian vault directory (default: DEFAULT_OBSIDIAN_VAULT)")
+    common.add_argument("--jobs", type=int, default=None,
+                        help="worker count for parsing notes (default: one per CPU)")
+    common.add_argument("--json", action="store_true",
+                        help="print the result as JSON on stdout (log goes to stderr)")
+    common.add_argument("-q", "--quiet", action="store_true",
+                        help="omit per-file lines for notes that need no action")
+    common.add_argument("--log-file", default=config.LOG_FILE,
+                        help="also write the full-detail log to this rotating file")
+    common.add_argument("--profile", choices=PYTHON_PROFILERS, default=config.PYTHON_PROFILER,
+                        help="also run the command under cProfile or tracemalloc and log the top entries")
+
+    excel = argparse.ArgumentParser(add_help=False)
+    excel.add_argument("--excel", default=config.DEFAULT_EXCEL_FILE,
+                       help="requirements Excel file (default: DEFAULT_EXCEL_FILE)")
+
+    subparsers.add_parser("check", parents=[common, excel],
+                          help="report which requirements are missing notes")
+    create = subparsers.add_parser("create", parents=[common, excel],
+                                   help="create notes for missing requirements")
+    update = subparsers.add_parser("update", parents=[common, excel],
+                                   help="rewrite the attribute table of notes whose Excel row changed")
+    for writer in (create, update):
+        writer.add_argument("--no-overview", action="store_true",
+                            help="don't regenerate the overview afterwards")
+        writer.add_argument("--dry-run", action="store_true",
+                            help="report which notes would be written without writing anything")
+    subparsers.add_parser("overview", parents=[common],
+                          help="regenerate the requirements overview note")
+    watch = subparsers.add_parser("watch", parents=[common, excel],
+                                  help="keep the overview current as notes and the workbook change")
+    watch.add_argument("--interval", type=float, default=config.WATCH_INTERVAL,
+                       help="seconds between polls (default: WATCH_INTERVAL)")
+    watch.add_argument("--debounce", type=float, default=config.WATCH_DEBOUNCE,
+                       help="seconds edits must settle before refreshing (default: WATCH_DEBOUNCE)")
+    watch.add_argument("--sync", action="store_true", default=config.WATCH_SYNC_EXCEL,
+                       help="when the workbook is saved, update changed notes and create missing ones")
+    export = subparsers.add_parser("export", parents=[common, excel],
+                                   help="export the requirement index joined with note status")
+    export.add_argument("--output", default=config.EXPORT_DIR or None,
+                        help="directory for the export files (default: EXPORT_DIR, else the vault)")
+    export.add_argument("--format", action="append", choices=EXPORT_FORMATS, dest="formats",
+                        help="export format, repeatable (default: EXPORT_FORMATS)")
+    export.add_argument("--dry-run", action="store_true",
+                        help="report the counts without writing any file")
+    search = subparsers.add_parser("search", parents=[common],
+                                   help="full-text search of the notes, best matches first")
+    search.add_argument("query", help="words to find (each matched as a prefix)")
+    search.add_argument("--limit", type=int, default=config.SEARCH_LIMIT,
+                        help="number of matches listed (default: SEARCH_LIMIT)")
+    search.add_argument("--raw", action="store_true",
+                        help='pass QUERY to SQLite FTS5 as-is (e.g. \'priority:high AND "login page"\')')
+    return parser
+
+
+def run(args):
+    """Run the selected command, returning (result dict, exit code)"""
+    # With --json, stdout carries only the result document
+    stream = sys.stderr if args.json else sys.stdout
+    min_level = logging.INFO if args.quiet else logging.DEBUG
+    file_logger = get_file_logger(args.log_file, config.LOG_FILE_MAX_BYTES, config.LOG_FILE_BACKUPS)
+
+    def log(message, level=logging.INFO):
+        if file_logger:
+            file_logger.log(level, message)
+        if level >= min_level:
+            print(message, file=stream)
+
+    engine = SyncEngine(getattr(args, "excel", ""), args.vault, jobs=args.jobs, log=log,
+                        dry_run=getattr(args, "dry_run", False), python_profiler=args.profile)
+
+    if args.command == "check":
+        result = engine.check_missing_files()
+        incomplete = result['missing'] or result['invalid'] or result['duplicates']
+        return result, EXIT_INCOMPLETE if incomplete else EXIT_OK
+
+    if args.command in ("create", "update"):
+        if args.command == "create":
+            result = engine.create_missing_files()
+            written = result['created']
+        else:
+            result = engine.update_changed_files()
+            written = result['updated']
+        if (config.AUTO_GENERATE_OVERVIEW and written
+                and not args.no_overview and not args.dry_run):
+            engine.log("Auto-generating requirements overview...")
+            result['overview'] = engine.generate_overview()
+        return result, EXIT_OK
+
+    if args.command == "watch":
+        watcher = VaultWatcher(engine, interval=args.interval, debounce=args.debounce,
+                               sync_excel=args.sync)
+        try:
+            return watcher.run(), EXIT_OK
+        except KeyboardInterrupt:
+            engine.log(f"⏹ Stopped watching ({watcher.overviews} overview refreshes)")
+            return {'notes': len(watcher.store), 'overviews': watcher.overviews}, EXIT_OK
+
+    if args.command == "export":
+        return engine.export_requirements(args.output, args.formats), EXIT_OK
+
+    if args.command == "search":
+        return engine.search_requirements(args.query, args.limit, args.raw), EXIT_OK
+
+    return engine.generate_overview(), EXIT_OK
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        result, exit_code = run(args)
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    if args.json:
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
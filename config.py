@@ -0,0 +1,110 @@
+from vault_index import DEFAULT_CASE_INSENSITIVE
+
+
+# =============================================================================
+# CONFIGURATION - Edit these settings as needed
+# =============================================================================
+
+# Default file paths (leave empty to use UI selection)
+DEFAULT_EXCEL_FILE = "C:\\Users\\jdorval\\Desktop\\Requirements Traceability Matrix IFSCloud.xlsx" 
+DEFAULT_OBSIDIAN_VAULT = "C:\\Obsidian\\Hecla\\Work knowledge\\1.Projects\\Project keystone\\Requirements"  
+
+# Auto-generate overview file after creating files
+AUTO_GENERATE_OVERVIEW = True
+
+# Large vaults: above OVERVIEW_SHARD_THRESHOLD requirements the overview note
+# becomes a small index (category and priority summaries) linking to one
+# overview note per category, split every OVERVIEW_SHARD_ROWS rows. Only the
+# notes whose contents changed are rewritten. A threshold of 0 always writes a
+# single note; OVERVIEW_SHARD_ROWS of 0 keeps each category in one note.
+OVERVIEW_SHARD_THRESHOLD = 2000
+OVERVIEW_SHARD_ROWS = 1000
+
+# Add a traceability coverage section to the overview: requirements linked
+# to/from other notes of the vault via [[wikilinks]] (design, test, decision
+# notes...) per category and priority. Links are kept in the requirements
+# folder (.requirements_links.json) and only changed notes are rescanned.
+TRACE_LINKS = True
+
+# Vault folder whose notes are scanned for those links. Empty = the nearest
+# folder above the requirements folder that contains .obsidian (the vault
+# root), or the requirements folder itself if there is none.
+VAULT_ROOT = ""
+
+# Treat note filenames case-insensitively (REQ-1_Foo.md == req-1_foo.md).
+# Defaults to True on Windows/macOS, whose filesystems are case-insensitive.
+CASE_INSENSITIVE_FILENAMES = DEFAULT_CASE_INSENSITIVE
+
+# Cache parsed notes in the vault (.requirements_cache.json) so overview
+# generation only reparses notes that changed since the last run
+USE_NOTE_CACHE = True
+
+# Keep a snapshot of the last parsed workbook so an unchanged workbook isn't
+# reparsed. Snapshots are pickles, so they live in a per-user directory
+# (EXCEL_SNAPSHOT_DIR; empty = the user's cache directory), never the vault.
+USE_EXCEL_SNAPSHOT = True
+EXCEL_SNAPSHOT_DIR = ""
+
+# Keep a full-text search index of the notes in the vault
+# (.requirements_search.sqlite, SQLite FTS5), updated from the same scan as
+# the note cache, and how many ranked matches a search returns
+USE_SEARCH_INDEX = True
+SEARCH_LIMIT = 20
+
+# Import pandas/openpyxl on a background thread once the window is up, so
+# the first Excel operation doesn't wait for them (they are otherwise only
+# loaded when an operation reads a workbook)
+PRELOAD_EXCEL_LIBRARIES = True
+
+# How changed notes are parsed: 'thread' (network/synced drives), 'process'
+# (large local vaults) or 'serial'. SCAN_JOBS = None uses one worker per CPU.
+SCAN_MODE = 'thread'
+SCAN_JOBS = None
+
+# Markdown template for new notes. Leave empty to use 0_Requirement_Template.md
+# from the vault if there is one, else the built-in layout. Placeholders are
+# written {{name}}; see note_template.py for the list.
+NOTE_TEMPLATE_FILE = ""
+
+# Threads used to write new notes (temp file + rename, so an interrupted run
+# never leaves a half-written note). Raise for slow synced/network drives.
+WRITE_JOBS = 8
+
+# Watch mode: how often (seconds) the vault and workbook are polled, and how
+# long edits must settle before the overview is refreshed. With
+# WATCH_SYNC_EXCEL, saving the workbook also updates changed notes and
+# creates missing ones (otherwise it is just checked against the vault).
+WATCH_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.25
+WATCH_SYNC_EXCEL = False
+
+# Requirement index export (cli.py export / Export Index button): target
+# directory (empty = the vault) and formats among 'jsonl', 'csv', 'sqlite'
+EXPORT_DIR = ""
+EXPORT_FORMATS = ('jsonl', 'csv', 'sqlite')
+
+# After each operation, log a per-stage summary (wall time, rows/files,
+# bytes read/written, cache hits/misses) and append it as one JSON line to
+# PROFILE_FILE (relative to the vault; empty disables the file), which is
+# rotated once it exceeds PROFILE_FILE_MAX_BYTES.
+# PYTHON_PROFILER = 'cprofile' or 'tracemalloc' also runs every operation
+# under that profiler (cli.py --profile does it for a single run).
+LOG_PROFILE_SUMMARY = True
+PROFILE_FILE = ".requirements_profile.jsonl"
+PROFILE_FILE_MAX_BYTES = 1024 * 1024
+PYTHON_PROFILER = None
+
+# Show per-file lines for notes that need no action (✓ EXISTS, ⏭ SKIPPED) in
+# the GUI log. Can also be toggled in the window.
+LOG_PER_FILE_DETAILS = True
+
+# The GUI log keeps only the most recent lines
+LOG_MAX_LINES = 5000
+
+# Optional rotating log file receiving every line at full detail (GUI and
+# CLI), e.g. "C:\\Obsidian\\requirements_sync.log". Leave empty to disable.
+LOG_FILE = ""
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+# =============================================================================
@@ -0,0 +1,98 @@
+import os
+
+
+# Requirement data starts on row 6 of the first sheet (rows 1-5 are headers)
+DATA_START_ROW = 6
+
+# Mapped columns and their 0-based positions in the sheet (column D is unused)
+COLUMN_POSITIONS = {'A': 0, 'B': 1, 'C': 2, 'E': 4, 'F': 5, 'G': 6}
+COLUMNS = list(COLUMN_POSITIONS)
+
+# Rows with none of these columns filled are skipped
+KEY_COLUMNS = ('A', 'C', 'E', 'F')
+
+
+def _clean_cell(value):
+    """Normalize empty cells to None (matches pandas' NaN handling of blanks)"""
+    if value is None or value == '':
+        return None
+    return value
+
+
+def _is_meaningful(row):
+    return any(row[col] is not None for col in KEY_COLUMNS)
+
+
+def iter_sheet_rows(rows, start_row, positions=COLUMN_POSITIONS):
+    """Meaningful requirement rows from a sheet's raw value tuples
+
+    rows yields one tuple of cell values per sheet row, starting at
+    start_row; positions maps column letters A-G to 0-based positions in
+    those tuples. Yields (excel_row, row) pairs like iter_requirement_rows.
+    """
+    width = max(positions.values()) + 1
+    for excel_row, values in enumerate(rows, start=start_row):
+        # Short rows are not padded in read-only mode
+        if len(values) < width:
+            values = tuple(values) + (None,) * (width - len(values))
+        row = {col: _clean_cell(values[pos]) for col, pos in positions.items()}
+        if _is_meaningful(row):
+            yield excel_row, row
+
+
+def open_workbook(excel_file):
+    """Open a workbook for streaming reads"""
+    # Imported on first use: openpyxl (and pandas) take a while to load, and
+    # vault-only operations never need them
+    from openpyxl import load_workbook
+
+    # read_only streams the sheet XML instead of building every cell object
+    return load_workbook(excel_file, read_only=True, data_only=True)
+
+
+def worksheet_values(ws, start_row, width, max_row=None):
+    """Raw value tuples of an openpyxl worksheet from start_row on"""
+    # max_col stops openpyxl from materializing wide hidden columns
+    return ws.iter_rows(min_row=start_row, max_row=max_row, max_col=width, values_only=True)
+
+
+def dataframe_values(df, start_row, width):
+    """Raw value tuples of a header-less pandas sheet from start_row on (NaN → None)"""
+    data = df.iloc[start_row - 1:, :width].astype(object)
+    return data.where(data.notna(), None).itertuples(index=False, name=None)
+
+
+def _iter_openpyxl_rows(excel_file, start_row):
+    wb = open_workbook(excel_file)
+    try:
+        width = max(COLUMN_POSITIONS.values()) + 1
+        yield from iter_sheet_rows(worksheet_values(wb.worksheets[0], start_row, width), start_row)
+    finally:
+        wb.close()
+
+
+def _iter_pandas_rows(excel_file, start_row):
+    # Legacy .xls workbooks are not supported by openpyxl
+    import pandas as pd
+
+    df = pd.read_excel(excel_file, header=None)
+    width = max(COLUMN_POSITIONS.values()) + 1
+    yield from iter_sheet_rows(dataframe_values(df, start_row, width), start_row)
+
+
+def preload():
+    """Import the Excel libraries ahead of the first read (e.g. on an idle thread)"""
+    import openpyxl  # noqa: F401
+    import pandas  # noqa: F401
+
+
+def iter_requirement_rows(excel_file, start_row=DATA_START_ROW):
+    """Stream meaningful requirement rows from the first sheet of an Excel file
+
+    Yields (excel_row, row) pairs where excel_row is the 1-based sheet row
+    number and row maps column letters A, B, C, E, F, G to cell values
+    (None for empty cells). Only one row is held in memory at a time.
+    """
+    if os.path.splitext(excel_file)[1].lower() == '.xls':
+        return _iter_pandas_rows(excel_file, start_row)
+    return _iter_openpyxl_rows(excel_file, start_row)
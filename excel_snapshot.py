@@ -0,0 +1,231 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from excel_reader import COLUMNS
+from requirement_table import SOURCE_COLUMN
+
+
+# Snapshots are pickles, which can run code when loaded, so they are kept in
+# a per-user cache directory rather than in the (shared/synced) vault
+SNAPSHOT_DIRNAME = "ExcelObsidianReqSync"
+
+# Where earlier versions kept the snapshot; removed when found
+LEGACY_SNAPSHOT_FILENAME = ".requirements_excel_snapshot.pkl"
+
+# Bump when the snapshot layout or the requirement table columns change
+SNAPSHOT_VERSION = 3
+
+# Requirement table columns worth persisting (callers may add their own)
+TABLE_COLUMNS = COLUMNS + ['req_id', 'short_desc', 'valid', 'error', 'filename', SOURCE_COLUMN]
+
+
+def default_snapshot_dir():
+    """Per-user cache directory for snapshots (LOCALAPPDATA, ~/Library/Caches or XDG_CACHE_HOME)"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, SNAPSHOT_DIRNAME)
+
+
+def snapshot_path(directory, vault_dir, excel_file):
+    """Snapshot file for one workbook synced into one vault"""
+    key = f"{os.path.abspath(vault_dir)}\n{os.path.abspath(excel_file)}"
+    return os.path.join(directory, f"excel_snapshot_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.pkl")
+
+
+def file_sha1(path, block_size=1024 * 1024):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def workbook_fingerprint(excel_file):
+    """Path, size and mtime of a workbook (content hash is added lazily)"""
+    stat = os.stat(excel_file)
+    return {
+        'path': os.path.abspath(excel_file),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha1': None,
+    }
+
+
+def workbook_unchanged(fingerprint):
+    """True if the workbook's size and mtime still match fingerprint"""
+    try:
+        stat = os.stat(fingerprint['path'])
+    except OSError:
+        return False
+    return stat.st_size == fingerprint['size'] and stat.st_mtime_ns == fingerprint['mtime_ns']
+
+
+def row_hashes(table):
+    """Requirement ID → hash of its raw cells, for the valid rows of a table"""
+    import pandas as pd
+
+    valid = table[table['valid']]
+    hashes = pd.util.hash_pandas_object(valid[COLUMNS].astype(str), index=False)
+    return dict(zip(valid['req_id'], hashes.tolist()))
+
+
+class Snapshot:
+    """A saved snapshot, open for reading: its fingerprint, then its chunks in order
+
+    The file is a stream of pickles: a header, then one (table, row hashes)
+    pair per chunk, so it is read (and written) one chunk at a time.
+    """
+
+    def __init__(self, f, fingerprint):
+        self._file = f
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def open(cls, snapshot_path):
+        """The snapshot at snapshot_path, or None if missing, stale or unreadable"""
+        try:
+            f = open(snapshot_path, 'rb')
+        except OSError:
+            return None
+        try:
+            header = pickle.load(f)
+        except Exception:
+            f.close()
+            return None
+        if not isinstance(header, dict) or header.get('version') != SNAPSHOT_VERSION:
+            f.close()
+            return None
+        return cls(f, header['fingerprint'])
+
+    def chunks(self):
+        """(table, row hashes) of each chunk; the file is closed once they are read"""
+        try:
+            while True:
+                try:
+                    yield pickle.load(self._file)
+                except EOFError:
+                    return
+        finally:
+            self.close()
+
+    def row_hashes(self):
+        """Row hashes of the whole snapshot (see row_hashes)"""
+        hashes = {}
+        for _, chunk_hashes in self.chunks():
+            hashes.update(chunk_hashes)
+        return hashes
+
+    def close(self):
+        self._file.close()
+
+
+class SnapshotWriter:
+    """Saves a snapshot chunk by chunk, through a temp file, as the tables stream past
+
+    fingerprint is the workbook's stat from before it was parsed; its hash
+    is taken before parsing too. If the workbook was saved since (e.g.
+    during the parse), commit() discards the snapshot instead of pairing
+    the parsed tables with a newer workbook.
+    """
+
+    def __init__(self, snapshot_path, fingerprint):
+        if fingerprint['sha1'] is None:
+            fingerprint['sha1'] = file_sha1(fingerprint['path'])
+        self.path = snapshot_path
+        self.fingerprint = fingerprint
+        directory, filename = os.path.split(snapshot_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{filename}.", suffix=".tmp")
+        self._file = os.fdopen(fd, 'wb')
+        self._dump({'version': SNAPSHOT_VERSION, 'fingerprint': fingerprint})
+
+    def _dump(self, value):
+        try:
+            pickle.dump(value, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            self.discard()
+            raise
+
+    def add(self, table, hashes):
+        self._dump((table[TABLE_COLUMNS], hashes))
+
+    def commit(self):
+        """Replace the saved snapshot; False (nothing saved) if the workbook changed meanwhile"""
+        self._file.close()
+        if not workbook_unchanged(self.fingerprint):
+            self.discard()
+            return False
+        try:
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+        self._tmp_path = None
+        return True
+
+    def discard(self):
+        """Drop the snapshot being written (a no-op once committed)"""
+        self._file.close()
+        if self._tmp_path:
+            try:
+                os.remove(self._tmp_path)
+            except OSError:
+                pass
+            self._tmp_path = None
+
+
+def snapshot_matches(fingerprint, old):
+    """True if the workbook of fingerprint is unchanged since old was taken
+
+    Path, size and mtime are compared first; if only the mtime moved (file
+    touched or re-saved without edits) the content hash decides, and the
+    fingerprint is updated in place so the caller can refresh the snapshot.
+    """
+    if old['path'] != fingerprint['path'] or old['size'] != fingerprint['size']:
+        return False
+    if old['mtime_ns'] == fingerprint['mtime_ns']:
+        fingerprint['sha1'] = old['sha1']
+        return True
+    fingerprint['sha1'] = file_sha1(fingerprint['path'])
+    return fingerprint['sha1'] == old['sha1']
+
+
+class RequirementDiff:
+    """Row-level diff against the previous snapshot, built one chunk at a time
+
+    changes is {'added', 'removed', 'modified'} lists of requirement IDs.
+    added/modified grow as chunks are added, so they already cover a chunk
+    while it is being processed; removed is only known once finish() has
+    seen every chunk. Without old row hashes every ID counts as added.
+    """
+
+    def __init__(self, old_hashes=None):
+        self._old = old_hashes
+        self._seen = set()
+        self.changes = {'added': [], 'removed': [], 'modified': []}
+
+    def add(self, hashes):
+        for req_id, digest in hashes.items():
+            if req_id in self._seen:
+                continue
+            self._seen.add(req_id)
+            old = self._old.get(req_id) if self._old is not None else None
+            if old is None:
+                self.changes['added'].append(req_id)
+            elif old != digest:
+                self.changes['modified'].append(req_id)
+
+    def finish(self):
+        """Fill in the removed IDs and sort every list"""
+        if self._old is not None:
+            self.changes['removed'] = [req_id for req_id in self._old if req_id not in self._seen]
+        for ids in self.changes.values():
+            ids.sort()
+        return self.changes
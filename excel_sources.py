@@ -0,0 +1,214 @@
+"""Multi-workbook / multi-sheet requirement sources
+
+Instead of a single workbook, the Excel file setting can point at a JSON
+sources file listing several RTMs (one per workstream, say):
+
+    [
+        {"path": "Finance RTM.xlsx"},
+        {"path": "workstreams/*.xlsx", "sheets": ["Req*"], "header_row": 3,
+         "columns": {"A": "Req ID", "E": "Title", "F": "D", "G": "Priority"}}
+    ]
+
+- path: workbook path or glob, relative to the sources file
+- sheets: sheet name globs (default: the first sheet only)
+- header_row: row holding the column headers; data starts on the next row
+  (default 5, as in the standard RTM layout)
+- columns: requirement column (A, B, C, E, F, G) → sheet column, given as a
+  column letter or as header text from header_row. Unlisted requirement
+  columns keep their standard position.
+
+Each workbook is parsed in its own worker process (openpyxl parsing is
+CPU-bound), so several workbooks take about as long as the slowest one.
+"""
+import fnmatch
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+
+from excel_reader import (COLUMN_POSITIONS, COLUMNS, DATA_START_ROW, dataframe_values,
+                          iter_sheet_rows, open_workbook, worksheet_values)
+
+
+SOURCES_EXTENSION = '.json'
+
+DEFAULT_HEADER_ROW = DATA_START_ROW - 1
+
+# Excel's lock files for open workbooks (~$Name.xlsx) are never sources
+_LOCK_FILE_PREFIX = '~$'
+
+_COLUMN_LETTERS_RE = re.compile(r'^[A-Za-z]{1,3}$')
+
+
+def is_sources_file(path):
+    """True if path names a sources file rather than a workbook"""
+    return bool(path) and os.path.splitext(path)[1].lower() == SOURCES_EXTENSION
+
+
+def load_sources(path):
+    """Parse and validate a sources file into a list of source dicts
+
+    Raises ValueError with the offending entry for malformed sources.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            sources = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"Invalid sources file {path}: {e}")
+    if isinstance(sources, dict):
+        sources = [sources]
+    if not isinstance(sources, list) or not sources:
+        raise ValueError(f"Sources file {path} must list at least one source")
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    normalized = []
+    for i, source in enumerate(sources, start=1):
+        if isinstance(source, str):
+            source = {'path': source}
+        if not isinstance(source, dict) or not source.get('path'):
+            raise ValueError(f"Source {i} in {path} has no 'path'")
+        columns = source.get('columns') or {}
+        unknown = [col for col in columns if col not in COLUMN_POSITIONS]
+        if unknown:
+            raise ValueError(f"Source {i} in {path} maps unknown columns {unknown} "
+                             f"(expected some of {', '.join(COLUMNS)})")
+        sheets = source.get('sheets') or []
+        normalized.append({
+            'path': os.path.join(base_dir, source['path']),
+            'sheets': [sheets] if isinstance(sheets, str) else list(sheets),
+            'header_row': int(source.get('header_row', DEFAULT_HEADER_ROW)),
+            'columns': dict(columns),
+        })
+    return normalized
+
+
+def expand_sources(sources):
+    """One unit of work per matching workbook: (workbook path, source dict)
+
+    Raises ValueError if a source matches no workbook.
+    """
+    units = []
+    for source in sources:
+        paths = sorted(p for p in glob.glob(source['path'])
+                       if not os.path.basename(p).startswith(_LOCK_FILE_PREFIX))
+        if not paths:
+            raise ValueError(f"No workbook matches '{source['path']}'")
+        units.extend((path, source) for path in paths)
+    return units
+
+
+def resolve_columns(columns, header, sheet):
+    """0-based positions for each requirement column of a source
+
+    columns maps requirement columns to sheet column letters or header
+    text; header is the header row's values (None when there is none).
+    """
+    from openpyxl.utils import column_index_from_string
+
+    positions = dict(COLUMN_POSITIONS)
+    lookup = None
+    for col, ref in columns.items():
+        ref = str(ref).strip()
+        if _COLUMN_LETTERS_RE.match(ref):
+            positions[col] = column_index_from_string(ref.upper()) - 1
+            continue
+        if lookup is None:
+            lookup = {str(value).strip().casefold(): pos for pos, value in enumerate(header or ())
+                      if value is not None}
+        if ref.casefold() not in lookup:
+            raise ValueError(f"sheet '{sheet}' has no column headed '{ref}' in its header row")
+        positions[col] = lookup[ref.casefold()]
+    return positions
+
+
+def _matching_sheets(sheet_names, patterns):
+    if not patterns:
+        return sheet_names[:1]
+    return [name for name in sheet_names
+            if any(fnmatch.fnmatchcase(name.casefold(), pattern.casefold()) for pattern in patterns)]
+
+
+def _needs_header(columns):
+    return any(not _COLUMN_LETTERS_RE.match(str(ref).strip()) for ref in columns.values())
+
+
+def read_workbook_source(unit):
+    """Parse every selected sheet of one workbook (runs in a worker process)
+
+    Returns a list of (source label, [(excel_row, row), ...]) per sheet.
+    """
+    path, source = unit
+    header_row = source['header_row']
+    start_row = header_row + 1
+    if os.path.splitext(path)[1].lower() == '.xls':
+        return _read_xls_source(path, source, header_row, start_row)
+
+    wb = open_workbook(path)
+    try:
+        sheets = []
+        for name in _matching_sheets(wb.sheetnames, source['sheets']):
+            label = f"{os.path.basename(path)}:{name}"
+            ws = wb[name]
+            header = None
+            if header_row > 0 and _needs_header(source['columns']):
+                header = next(ws.iter_rows(min_row=header_row, max_row=header_row,
+                                           values_only=True), ())
+            positions = resolve_columns(source['columns'], header, name)
+            width = max(positions.values()) + 1
+            rows = iter_sheet_rows(worksheet_values(ws, start_row, width), start_row, positions)
+            sheets.append((label, list(rows)))
+        return sheets
+    finally:
+        wb.close()
+
+
+def _read_xls_source(path, source, header_row, start_row):
+    # Legacy .xls workbooks are not supported by openpyxl
+    import pandas as pd
+
+    sheets = []
+    with pd.ExcelFile(path) as xls:
+        for name in _matching_sheets(xls.sheet_names, source['sheets']):
+            label = f"{os.path.basename(path)}:{name}"
+            df = xls.parse(name, header=None)
+            header = None
+            if header_row > 0 and len(df) >= header_row:
+                header = [None if pd.isna(value) else value for value in df.iloc[header_row - 1]]
+            positions = resolve_columns(source['columns'], header, name)
+            width = max(positions.values()) + 1
+            rows = iter_sheet_rows(dataframe_values(df, start_row, width), start_row, positions)
+            sheets.append((label, list(rows)))
+    return sheets
+
+
+def _safe_read(unit):
+    try:
+        return read_workbook_source(unit)
+    except Exception as e:
+        raise ValueError(f"{os.path.basename(unit[0])}: {e}") from None
+
+
+def iter_source_rows(sources, jobs=None):
+    """Stream (excel_row, row) pairs from every source, in source order
+
+    Each row also carries its 'source' label (workbook:sheet). Workbooks
+    are parsed on a process pool when there is more than one.
+    """
+    units = expand_sources(sources)
+    jobs = min(len(units), jobs or os.cpu_count() or 1)
+    if jobs <= 1:
+        results = map(_safe_read, units)
+        yield from _label_rows(results)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from _label_rows(pool.map(_safe_read, units))
+
+
+def _label_rows(results):
+    for sheets in results:
+        for label, rows in sheets:
+            for excel_row, row in rows:
+                row['source'] = label
+                yield excel_row, row
@@ -0,0 +1,206 @@
+"""Per-stage timings and counters of engine operations
+
+Each operation (check, create, update, overview, export) records its
+stages in a RunProfile: wall time plus rows/files processed, bytes read
+and written and cache hits/misses. Time spent in the log callback is
+tracked separately, since GUI log pumping can dominate a slow run. The
+profile is logged as a summary block and appended as one JSON line to the
+profile file.
+
+For deeper digging, an operation can also run under cProfile (stats
+saved as a .prof file and the top functions logged) or tracemalloc (peak
+memory and the top allocation sites logged).
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+COUNTERS = ('rows', 'files', 'bytes_read', 'bytes_written', 'cache_hits', 'cache_misses')
+
+# Summary wording of the counters (singular, plural)
+_COUNTER_LABELS = {
+    'rows': ('row', 'rows'),
+    'files': ('file', 'files'),
+    'cache_hits': ('cache hit', 'cache hits'),
+    'cache_misses': ('cache miss', 'cache misses'),
+}
+
+PYTHON_PROFILERS = ('cprofile', 'tracemalloc')
+
+# Functions / allocation sites listed by the Python profilers
+TOP_ENTRIES = 15
+
+
+def format_bytes(count):
+    for unit in ('B', 'KB', 'MB'):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+class Stage:
+    """Wall time and counters of one stage (may be entered several times)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.counters = {}
+
+    def add(self, **counters):
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def describe(self):
+        parts = []
+        for key in COUNTERS:
+            value = self.counters.get(key)
+            if not value:
+                continue
+            if key.startswith('bytes_'):
+                parts.append(f"{format_bytes(value)} {key[6:]}")
+            else:
+                singular, plural = _COUNTER_LABELS[key]
+                parts.append(f"{value} {singular if value == 1 else plural}")
+        return ", ".join(parts)
+
+
+class RunProfile:
+    """The stages of one engine operation, in the order they first ran"""
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.started = datetime.now()
+        self.seconds = None
+        self.stages = {}
+        self.log_seconds = 0.0
+        self.log_lines = 0
+        self._start = time.perf_counter()
+
+    def get(self, name):
+        if name not in self.stages:
+            self.stages[name] = Stage(name)
+        return self.stages[name]
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block as (part of) stage name; yields the Stage for counters"""
+        stage = self.get(name)
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds += time.perf_counter() - start
+
+    def timed(self, name, iterable):
+        """Yield from iterable, charging the time spent producing each item to stage name
+
+        For lazy streams (Excel rows, requirement tables) whose work is
+        interleaved with the consumer's.
+        """
+        stage = self.get(name)
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stage.seconds += time.perf_counter() - start
+                return
+            stage.seconds += time.perf_counter() - start
+            yield item
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._start
+
+    def to_dict(self):
+        return {
+            'operation': self.operation,
+            'started': self.started.isoformat(timespec='seconds'),
+            'seconds': round(self.seconds or 0.0, 4),
+            'stages': {name: dict(stage.counters, seconds=round(stage.seconds, 4))
+                       for name, stage in self.stages.items()},
+            'logging': {'seconds': round(self.log_seconds, 4), 'lines': self.log_lines},
+        }
+
+    def summary_lines(self):
+        lines = [f"⏱ PROFILE: {self.operation} ({self.seconds:.3f}s total)"]
+        for stage in self.stages.values():
+            lines.append(f"  {stage.name:<18} {stage.seconds:8.3f}s  {stage.describe()}".rstrip())
+        lines.append(f"  {'logging':<18} {self.log_seconds:8.3f}s  "
+                     f"{self.log_lines} lines (included above)")
+        return lines
+
+    def save(self, path, max_bytes=None):
+        """Append the profile as one JSON line to path
+
+        Once path exceeds max_bytes it is moved to path + '.1' (replacing
+        the previous one) and a new file is started.
+        """
+        if max_bytes and os.path.exists(path) and os.path.getsize(path) > max_bytes:
+            os.replace(path, path + ".1")
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.to_dict(), ensure_ascii=False) + "\n")
+
+
+@contextmanager
+def python_profiler(kind, stats_path, log):
+    """Run the block under cProfile or tracemalloc (kind None: not at all)
+
+    cProfile stats are saved to stats_path (None: not saved); the top
+    entries of either profiler are passed to log line by line.
+    """
+    if not kind:
+        yield
+        return
+    if kind not in PYTHON_PROFILERS:
+        raise ValueError(f"Unknown profiler '{kind}' (expected one of {', '.join(PYTHON_PROFILERS)})")
+
+    # Imported here so plain runs don't pay for loading the profilers
+    if kind == 'cprofile':
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(TOP_ENTRIES)
+            log("🔬 cProfile (top functions by cumulative time):")
+            for line in stream.getvalue().splitlines():
+                if line.strip():
+                    log(f"  {line.rstrip()}")
+            if stats_path:
+                profiler.dump_stats(stats_path)
+                log(f"🔬 cProfile stats saved to {stats_path}")
+        return
+
+    import tracemalloc
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+        log(f"🔬 tracemalloc: peak {format_bytes(peak)}, {format_bytes(current)} still allocated")
+        for entry in snapshot.statistics('lineno')[:TOP_ENTRIES]:
+            log(f"  {entry}")
+
+
+def written_counts(notes, outcomes):
+    """files / bytes_written counters for (name, content) pairs and their write outcomes"""
+    written = [content for (_, content), outcome in zip(notes, outcomes) if outcome is None]
+    return {'files': len(written), 'bytes_written': sum(len(content.encode('utf-8')) for content in written)}
@@ -0,0 +1,172 @@
+"""Traceability graph of the vault's [[wikilinks]]
+
+Every markdown note under the vault root (subfolders included) is scanned
+for wikilinks. The requirement notes usually sit in a subfolder of the
+vault, so the root is the nearest folder above them that holds Obsidian's
+.obsidian folder, unless configured. The outgoing links of each note are
+kept in a sidecar in the requirements folder with the note's mtime/size,
+so a rescan only rereads the notes that changed.
+
+A requirement note counts as linked (has downstream coverage) when it links
+to a design/test/decision note or such a note links to it. Links between
+requirement notes don't count, and the notes this tool generates (0_
+overview, shard and template notes) are not scanned at all.
+"""
+import os
+import re
+
+from sidecar import load_sidecar, save_sidecar
+
+
+GRAPH_FILENAME = ".requirements_links.json"
+
+# Bump when the shape of the sidecar (or how links are extracted) changes
+GRAPH_VERSION = 2
+
+# Obsidian's settings folder, which marks the root of a vault
+OBSIDIAN_DIR = ".obsidian"
+
+# Prefix of the notes this tool generates (overview, shards, template)
+GENERATED_PREFIX = "0_"
+
+# [[Target]], [[Target|alias]], [[Target#Heading]], [[folder/Target^block]], ![[embed]]
+_WIKILINK_RE = re.compile(r"\[\[([^\[\]|#^]*)[^\[\]]*\]\]")
+
+
+def link_key(name):
+    """How Obsidian resolves a link target or note name: by file name, case-insensitively"""
+    name = name.strip().replace('\\', '/').rsplit('/', 1)[-1]
+    if name.lower().endswith('.md'):
+        name = name[:-3]
+    return name.casefold()
+
+
+def extract_links(text):
+    """Sorted distinct link keys of the [[wikilinks]] in a note"""
+    return sorted({key for key in map(link_key, _WIKILINK_RE.findall(text)) if key})
+
+
+def find_vault_root(notes_dir):
+    """Nearest folder at or above notes_dir that holds an .obsidian folder, else notes_dir"""
+    directory = os.path.abspath(notes_dir)
+    while not os.path.isdir(os.path.join(directory, OBSIDIAN_DIR)):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return notes_dir
+        directory = parent
+    return directory
+
+
+def iter_vault_notes(vault_dir):
+    """(relative path, stat) of every markdown note, skipping hidden folders and 0_ notes"""
+    for root, dirs, files in os.walk(vault_dir):
+        # .obsidian, .trash, .git ...
+        dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+        relative_root = os.path.relpath(root, vault_dir).replace(os.sep, '/')
+        for name in sorted(files):
+            if not name.endswith('.md') or name.startswith(GENERATED_PREFIX):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield (name if relative_root == '.' else f"{relative_root}/{name}"), stat
+
+
+class LinkGraph:
+    """Outgoing wikilinks of every note under vault_dir, kept up to date by mtime/size
+
+    The sidecar is kept in sidecar_dir (the requirements folder).
+    """
+
+    def __init__(self, vault_dir, sidecar_dir, entries=None):
+        self.vault_dir = vault_dir
+        self.sidecar_dir = sidecar_dir
+        # path relative to vault_dir → [mtime_ns, size, [link keys]]
+        self._entries = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, vault_dir, sidecar_dir):
+        """Load the graph sidecar (empty if there is no usable one or it was built for another root)"""
+        data = load_sidecar(sidecar_dir, GRAPH_FILENAME, GRAPH_VERSION, 'graph')
+        if data.get('root') != cls._root_key(vault_dir, sidecar_dir):
+            return cls(vault_dir, sidecar_dir)
+        return cls(vault_dir, sidecar_dir, data.get('files'))
+
+    @staticmethod
+    def _root_key(vault_dir, sidecar_dir):
+        # Relative, so the graph survives the vault moving
+        return os.path.relpath(vault_dir, sidecar_dir).replace(os.sep, '/')
+
+    def __len__(self):
+        return len(self._entries)
+
+    def update(self, paths=None):
+        """Rescan the vault, rereading only notes whose mtime/size changed
+
+        Notes that disappeared are dropped. With paths (relative to the vault
+        root, see note_paths) only those notes are looked at instead of the
+        whole vault. Returns (parsed, removed) counts.
+        """
+        notes = iter_vault_notes(self.vault_dir) if paths is None else self._stat_notes(paths)
+        seen = set()
+        parsed = 0
+        for path, stat in notes:
+            seen.add(path)
+            entry = self._entries.get(path)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                continue
+            try:
+                with open(os.path.join(self.vault_dir, path), 'r', encoding='utf-8', errors='replace') as f:
+                    links = extract_links(f.read())
+            except OSError:
+                continue
+            self._entries[path] = [stat.st_mtime_ns, stat.st_size, links]
+            parsed += 1
+        removed = [path for path in (self._entries if paths is None else paths)
+                   if path in self._entries and path not in seen]
+        for path in removed:
+            del self._entries[path]
+        if parsed or removed:
+            self._dirty = True
+        return parsed, len(removed)
+
+    def _stat_notes(self, paths):
+        for path in paths:
+            try:
+                yield path, os.stat(os.path.join(self.vault_dir, path))
+            except OSError:
+                continue
+
+    def note_paths(self, notes_dir, filenames):
+        """Paths relative to the vault root of filenames in notes_dir"""
+        prefix = os.path.relpath(notes_dir, self.vault_dir).replace(os.sep, '/')
+        return [filename if prefix == '.' else f"{prefix}/{filename}" for filename in filenames]
+
+    def linked(self, notes_dir, requirement_filenames):
+        """Whether each requirement note (a filename in notes_dir) has downstream coverage"""
+        paths = set(self.note_paths(notes_dir, requirement_filenames))
+        requirements = {link_key(filename) for filename in requirement_filenames}
+
+        def is_requirement(path):
+            return path in paths
+
+        documents = {link_key(path) for path in self._entries if not is_requirement(path)}
+        covered = set()
+        for path, (_, _, links) in self._entries.items():
+            if is_requirement(path):
+                if any(key in documents for key in links):
+                    covered.add(link_key(path))
+            else:
+                covered.update(key for key in links if key in requirements)
+        return [link_key(filename) in covered for filename in requirement_filenames]
+
+    def save(self):
+        """Write the sidecar if anything changed"""
+        if not self._dirty:
+            return
+        save_sidecar(self.sidecar_dir, GRAPH_FILENAME, GRAPH_VERSION, 'graph',
+                     {'root': self._root_key(self.vault_dir, self.sidecar_dir), 'files': self._entries})
+        self._dirty = False
@@ -0,0 +1,25 @@
+import logging
+from logging.handlers import RotatingFileHandler
+
+
+LOGGER_NAME = "requirements_sync"
+
+
+def get_file_logger(path, max_bytes, backups):
+    """Logger writing every line to a rotating log file, or None if path is empty
+
+    Handlers are attached once per process, so repeated calls (one per
+    operation) reuse the same file.
+    """
+    if not path:
+        return None
+    logger = logging.getLogger(LOGGER_NAME)
+    if not logger.handlers:
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                      encoding='utf-8')
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-5s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        # Keep the sync log out of any root handlers
+        logger.propagate = False
+    return logger
@@ -1,36 +1,71 @@
-import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
+import logging
 import os
+import queue
+import threading
 from datetime import datetime
-import re
 
+from config import (AUTO_GENERATE_OVERVIEW, DEFAULT_EXCEL_FILE, DEFAULT_OBSIDIAN_VAULT,
+                    LOG_FILE, LOG_FILE_BACKUPS, LOG_FILE_MAX_BYTES, LOG_MAX_LINES,
+                    LOG_PER_FILE_DETAILS, PRELOAD_EXCEL_LIBRARIES)
+from excel_reader import preload as preload_excel_libraries
+from log_sink import get_file_logger
+from sync_engine import OVERVIEW_FILENAME, OperationCancelled, SyncEngine
+from vault_watch import VaultWatcher
 
-# =============================================================================
-# CONFIGURATION - Edit these settings as needed
-# =============================================================================
 
-# Default file paths (leave empty to use UI selection)
-DEFAULT_EXCEL_FILE = "C:\\Users\\jdorval\\Desktop\\Requirements Traceability Matrix IFSCloud.xlsx" 
-DEFAULT_OBSIDIAN_VAULT = "C:\\Obsidian\\Hecla\\Work knowledge\\1.Projects\\Project keystone\\Requirements"  
+# How often (ms) the Tk main loop drains queued log lines and worker progress
+LOG_POLL_MS = 50
 
-# Auto-generate overview file after creating files
-AUTO_GENERATE_OVERVIEW = True
+# Let the log view overshoot LOG_MAX_LINES by this much before trimming, so old
+# lines are deleted in bulk rather than one per insert
+LOG_TRIM_SLACK = max(LOG_MAX_LINES // 10, 1)
 
-# =============================================================================
 
 class RequirementsConverter:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Requirements to Obsidian MD Converter")
-        self.root.geometry("600x500")
+        self.root.geometry("920x600")
         
         # Variables - Initialize with default values from config
         self.excel_file = tk.StringVar(value=DEFAULT_EXCEL_FILE)
         self.output_dir = tk.StringVar(value=DEFAULT_OBSIDIAN_VAULT)
         self.status_text = tk.StringVar(value="Ready to create files from Excel...")
         
+        # Log verbosity, mirrored into a plain attribute the worker thread can read
+        self.dry_run = tk.BooleanVar(value=False)
+        self.search_query = tk.StringVar()
+        self.show_details = tk.BooleanVar(value=LOG_PER_FILE_DETAILS)
+        self.log_min_level = logging.DEBUG if LOG_PER_FILE_DETAILS else logging.INFO
+        self.show_details.trace_add("write", self.update_log_level)
+        
+        # Full-detail log file, written directly (never through Tk)
+        try:
+            self.file_logger = get_file_logger(LOG_FILE, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS)
+            file_log_error = None
+        except OSError as e:
+            self.file_logger = None
+            file_log_error = e
+        
+        # Worker thread state. The worker never touches Tk directly: log lines
+        # and UI callbacks are queued and drained by poll_queues on the main loop.
+        self.log_queue = queue.Queue()
+        self.ui_queue = queue.Queue()
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.progress_state = (0, None)
+        
         self.setup_gui()
+        if file_log_error:
+            self.log(f"⚠ Could not open log file {LOG_FILE}: {file_log_error}")
+        
+        # The window is up before pandas/openpyxl are loaded; warm them up
+        # while the user is still picking files
+        if PRELOAD_EXCEL_LIBRARIES:
+            self.root.after_idle(self.preload_excel_libraries)
+        self.root.after(LOG_POLL_MS, self.poll_queues)
         
     def setup_gui(self):
         # Main frame
@@ -43,7 +78,7 @@ class RequirementsConverter:
         title_label.grid(row=0, column=0, columnspan=3, pady=(0, 10))
         
         # Subtitle
-        subtitle = ttk.Label(main_frame, text="Creates missing requirement files - updates done manually", 
+        subtitle = ttk.Label(main_frame, text="Creates missing requirement files and updates changed attributes", 
                             font=('Arial', 10), foreground="gray")
         subtitle.grid(row=1, column=0, columnspan=3, pady=(0, 20))
         
@@ -79,19 +114,68 @@ Note: Both Column A and E are required to create files."""
         button_frame.grid(row=5, column=0, columnspan=3, pady=15)
         
         # Check what's missing button
-        ttk.Button(button_frame, text="Check Missing Files", 
-                  command=self.check_missing_files,
-                  style='TButton').grid(row=0, column=0, padx=5)
+        check_button = ttk.Button(button_frame, text="Check Missing Files", 
+                                 command=self.check_missing_files,
+                                 style='TButton')
+        check_button.grid(row=0, column=0, padx=5)
         
         # Create missing files button
-        ttk.Button(button_frame, text="Create Missing Files", 
-                  command=self.create_missing_files,
-                  style='Accent.TButton').grid(row=0, column=1, padx=5)
+        create_button = ttk.Button(button_frame, text="Create Missing Files", 
+                                  command=self.create_missing_files,
+                                  style='Accent.TButton')
+        create_button.grid(row=0, column=1, padx=5)
+        
+        # Update changed notes button
+        update_button = ttk.Button(button_frame, text="Update Changed Notes", 
+                                  command=self.update_changed_files,
+                                  style='TButton')
+        update_button.grid(row=0, column=2, padx=5)
         
         # Overview generation button
-        ttk.Button(button_frame, text="Generate Overview", 
-                  command=self.generate_overview_only,
-                  style='TButton').grid(row=0, column=2, padx=5)
+        overview_button = ttk.Button(button_frame, text="Generate Overview", 
+                                    command=self.generate_overview_only,
+                                    style='TButton')
+        overview_button.grid(row=0, column=3, padx=5)
+        
+        # Watch button: keeps the overview live until cancelled
+        watch_button = ttk.Button(button_frame, text="Watch Vault", 
+                                 command=self.watch_vault,
+                                 style='TButton')
+        watch_button.grid(row=0, column=4, padx=5)
+        
+        # Export button: requirement index as JSON Lines / CSV / SQLite
+        export_button = ttk.Button(button_frame, text="Export Index", 
+                                  command=self.export_requirements,
+                                  style='TButton')
+        export_button.grid(row=0, column=5, padx=5)
+        
+        # Cancel button (only enabled while an operation is running)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", 
+                                       command=self.cancel_operation,
+                                       state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=6, padx=5)
+        
+        # Dry run: report what create/update would write without writing
+        ttk.Checkbutton(button_frame, text="Dry run (don't write files)", 
+                       variable=self.dry_run).grid(row=1, column=1, columnspan=2, pady=(5, 0))
+        
+        # Full-text search of the notes (Enter or the Search button)
+        search_frame = ttk.Frame(button_frame)
+        search_frame.grid(row=2, column=0, columnspan=7, pady=(10, 0))
+        ttk.Label(search_frame, text="Search notes:").grid(row=0, column=0, padx=5)
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_query, width=50)
+        search_entry.grid(row=0, column=1, padx=5)
+        search_entry.bind("<Return>", lambda event: self.search_requirements())
+        search_button = ttk.Button(search_frame, text="Search", 
+                                  command=self.search_requirements,
+                                  style='TButton')
+        search_button.grid(row=0, column=2, padx=5)
+        self.action_buttons = [check_button, create_button, update_button, overview_button,
+                               watch_button, export_button, search_button]
+        
+        # Progress bar (indeterminate while the total isn't known yet)
+        self.progress_bar = ttk.Progressbar(main_frame, orient="horizontal", mode="determinate")
+        self.progress_bar.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # Status
         ttk.Label(main_frame, text="Status:").grid(row=6, column=0, sticky=tk.W, pady=(10, 0))
@@ -101,6 +185,8 @@ Note: Both Column A and E are required to create files."""
         
         # Log text area
         ttk.Label(main_frame, text="Log:").grid(row=7, column=0, sticky=(tk.W, tk.N), pady=(10, 0))
+        ttk.Checkbutton(main_frame, text="Show per-file details", 
+                       variable=self.show_details).grid(row=7, column=1, columnspan=2, sticky=tk.E, pady=(10, 0))
         
         log_frame = ttk.Frame(main_frame)
         log_frame.grid(row=8, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
@@ -129,7 +215,8 @@ Note: Both Column A and E are required to create files."""
     def browse_excel_file(self):
         filename = filedialog.askopenfilename(
             title="Select Excel File",
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=[("Excel files", "*.xlsx *.xls"), ("Sources files", "*.json"),
+                       ("All files", "*.*")]
         )
         if filename:
             self.excel_file.set(filename)
@@ -139,113 +226,133 @@ Note: Both Column A and E are required to create files."""
         if dirname:
             self.output_dir.set(dirname)
             
-    def log(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
-        
-    def sanitize_filename(self, text):
-        """Convert text to a safe filename"""
-        # Remove or replace invalid characters
-        text = re.sub(r'[<>:"/\\|?*]', '_', text)
-        text = re.sub(r'\s+', '_', text)  # Replace spaces with underscores
-        text = text.strip('._')  # Remove leading/trailing dots and underscores
-        return text[:100]  # Limit length
-        
-    def generate_filename(self, row):
-        """Generate filename from Excel row data - requires both ID and short description"""
-        req_id = str(row['A']).strip() if pd.notna(row['A']) and str(row['A']).strip() else ""
-        short_desc = str(row['E']).strip() if pd.notna(row['E']) and str(row['E']).strip() else ""
-        
-        # Only create filename if both ID and short description are available
-        if not req_id:
-            raise ValueError("Missing Requirement ID (Column A)")
-        
-        if not short_desc:
-            raise ValueError("Missing Short Description (Column E)")
-        
-        # Combine ID and short description for filename
-        filename_base = f"{req_id}_{short_desc}"
-        filename_base = self.sanitize_filename(filename_base)
-        return f"{filename_base}.md"
-        
-    def create_md_content(self, row_data):
-        """Create markdown content from row data"""
-        content = []
-        
-        # Create title from Requirement ID and Short Description
-        req_id = str(row_data['A']).strip() if pd.notna(row_data['A']) else "Unknown ID"
-        short_desc = str(row_data['E']).strip() if pd.notna(row_data['E']) else "No Description"
-        
-        content.append(f"# {req_id} - {short_desc}")
-        content.append("")
-        
-        # Create a clean table with the requirement data
-        content.append("| Attribute | Value |")
-        content.append("|-----------|-------|")
-        
-        # Map columns to meaningful names
-        column_names = {
-            'A': 'Requirement ID',
-            'B': 'Category/Functional Activity',
-            'C': 'Topic', 
-            'E': 'Short Description',
-            'F': 'Description Overview',
-            'G': 'Priority'
-        }
-        
-        columns = ['A', 'B', 'C', 'E', 'F', 'G']
-        for col in columns:
-            if col in row_data and pd.notna(row_data[col]):
-                field_name = column_names.get(col, f'Column {col}')
-                # Escape pipe characters in values and clean up text
-                value = str(row_data[col]).replace('|', '\\|').replace('\n', ' ').strip()
-                content.append(f"| **{field_name}** | {value} |")
-        
-        content.append("")
-        content.append("---")
-        content.append("")
-        content.append("## Notes")
-        content.append("*Add your additional notes and details here...*")
-        content.append("")
-        
-        # Add creation metadata
-        content.append("<!-- CREATION_METADATA")
-        content.append(f"created_by: excel_to_obsidian_converter")
-        content.append(f"creation_date: {datetime.now().isoformat()}")
-        content.append("-->")
-        content.append("")
-        
-        return "\n".join(content)
-        
-    def read_excel_requirements(self):
-        """Read and parse Excel file requirements"""
+    def log(self, message, level=logging.INFO):
+        """Queue a log line (safe to call from the worker thread)
+
+        Every line goes to the log file; per-file detail lines only reach the
+        window when "Show per-file details" is ticked.
+        """
+        if self.file_logger:
+            self.file_logger.log(level, message)
+        if level >= self.log_min_level:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.log_queue.put(f"[{timestamp}] {message}\n")
+        
+    def update_log_level(self, *_args):
+        self.log_min_level = logging.DEBUG if self.show_details.get() else logging.INFO
+        
+    def poll_queues(self):
+        """Drain queued log lines in one bulk insert and apply worker updates"""
+        lines = []
         try:
-            # Read Excel file
-            df = pd.read_excel(self.excel_file.get(), header=None)
-            
-            # Extract data from row 6 onward (index 5), columns A, B, C, E, F, G
-            columns = ['A', 'B', 'C', 'E', 'F', 'G']
-            col_indices = [0, 1, 2, 4, 5, 6]  # A=0, B=1, C=2, E=4, F=5, G=6 (0-indexed)
-            
-            # Get data from row 6 onward
-            data_rows = df.iloc[5:, col_indices].copy()
-            data_rows.columns = columns
-            
-            # Remove completely empty rows
-            data_rows = data_rows.dropna(how='all')
-            
-            # Filter to meaningful rows (those with key data)
-            meaningful_rows = []
-            for idx, row in data_rows.iterrows():
-                if not (pd.isna(row['A']) and pd.isna(row['C']) and pd.isna(row['E']) and pd.isna(row['F'])):
-                    meaningful_rows.append((idx, row))
-            
-            return meaningful_rows
-            
-        except Exception as e:
-            raise Exception(f"Error reading Excel file: {e}")
+            while True:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            # Lines that would be trimmed straight away are never inserted
+            self.log_text.insert(tk.END, "".join(lines[-LOG_MAX_LINES:]))
+            self.trim_log()
+            self.log_text.see(tk.END)
+        
+        try:
+            while True:
+                callback = self.ui_queue.get_nowait()
+                callback()
+        except queue.Empty:
+            pass
+        
+        if self.worker is not None:
+            self.update_progress()
+        self.root.after(LOG_POLL_MS, self.poll_queues)
+        
+    def trim_log(self):
+        """Keep the log view bounded to the last LOG_MAX_LINES lines"""
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > LOG_MAX_LINES + LOG_TRIM_SLACK:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        
+    def update_progress(self):
+        done, total = self.progress_state
+        if total:
+            self.progress_bar.configure(mode="determinate", maximum=total, value=done)
+        else:
+            self.progress_bar.configure(mode="indeterminate")
+            self.progress_bar.step(2)
+        
+    def set_progress(self, done, total=None):
+        """Engine progress callback; just records the latest values for poll_queues"""
+        self.progress_state = (done, total)
+        
+    def make_engine(self):
+        """Sync engine for the currently selected Excel file and vault"""
+        return SyncEngine(self.excel_file.get(), self.output_dir.get(), log=self.log,
+                          progress=self.set_progress, cancel_event=self.cancel_event,
+                          dry_run=self.dry_run.get())
+    
+    def preload_excel_libraries(self):
+        """Import pandas/openpyxl on a daemon thread (see PRELOAD_EXCEL_LIBRARIES)"""
+        def target():
+            try:
+                preload_excel_libraries()
+            except ImportError:
+                # Reported by the first operation that needs them
+                pass
+        
+        threading.Thread(target=target, daemon=True).start()
+    
+    def run_in_background(self, status, work, on_done, error_prefix):
+        """Run work() on a worker thread, then on_done(result) back on the Tk thread
+
+        Action buttons are disabled while the worker runs. Errors are logged
+        and shown with error_prefix; a cancelled run just updates the status.
+        """
+        if self.worker is not None:
+            return
+        
+        self.status_text.set(status)
+        self.cancel_event.clear()
+        self.progress_state = (0, None)
+        for button in self.action_buttons:
+            button.configure(state=tk.DISABLED)
+        self.cancel_button.configure(state=tk.NORMAL)
+        
+        def target():
+            try:
+                result = work()
+                self.ui_queue.put(lambda: self.finish_operation(on_done, result))
+            except OperationCancelled:
+                self.ui_queue.put(lambda: self.finish_operation(self.operation_cancelled, None))
+            except Exception as e:
+                error_msg = f"{error_prefix}: {str(e)}"
+                self.ui_queue.put(lambda: self.finish_operation(self.operation_failed, error_msg))
+        
+        self.worker = threading.Thread(target=target, daemon=True)
+        self.worker.start()
+        
+    def finish_operation(self, callback, result):
+        self.worker = None
+        for button in self.action_buttons:
+            button.configure(state=tk.NORMAL)
+        self.cancel_button.configure(state=tk.DISABLED)
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate", value=0)
+        callback(result)
+        
+    def cancel_operation(self):
+        """Ask the running worker to stop at the next row or file"""
+        if self.worker is not None:
+            self.cancel_event.set()
+            self.status_text.set("Cancelling...")
+        
+    def operation_cancelled(self, _result):
+        self.log("⏹ Operation cancelled")
+        self.status_text.set("Cancelled")
+        
+    def operation_failed(self, error_msg):
+        self.log(f"ERROR: {error_msg}")
+        self.status_text.set("Error occurred")
+        messagebox.showerror("Error", error_msg)
     
     def check_missing_files(self):
         """Check which Excel requirements are missing files"""
@@ -257,77 +364,15 @@ Note: Both Column A and E are required to create files."""
             messagebox.showerror("Error", "Please select output directory")
             return
             
-        try:
-            self.status_text.set("Checking missing files...")
-            self.log("=" * 60)
-            self.log("CHECKING FOR MISSING REQUIREMENT FILES")
-            self.log("=" * 60)
-            
-            # Read Excel requirements
-            requirements = self.read_excel_requirements()
-            self.log(f"📊 Found {len(requirements)} meaningful requirements in Excel")
-            
-            # Check which files exist
-            missing_files = []
-            existing_files = []
-            invalid_requirements = []
-            
-            for idx, row in requirements:
-                try:
-                    filename = self.generate_filename(row)
-                    filepath = os.path.join(self.output_dir.get(), filename)
-                    
-                    req_id = str(row['A']).strip() if pd.notna(row['A']) else "No ID"
-                    short_desc = str(row['E']).strip() if pd.notna(row['E']) else "No description"
-                    
-                    if os.path.exists(filepath):
-                        existing_files.append((filename, req_id, short_desc))
-                        self.log(f"✓ EXISTS: {filename}")
-                    else:
-                        missing_files.append((filename, req_id, short_desc, idx, row))
-                        self.log(f"❌ MISSING: {filename} ({req_id} - {short_desc})")
-                        
-                except ValueError as e:
-                    invalid_requirements.append((idx, row, str(e)))
-                    row_num = idx + 6  # Adjust for Excel row numbering
-                    req_id = str(row['A']).strip() if pd.notna(row['A']) and str(row['A']).strip() else "Missing"
-                    short_desc = str(row['E']).strip() if pd.notna(row['E']) and str(row['E']).strip() else "Missing"
-                    self.log(f"⚠ INVALID (Row {row_num}): {str(e)} - ID: '{req_id}', Short Desc: '{short_desc}'")
-            
-            # Summary
-            self.log("=" * 60)
-            self.log("SUMMARY")
-            self.log(f"📊 Total requirements: {len(requirements)}")
-            self.log(f"✓ Existing files: {len(existing_files)}")
-            self.log(f"❌ Missing files: {len(missing_files)}")
-            self.log(f"⚠ Invalid requirements: {len(invalid_requirements)}")
-            
-            if missing_files:
-                self.log("=" * 60)
-                self.log("MISSING REQUIREMENTS:")
-                for filename, req_id, short_desc, idx, row in missing_files:
-                    self.log(f"  • {req_id}: {short_desc}")
-                self.log(f"\nUse 'Create Missing Files' to create these {len(missing_files)} files")
-            
-            if invalid_requirements:
-                self.log("=" * 60)
-                self.log("INVALID REQUIREMENTS (cannot create files):")
-                for idx, row, error in invalid_requirements:
-                    row_num = idx + 6
-                    req_id = str(row['A']).strip() if pd.notna(row['A']) and str(row['A']).strip() else "Missing"
-                    short_desc = str(row['E']).strip() if pd.notna(row['E']) and str(row['E']).strip() else "Missing"
-                    self.log(f"  • Row {row_num}: {error} (ID: '{req_id}', Short Desc: '{short_desc}')")
-            
-            if not missing_files and not invalid_requirements:
-                self.log("🎉 All valid requirements have corresponding files!")
-            
-            self.status_text.set(f"Check complete: {len(missing_files)} missing, {len(invalid_requirements)} invalid")
+        engine = self.make_engine()
+        
+        def on_done(result):
+            self.status_text.set(f"Check complete: {len(result['missing'])} missing, {len(result['invalid'])} invalid, "
+                                 f"{len(result['duplicates'])} duplicate IDs, {len(result['renamed'])} renamed, "
+                                 f"{len(result['orphaned'])} orphaned")
             
-        except Exception as e:
-            error_msg = f"Error checking files: {str(e)}"
-            self.log(f"ERROR: {error_msg}")
-            self.status_text.set("Error occurred")
-            messagebox.showerror("Error", error_msg)
+        self.run_in_background("Checking missing files...", engine.check_missing_files,
+                               on_done, "Error checking files")
     
     def create_missing_files(self):
         """Create files for Excel requirements that don't have corresponding files"""
@@ -339,177 +384,109 @@ Note: Both Column A and E are required to create files."""
             messagebox.showerror("Error", "Please select output directory")
             return
             
-        try:
-            self.status_text.set("Creating missing files...")
-            self.log("=" * 60)
-            self.log("CREATING MISSING REQUIREMENT FILES")
-            self.log("=" * 60)
-            
-            # Read Excel requirements
-            requirements = self.read_excel_requirements()
-            self.log(f"📊 Found {len(requirements)} meaningful requirements in Excel")
-            
-            # Create missing files
-            created_count = 0
-            skipped_count = 0
-            error_count = 0
-            
-            # Ensure output directory exists
-            os.makedirs(self.output_dir.get(), exist_ok=True)
-            
-            for idx, row in requirements:
-                try:
-                    filename = self.generate_filename(row)
-                    filepath = os.path.join(self.output_dir.get(), filename)
-                    
-                    req_id = str(row['A']).strip() if pd.notna(row['A']) else "No ID"
-                    short_desc = str(row['E']).strip() if pd.notna(row['E']) else "No description"
-                    
-                    if os.path.exists(filepath):
-                        skipped_count += 1
-                        self.log(f"⏭ SKIPPED: {filename} (already exists)")
-                    else:
-                        # Create the file
-                        content = self.create_md_content(row)
-                        
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        
-                        created_count += 1
-                        self.log(f"✅ CREATED: {filename} ({req_id} - {short_desc})")
-                        
-                except ValueError as e:
-                    error_count += 1
-                    row_num = idx + 6  # Adjust for Excel row numbering (data starts at row 6)
-                    req_id = str(row['A']).strip() if pd.notna(row['A']) and str(row['A']).strip() else "Missing"
-                    short_desc = str(row['E']).strip() if pd.notna(row['E']) and str(row['E']).strip() else "Missing"
-                    self.log(f"❌ ERROR (Row {row_num}): {str(e)} - ID: '{req_id}', Short Desc: '{short_desc}'")
-                except Exception as e:
-                    error_count += 1
-                    row_num = idx + 6
-                    self.log(f"❌ UNEXPECTED ERROR (Row {row_num}): {str(e)}")
-            
-            # Summary
-            self.log("=" * 60)
-            self.log("CREATION COMPLETE")
-            self.log(f"✅ Files created: {created_count}")
-            self.log(f"⏭ Files skipped: {skipped_count}")
-            self.log(f"❌ Errors (files not created): {error_count}")
-            self.log(f"📊 Total processed: {len(requirements)}")
-            
-            if error_count > 0:
-                self.log(f"\n⚠ {error_count} requirements could not be processed due to missing ID or Short Description")
-            
-            self.status_text.set("File creation complete!")
+        engine = self.make_engine()
+        
+        def work():
+            result = engine.create_missing_files()
             
             # Generate overview if enabled and files were created
-            if AUTO_GENERATE_OVERVIEW and created_count > 0:
-                self.log("Auto-generating requirements overview...")
-                self.generate_overview_only()
-            
-            # Show summary dialog
-            if error_count > 0:
-                summary_msg = (f"File Creation Complete with Errors!\n\n"
-                              f"Created: {created_count} new files\n"
-                              f"Skipped: {skipped_count} existing files\n"
-                              f"Errors: {error_count} requirements missing required data\n"
-                              f"Total: {len(requirements)} requirements processed\n\n"
-                              f"Check the log for details on failed requirements.\n"
-                              f"Requirements need both ID (Column A) and Short Description (Column E).")
-            else:
-                summary_msg = (f"File Creation Complete!\n\n"
-                              f"Created: {created_count} new files\n"
-                              f"Skipped: {skipped_count} existing files\n"
-                              f"Total: {len(requirements)} requirements processed\n\n"
-                              f"All files are now in your Obsidian vault!")
-                
-            if error_count > 0:
-                messagebox.showwarning("Creation Complete with Errors", summary_msg)
-            else:
-                messagebox.showinfo("Creation Complete", summary_msg)
+            if AUTO_GENERATE_OVERVIEW and result['created'] > 0 and not result['dry_run']:
+                engine.log("Auto-generating requirements overview...")
+                result['overview'] = engine.generate_overview()
+            return result
             
-        except Exception as e:
-            error_msg = f"Error creating files: {str(e)}"
-            self.log(f"ERROR: {error_msg}")
-            self.status_text.set("Error occurred")
-            messagebox.showerror("Error", error_msg)
+        self.run_in_background("Creating missing files...", work,
+                               self.show_creation_summary, "Error creating files")
     
-    def extract_requirement_data_from_file(self, filepath):
-        """Extract requirement data from a markdown file"""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract data from the table in the markdown
-            req_data = {
-                'filename': os.path.basename(filepath),
-                'filepath': filepath,
-                'requirement_id': '',
-                'category': '',
-                'topic': '',
-                'short_description': '',
-                'description': '',
-                'priority': ''
-            }
+    def show_creation_summary(self, result):
+        created_count = result['created']
+        skipped_count = result['skipped']
+        error_count = result['errors']
+        total_count = result['total']
+        
+        if result['dry_run']:
+            self.status_text.set(f"Dry run complete: {created_count} files would be created")
+            messagebox.showinfo("Dry Run Complete",
+                f"Dry Run Complete - no files were written.\n\n"
+                f"Would create: {created_count} new files\n"
+                f"Skipped: {skipped_count} existing files\n"
+                f"Renamed: {result['renamed']} notes found by ID (not recreated)\n"
+                f"Errors: {error_count} requirements missing required data\n"
+                f"Total: {total_count} requirements processed")
+            return
+        
+        self.status_text.set("File creation complete!")
+        
+        if 'overview' in result:
+            self.show_overview_result(result['overview'])
+        
+        # Show summary dialog
+        if error_count > 0:
+            summary_msg = (f"File Creation Complete with Errors!\n\n"
+                          f"Created: {created_count} new files\n"
+                          f"Skipped: {skipped_count} existing files\n"
+                          f"Renamed: {result['renamed']} notes found by ID (not recreated)\n"
+                          f"Errors: {error_count} requirements missing required data\n"
+                          f"Total: {total_count} requirements processed\n\n"
+                          f"Check the log for details on failed requirements.\n"
+                          f"Requirements need both ID (Column A) and Short Description (Column E).")
+        else:
+            summary_msg = (f"File Creation Complete!\n\n"
+                          f"Created: {created_count} new files\n"
+                          f"Skipped: {skipped_count} existing files\n"
+                          f"Renamed: {result['renamed']} notes found by ID (not recreated)\n"
+                          f"Total: {total_count} requirements processed\n\n"
+                          f"All files are now in your Obsidian vault!")
+            
+        if error_count > 0:
+            messagebox.showwarning("Creation Complete with Errors", summary_msg)
+        else:
+            messagebox.showinfo("Creation Complete", summary_msg)
+    
+    def update_changed_files(self):
+        """Update the attribute tables of notes whose Excel row changed"""
+        if not self.excel_file.get():
+            messagebox.showerror("Error", "Please select an Excel file")
+            return
             
-            # Parse the markdown table to extract requirement data
-            lines = content.split('\n')
-            in_table = False
+        if not self.output_dir.get():
+            messagebox.showerror("Error", "Please select output directory")
+            return
             
-            for line in lines:
-                line = line.strip()
-                
-                # Look for table start
-                if line.startswith('| Attribute | Value |'):
-                    in_table = True
-                    continue
-                elif line.startswith('|---') and in_table:
-                    continue
-                elif in_table and line.startswith('|') and '|' in line[1:]:
-                    # Parse table row
-                    parts = [part.strip().strip('*') for part in line.split('|')[1:-1]]
-                    if len(parts) >= 2:
-                        attribute = parts[0].lower()
-                        value = parts[1].replace('\\|', '|')  # Unescape pipes
-                        
-                        if 'requirement id' in attribute:
-                            req_data['requirement_id'] = value
-                        elif 'category' in attribute or 'functional activity' in attribute:
-                            req_data['category'] = value
-                        elif 'topic' in attribute:
-                            req_data['topic'] = value
-                        elif 'short description' in attribute:
-                            req_data['short_description'] = value
-                        elif 'description overview' in attribute:
-                            req_data['description'] = value
-                        elif 'priority' in attribute:
-                            req_data['priority'] = value
-                elif in_table and not line.startswith('|'):
-                    # End of table
-                    break
+        engine = self.make_engine()
+        
+        def work():
+            result = engine.update_changed_files()
             
-            return req_data
+            # Regenerate overview if enabled and notes were rewritten
+            if AUTO_GENERATE_OVERVIEW and result['updated'] > 0 and not result['dry_run']:
+                engine.log("Auto-generating requirements overview...")
+                result['overview'] = engine.generate_overview()
+            return result
             
-        except Exception as e:
-            self.log(f"Error reading file {filepath}: {e}")
-            return None
+        self.run_in_background("Updating changed notes...", work,
+                               self.show_update_summary, "Error updating files")
     
-    def get_all_requirement_files(self):
-        """Get all .md files in the vault directory"""
-        output_dir = self.output_dir.get()
-        
-        if not os.path.exists(output_dir):
-            return []
-            
-        md_files = []
-        for filename in os.listdir(output_dir):
-            if filename.endswith('.md') and not filename.startswith('0_'):  # Skip overview files
-                filepath = os.path.join(output_dir, filename)
-                req_data = self.extract_requirement_data_from_file(filepath)
-                if req_data:
-                    md_files.append(req_data)
-        
-        return md_files
+    def show_update_summary(self, result):
+        if result['dry_run']:
+            self.status_text.set(f"Dry run complete: {result['updated']} notes would be updated")
+        else:
+            self.status_text.set(f"Update complete: {result['updated']} notes updated")
+            if 'overview' in result:
+                self.show_overview_result(result['overview'])
+        
+        summary_msg = (f"{'Dry Run' if result['dry_run'] else 'Update'} Complete!\n\n"
+                      f"{'Would update' if result['dry_run'] else 'Updated'}: {result['updated']} notes\n"
+                      f"Unchanged: {result['unchanged']} notes\n"
+                      f"No file yet: {result['missing']} requirements\n"
+                      f"Invalid: {result['invalid']} requirements\n"
+                      f"Errors: {result['errors']}\n"
+                      f"Total: {result['total']} requirements processed")
+        
+        if result['errors'] > 0:
+            messagebox.showwarning("Update Complete with Errors", summary_msg)
+        else:
+            messagebox.showinfo("Update Complete", summary_msg)
     
     def generate_overview_only(self):
         """Generate overview file of all requirements"""
@@ -521,127 +498,111 @@ Note: Both Column A and E are required to create files."""
             messagebox.showerror("Error", "Obsidian vault directory does not exist")
             return
         
-        try:
-            self.status_text.set("Generating overview...")
-            self.log("=" * 50)
-            self.log("GENERATING REQUIREMENTS OVERVIEW")
-            
-            # Get all requirement files
-            all_requirements = self.get_all_requirement_files()
-            
-            if not all_requirements:
-                self.log("⚠ No requirement files found in vault")
-                self.status_text.set("No requirements found")
-                messagebox.showwarning("No Requirements", 
-                    "No requirement files found in the selected vault.\n"
-                    "Use 'Create Missing Files' first to create requirement files.")
-                return
-            
-            # Sort requirements by ID, then by topic
-            def sort_key(req):
-                return (req['requirement_id'] or 'zzz', req['topic'] or 'zzz')
-            
-            all_requirements.sort(key=sort_key)
-            
-            # Create overview content
-            content = []
-            content.append("# Requirements Overview")
-            content.append("")
-            content.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}*")
-            content.append("")
-            
-            # Summary statistics
-            content.append("## Summary")
-            content.append("")
-            content.append(f"- **Total Requirements**: {len(all_requirements)}")
-            content.append("")
-            
-            # Category breakdown
-            categories = {}
-            priority_levels = {}
-            
-            for req in all_requirements:
-                cat = req['category'] or 'Uncategorized'
-                pri = req['priority'] or 'Not specified'
-                categories[cat] = categories.get(cat, 0) + 1
-                priority_levels[pri] = priority_levels.get(pri, 0) + 1
-            
-            if categories:
-                content.append("### Categories")
-                for cat, count in sorted(categories.items()):
-                    content.append(f"- **{cat}**: {count} requirements")
-                content.append("")
-            
-            if priority_levels:
-                content.append("### Priority Levels")
-                for pri, count in sorted(priority_levels.items()):
-                    content.append(f"- **{pri}**: {count} requirements")
-                content.append("")
-            
-            # Requirements table
-            content.append("## All Requirements")
-            content.append("")
-            content.append("| ID | Category | Topic | Short Description | Description Overview | Priority | File |")
-            content.append("|:---|:---------|:------|:------------------|:---------------------|:---------|:-----|")
-            
-            for req in all_requirements:
-                # Truncate long descriptions for table readability
-                desc = req['description'][:100] + "..." if len(req['description']) > 100 else req['description']
-                # Escape pipes in cell content
-                desc = desc.replace('|', '\\|')
-                category = req['category'].replace('|', '\\|')
-                topic = req['topic'].replace('|', '\\|')
-                short_description = req['short_description'].replace('|', '\\|')
-                priority = req['priority'].replace('|', '\\|')
-                
-                # Create link to file (remove .md extension for cleaner links)
-                file_link = f"[[{req['filename'][:-3]}]]" if req['filename'].endswith('.md') else f"[[{req['filename']}]]"
-                
-                content.append(f"| {req['requirement_id']} | {category} | {topic} | {short_description} | {desc} | {priority} | {file_link} |")
-            
-            content.append("")
-            
-            # Usage instructions
-            content.append("---")
-            content.append("")
-            content.append("## Usage Instructions")
-            content.append("")
-            content.append("This overview provides a comprehensive view of all requirements. To analyze specific requirements:")
-            content.append("")
-            content.append("1. **Browse by Category**: Look for patterns in similar functional areas")
-            content.append("2. **Filter by Priority**: Focus on high-priority requirements first")
-            content.append("3. **Follow Links**: Click on any file link to view detailed requirement information")
-            content.append("4. **Search & Filter**: Use Obsidian's search to find requirements by keywords")
-            content.append("")
+        engine = self.make_engine()
+        self.run_in_background("Generating overview...", engine.generate_overview,
+                               self.show_overview_result, "Error generating overview")
+    
+    def watch_vault(self):
+        """Keep the overview current as notes and the Excel file change (until Cancel)"""
+        if not self.output_dir.get():
+            messagebox.showerror("Error", "Please select Obsidian vault directory first")
+            return
+        
+        if not os.path.exists(self.output_dir.get()):
+            messagebox.showerror("Error", "Obsidian vault directory does not exist")
+            return
+        
+        watcher = VaultWatcher(self.make_engine())
+        
+        def on_done(result):
+            self.status_text.set(f"Stopped watching ({result['overviews']} overview refreshes)")
             
-            # Write overview file
-            overview_path = os.path.join(self.output_dir.get(), "0_Requirements_Overview.md")
-            with open(overview_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(content))
+        self.run_in_background("Watching vault - press Cancel to stop", watcher.run,
+                               on_done, "Error watching vault")
+    
+    def export_requirements(self):
+        """Export the requirement index joined with note status"""
+        if not self.excel_file.get():
+            messagebox.showerror("Error", "Please select an Excel file")
+            return
             
-            self.log(f"✓ Created overview file: 0_Requirements_Overview.md")
-            self.log(f"  - {len(all_requirements)} requirements included")
+        if not self.output_dir.get():
+            messagebox.showerror("Error", "Please select output directory")
+            return
+        
+        engine = self.make_engine()
+        self.run_in_background("Exporting requirement index...", engine.export_requirements,
+                               self.show_export_result, "Error exporting requirements")
+    
+    def show_export_result(self, result):
+        counts = result['counts']
+        self.status_text.set(f"Exported {sum(counts.values())} requirements")
+        summary_msg = (f"Export Complete!\n\n"
+                      f"With notes: {counts['exists']}\n"
+                      f"Found by ID under another name: {counts['renamed']}\n"
+                      f"Missing notes: {counts['missing']}\n"
+                      f"Invalid rows: {counts['invalid']}\n"
+                      f"Notes without an Excel row: {counts['note_only']}")
+        if result['files']:
+            summary_msg += "\n\n" + "\n".join(os.path.basename(path) for path in result['files'])
+        messagebox.showinfo("Export Complete", summary_msg)
+    
+    def search_requirements(self):
+        """Full-text search of the vault's notes; matches are listed in the log"""
+        query = self.search_query.get().strip()
+        if not query:
+            return
             
+        if not os.path.exists(self.output_dir.get()):
+            messagebox.showerror("Error", "Obsidian vault directory does not exist")
+            return
+        
+        engine = self.make_engine()
+        self.run_in_background(f"Searching for '{query}'...", lambda: engine.search_requirements(query),
+                               self.show_search_result, "Error searching notes")
+    
+    def show_search_result(self, result):
+        matches = result['results']
+        if not matches:
+            self.status_text.set(f"No notes match '{result['query']}'")
+            return
+        best = matches[0]
+        self.status_text.set(f"{len(matches)} matches for '{result['query']}' "
+                             f"({result['seconds'] * 1000:.0f} ms) - best: "
+                             f"{best['requirement_id'] or best['filename']}")
+    
+    def show_overview_result(self, result):
+        if not result['total']:
+            self.status_text.set("No requirements found")
+            messagebox.showwarning("No Requirements", 
+                "No requirement files found in the selected vault.\n"
+                "Use 'Create Missing Files' first to create requirement files.")
+            return
+        
+        if result['dry_run']:
+            self.status_text.set("Dry run complete (overview not written)")
+            heading = "Dry Run Complete (overview not written)"
+        else:
             self.status_text.set("Overview generated!")
-            
-            # Show success message
-            success_msg = (f"Overview Generated Successfully!\n\n"
-                          f"Total Requirements: {len(all_requirements)}\n"
-                          f"Categories: {len(categories)}\n\n"
-                          f"Overview file: 0_Requirements_Overview.md")
-            
-            messagebox.showinfo("Overview Complete", success_msg)
-            self.log("=" * 50)
-            
-        except Exception as e:
-            error_msg = f"Error generating overview: {str(e)}"
-            self.log(f"ERROR: {error_msg}")
-            self.status_text.set("Error occurred")
-            messagebox.showerror("Error", error_msg)
+            heading = "Overview Generated Successfully!"
+        
+        # Show success message
+        success_msg = (f"{heading}\n\n"
+                      f"Total Requirements: {result['total']}\n"
+                      f"Categories: {len(result['categories'])}\n\n"
+                      f"Overview file: {OVERVIEW_FILENAME}")
+        if result['shard_files']:
+            success_msg += f"\n(index of {len(result['shard_files'])} category overview notes)"
+        if result['coverage']:
+            coverage = result['coverage']
+            success_msg += (f"\n\nLinked to other notes: {coverage['linked']} of {coverage['total']}"
+                            f"\nUnlinked: {coverage['total'] - coverage['linked']}")
+        
+        messagebox.showinfo("Overview Complete", success_msg)
             
     def run(self):
         self.root.mainloop()
 
 if __name__ == "__main__":
     app = RequirementsConverter()
-    app.run()
\ No newline at end of file
+    app.run()
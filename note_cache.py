@@ -0,0 +1,70 @@
+import os
+
+from sidecar import load_sidecar, save_sidecar
+
+
+CACHE_FILENAME = ".requirements_cache.json"
+
+# Bump when the shape of the cached req_data (or how notes are parsed) changes
+CACHE_VERSION = 3
+
+
+class NoteCache:
+    """Persistent cache of parsed requirement notes keyed by filename, mtime and size
+
+    Lets overview generation reparse only the notes whose stat changed since
+    the last run. Entries for notes that no longer exist are evicted by prune().
+    """
+
+    def __init__(self, vault_dir, entries=None):
+        self.vault_dir = vault_dir
+        self._entries = entries or {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, vault_dir):
+        """Load the cache sidecar (empty if there is no usable one)"""
+        return cls(vault_dir, load_sidecar(vault_dir, CACHE_FILENAME, CACHE_VERSION, 'entries'))
+
+    def lookup(self, filename, stat):
+        """Cached req_data for filename if its mtime and size are unchanged, else None"""
+        entry = self._entries.get(filename)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            self.hits += 1
+            req_data = dict(entry['req_data'])
+            req_data['filename'] = filename
+            req_data['filepath'] = os.path.join(self.vault_dir, filename)
+            return req_data
+        self.misses += 1
+        return None
+
+    def store(self, filename, stat, req_data):
+        """Remember freshly parsed req_data for filename at its current stat"""
+        # Paths are rebuilt on lookup so the cache survives the vault moving
+        cached = {key: value for key, value in req_data.items()
+                  if key not in ('filename', 'filepath')}
+        self._entries[filename] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'req_data': cached,
+        }
+        self._dirty = True
+
+    def prune(self, live_filenames):
+        """Evict entries for notes not in live_filenames, returning how many were dropped"""
+        live = set(live_filenames)
+        stale = [name for name in self._entries if name not in live]
+        for name in stale:
+            del self._entries[name]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the sidecar if anything changed"""
+        if not self._dirty:
+            return
+        save_sidecar(self.vault_dir, CACHE_FILENAME, CACHE_VERSION, 'entries', self._entries)
+        self._dirty = False
@@ -0,0 +1,185 @@
+import os
+import re
+from functools import lru_cache
+
+from note_sync import FIELD_KEYS, METADATA_START, SOURCE_HASH_KEY, TABLE_HEADER, read_source_hash
+
+
+# One table row: the first two cells, split on pipes that aren't escaped as \|
+_CELL = r'([^|]*(?:(?<=\\)\|[^|]*)*)'
+_TABLE_ROW_RE = re.compile(r'\|' + _CELL + r'\|' + _CELL + r'\|')
+
+# Notes up to this size are read whole: one read beats walking the lines
+WHOLE_READ_BYTES = 16 * 1024
+
+# A larger note with no attribute table in its first this-many bytes is only
+# read this far (plus the tail, for the metadata)
+MAX_HEAD_BYTES = 256 * 1024
+
+# Bytes read from the end of a note to find its CREATION_METADATA when the
+# head didn't contain it (it is written last, after the ## Notes section)
+TAIL_BYTES = 4096
+
+_TABLE_HEADER_BYTES = TABLE_HEADER.encode('utf-8')
+_METADATA_START_BYTES = METADATA_START.encode('utf-8')
+
+FRONTMATTER_DELIMITER = '---'
+_FRONTMATTER_END = ('---', '...')
+
+# Frontmatter keys accepted for each req_data field: the req_data key itself,
+# the table label, and both with spaces/underscores swapped
+_FRONTMATTER_KEYS = {'id': 'requirement_id', SOURCE_HASH_KEY: 'source_hash'}
+for _label, _key in FIELD_KEYS.items():
+    for _name in (_key, _label.lower()):
+        _FRONTMATTER_KEYS[_name] = _key
+        _FRONTMATTER_KEYS[_name.replace('_', ' ')] = _key
+        _FRONTMATTER_KEYS[_name.replace(' ', '_')] = _key
+
+
+def empty_requirement_data(filepath):
+    """req_data skeleton for a note, with every attribute blank"""
+    return {
+        'filename': os.path.basename(filepath),
+        'filepath': filepath,
+        'requirement_id': '',
+        'category': '',
+        'topic': '',
+        'short_description': '',
+        'description': '',
+        'priority': '',
+        'source_hash': ''
+    }
+
+
+@lru_cache(maxsize=256)
+def field_for_label(label):
+    """req_data key for a lowercased attribute table label, or None
+
+    The labels this tool writes are a direct lookup; hand-edited labels fall
+    back to keyword matching (memoized, so each distinct label is matched once).
+    """
+    for known, key in FIELD_KEYS.items():
+        if label == known.lower():
+            return key
+    if 'requirement id' in label:
+        return 'requirement_id'
+    if 'category' in label or 'functional activity' in label:
+        return 'category'
+    if 'topic' in label:
+        return 'topic'
+    if 'short description' in label:
+        return 'short_description'
+    if 'description overview' in label:
+        return 'description'
+    if 'priority' in label:
+        return 'priority'
+    return None
+
+
+def read_note_text(filepath):
+    """Read the parts of a requirement note the parser needs (the I/O half of parsing)
+
+    Small notes are read whole. Larger ones are read line by line through
+    the end of the attribute table and no further, so a long ## Notes
+    section costs nothing; if the metadata comment wasn't in that head, the
+    last TAIL_BYTES of the file are appended for it.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= WHOLE_READ_BYTES:
+            return _decode(f.read())
+
+        head = []
+        head_size = 0
+        in_table = False
+        for line in f:
+            head.append(line)
+            head_size += len(line)
+            stripped = line.strip()
+            if in_table:
+                if not stripped.startswith(b'|'):
+                    break
+            elif stripped.startswith(_TABLE_HEADER_BYTES):
+                in_table = True
+            elif head_size >= MAX_HEAD_BYTES:
+                break
+        else:
+            return _decode(b''.join(head))  # Read to the end
+
+        head = b''.join(head)
+        if _METADATA_START_BYTES in head or head_size >= size:
+            return _decode(head)
+        tail_start = max(head_size, size - TAIL_BYTES)
+        f.seek(tail_start)
+        tail = f.read().decode('utf-8', errors='replace')
+    if tail_start > head_size:
+        tail = tail.partition('\n')[2]  # Drop the partial first line
+    return _decode(head) + '\n' + _normalize_newlines(tail)
+
+
+def _decode(data):
+    """Decode note bytes as text-mode reads would (UTF-8, universal newlines)"""
+    return _normalize_newlines(data.decode('utf-8'))
+
+
+def _normalize_newlines(text):
+    return text.replace('\r\n', '\n').replace('\r', '\n') if '\r' in text else text
+
+
+def parse_frontmatter(lines):
+    """Requirement fields from a leading YAML frontmatter block
+
+    Only flat ``key: value`` pairs are read (optionally quoted); anything
+    else in the block is ignored. Returns (fields, index of the first line
+    after the block).
+    """
+    fields = {}
+    if not lines or lines[0].strip() != FRONTMATTER_DELIMITER:
+        return fields, 0
+    for i in range(1, len(lines)):
+        line = lines[i].strip()
+        if line in _FRONTMATTER_END:
+            return fields, i + 1
+        key, sep, value = line.partition(':')
+        field = _FRONTMATTER_KEYS.get(key.strip().lower()) if sep else None
+        if field:
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                value = value[1:-1]
+            fields[field] = value
+    return {}, 0  # Never closed: not frontmatter
+
+
+def parse_requirement_text(content, filepath):
+    """Extract requirement data from a note's frontmatter and attribute table
+
+    Values in the attribute table win over the same attribute in the
+    frontmatter, since the table is what update mode keeps in sync.
+    """
+    req_data = empty_requirement_data(filepath)
+    lines = content.split('\n')
+    fields, start = parse_frontmatter(lines)
+    req_data.update(fields)
+
+    # Parse the markdown table to extract requirement data
+    in_table = False
+    for i in range(start, len(lines)):
+        line = lines[i].strip()
+        if not in_table:
+            in_table = line.startswith(TABLE_HEADER)
+            continue
+        if not line.startswith('|'):
+            break  # End of table
+        row = _TABLE_ROW_RE.match(line)
+        if row:
+            field = field_for_label(row.group(1).strip().strip('*').lower())
+            if field:
+                req_data[field] = row.group(2).strip().strip('*').replace('\\|', '|')  # Unescape pipes
+
+    req_data['source_hash'] = read_source_hash(content) or req_data['source_hash']
+    return req_data
+
+
+def parse_requirement_note(filepath):
+    """Read and parse a requirement note (raises on I/O or decode errors)"""
+    return parse_requirement_text(read_note_text(filepath), filepath)
@@ -0,0 +1,136 @@
+import hashlib
+import re
+
+
+# Excel columns shown in a note's attribute table, in order, with their labels
+ATTRIBUTE_FIELDS = [
+    ('A', 'Requirement ID'),
+    ('B', 'Category/Functional Activity'),
+    ('C', 'Topic'),
+    ('E', 'Short Description'),
+    ('F', 'Description Overview'),
+    ('G', 'Priority'),
+]
+
+# req_data keys (see note_parser) matching each label
+FIELD_KEYS = {
+    'Requirement ID': 'requirement_id',
+    'Category/Functional Activity': 'category',
+    'Topic': 'topic',
+    'Short Description': 'short_description',
+    'Description Overview': 'description',
+    'Priority': 'priority',
+}
+
+TABLE_HEADER = "| Attribute | Value |"
+TABLE_SEPARATOR = "|-----------|-------|"
+
+METADATA_START = "<!-- CREATION_METADATA"
+METADATA_END = "-->"
+SOURCE_HASH_KEY = "source_hash"
+
+_METADATA_RE = re.compile(re.escape(METADATA_START) + r"(.*?)" + re.escape(METADATA_END), re.S)
+_SOURCE_HASH_RE = re.compile(r"^[ \t]*" + SOURCE_HASH_KEY + r":[ \t]*(\S+)[ \t]*$", re.M)
+
+
+def escape_cell(value):
+    """Render a cell value for the markdown table (escaped pipes, single line)"""
+    return str(value).replace('|', '\\|').replace('\n', ' ').strip()
+
+
+def is_blank(value):
+    """True for empty cells (None, or NaN from pandas)"""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def attribute_value(value):
+    """Escaped cell for the attribute table, or None if it is empty once stripped
+
+    Whitespace-only cells are dropped like empty ones, as the note parser
+    never reads an empty attribute back.
+    """
+    if is_blank(value):
+        return None
+    return escape_cell(value) or None
+
+
+def attribute_rows(row_data):
+    """(label, escaped value) pairs for the non-empty cells of an Excel row"""
+    values = ((label, attribute_value(row_data[col])) for col, label in ATTRIBUTE_FIELDS
+              if col in row_data)
+    return [(label, value) for label, value in values if value is not None]
+
+
+def attribute_rows_from_note(req_data):
+    """(label, escaped value) pairs for the attributes parsed from a note"""
+    return [(label, escape_cell(req_data[FIELD_KEYS[label]])) for _, label in ATTRIBUTE_FIELDS
+            if req_data.get(FIELD_KEYS[label])]
+
+
+def source_hash(attributes):
+    """Content hash of a row's rendered attributes, stored in the note metadata"""
+    digest = hashlib.sha1()
+    for label, value in attributes:
+        digest.update(f"{label}\x1f{value}\x1e".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def render_attribute_table(attributes):
+    """Markdown lines of the | Attribute | Value | table"""
+    lines = [TABLE_HEADER, TABLE_SEPARATOR]
+    for label, value in attributes:
+        lines.append(f"| **{label}** | {value} |")
+    return lines
+
+
+def find_metadata(content):
+    """Match of the note's CREATION_METADATA comment, or None
+
+    The generated comment ends the note, so the last one is used: an earlier
+    one is the user's own text (e.g. quoted in a code block under ## Notes).
+    """
+    start = content.rfind(METADATA_START)
+    return _METADATA_RE.match(content, start) if start >= 0 else None
+
+
+def read_source_hash(content):
+    """source_hash stored in a note's CREATION_METADATA comment, or ''"""
+    metadata = find_metadata(content)
+    if not metadata:
+        return ''
+    match = _SOURCE_HASH_RE.search(metadata.group(1))
+    return match.group(1) if match else ''
+
+
+def replace_attribute_table(content, attributes):
+    """Return content with a fresh attribute table and source_hash
+
+    Only the attribute table and the source_hash metadata line change; the
+    title, the ## Notes section and any other text are kept byte for byte.
+    Raises ValueError if the note has no attribute table.
+    """
+    newline = '\r\n' if '\r\n' in content else '\n'
+    lines = content.split(newline)
+
+    start = next((i for i, line in enumerate(lines) if line.strip().startswith(TABLE_HEADER)), None)
+    if start is None:
+        raise ValueError("No attribute table found")
+    end = start + 1
+    while end < len(lines) and lines[end].strip().startswith('|'):
+        end += 1
+    lines[start:end] = render_attribute_table(attributes)
+    content = newline.join(lines)
+
+    hash_line = f"{SOURCE_HASH_KEY}: {source_hash(attributes)}"
+    metadata = find_metadata(content)
+    if metadata is None:
+        # Notes written by hand (or by older versions) get a metadata block
+        suffix = '' if content.endswith(newline) else newline
+        return content + suffix + newline.join([METADATA_START, hash_line, METADATA_END, ''])
+
+    body = metadata.group(1)
+    if _SOURCE_HASH_RE.search(body):
+        body = _SOURCE_HASH_RE.sub(hash_line, body, count=1)
+    else:
+        body = body.rstrip('\r\n') + newline + hash_line + newline
+    return content[:metadata.start(1)] + body + content[metadata.end(1):]
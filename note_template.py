@@ -0,0 +1,150 @@
+import hashlib
+import os
+import re
+from itertools import repeat
+
+from note_sync import (ATTRIBUTE_FIELDS, SOURCE_HASH_KEY, TABLE_HEADER, TABLE_SEPARATOR,
+                       attribute_rows, attribute_value, escape_cell, is_blank,
+                       render_attribute_table, source_hash)
+
+
+# A note template placed in the vault under this name replaces the default.
+# The 0_ prefix keeps it out of the overview like the overview note itself.
+TEMPLATE_FILENAME = "0_Requirement_Template.md"
+
+DEFAULT_TEMPLATE = """# {{id}} - {{short_description}}
+
+{{attribute_table}}
+
+---
+
+## Notes
+*Add your additional notes and details here...*
+
+<!-- CREATION_METADATA
+created_by: excel_to_obsidian_converter
+creation_date: {{creation_date}}
+""" + SOURCE_HASH_KEY + """: {{source_hash}}
+-->
+"""
+
+# Placeholders available to templates, as {{name}}:
+#   id, short_description   - stripped Column A / E text (as in the title)
+#   category, topic, description, priority
+#                           - escaped, single-line Column B / C / F / G text
+#   attribute_table         - the | Attribute | Value | table (required, it is
+#                             what the overview and update mode read back)
+#   creation_date           - one ISO timestamp per batch
+#   source_hash             - hash of the attributes, used by update mode
+PLACEHOLDERS = ('id', 'short_description', 'category', 'topic', 'description', 'priority',
+                'attribute_table', 'creation_date', 'source_hash')
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Placeholders filled from single-line escaped cells, by Excel column
+_ESCAPED_FIELDS = {'category': 'B', 'topic': 'C', 'description': 'F', 'priority': 'G'}
+
+
+class NoteTemplate:
+    """A note template compiled once into a positional format string
+
+    Rendering a batch fills the format string from pre-computed column
+    arrays, so the per-note loop allocates nothing but the output string.
+    """
+
+    def __init__(self, text, source=None):
+        self.source = source
+        self.fields = []
+        parts = []
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(text):
+            name = match.group(1)
+            if name not in PLACEHOLDERS:
+                raise ValueError(f"Unknown placeholder {{{{{name}}}}} in note template")
+            parts.append(_escape_braces(text[position:match.start()]))
+            parts.append(f"{{{len(self.fields)}}}")
+            self.fields.append(name)
+            position = match.end()
+        parts.append(_escape_braces(text[position:]))
+        if 'attribute_table' not in self.fields:
+            raise ValueError("Note template must contain {{attribute_table}}")
+        self._format = "".join(parts).format
+
+    @classmethod
+    def load(cls, vault_dir, path=None):
+        """Template from path, else the vault's TEMPLATE_FILENAME, else the default"""
+        if not path and vault_dir:
+            path = os.path.join(vault_dir, TEMPLATE_FILENAME)
+            if not os.path.isfile(path):
+                path = None
+        if not path:
+            return cls(DEFAULT_TEMPLATE)
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), source=path)
+
+    def render_table(self, table, creation_date):
+        """Render one note per row of a requirement table (see requirement_table)
+
+        Returns a list of note contents aligned with the table's rows; every
+        note in the batch shares creation_date.
+        """
+        columns = note_columns(table)
+        columns['creation_date'] = repeat(creation_date)
+        return [self._format(*values) for values in zip(*(columns[name] for name in self.fields))]
+
+    def render_row(self, row_data, creation_date):
+        """Render a single note from a mapping of Excel columns (A-G) to cells"""
+        attributes = attribute_rows(row_data)
+        values = {
+            'id': _title_text(row_data.get('A'), "Unknown ID"),
+            'short_description': _title_text(row_data.get('E'), "No Description"),
+            'attribute_table': "\n".join(render_attribute_table(attributes)),
+            'creation_date': creation_date,
+            'source_hash': source_hash(attributes),
+        }
+        for name, col in _ESCAPED_FIELDS.items():
+            values[name] = "" if is_blank(row_data.get(col)) else escape_cell(row_data[col])
+        return self._format(*(values[name] for name in self.fields))
+
+
+def note_columns(table):
+    """Whole-column values for every template placeholder except creation_date
+
+    attribute_table and source_hash match render_attribute_table and
+    note_sync.source_hash exactly. Cells are escaped once per distinct value
+    and the per-row pieces joined column-wise; plain comprehensions are used because
+    pandas string ops on object columns were measured slower.
+    """
+    escaped = {}
+    table_parts = []
+    hash_parts = []
+    for col, label in ATTRIBUTE_FIELDS:
+        # Category, topic and priority repeat heavily, so escape each distinct value once
+        column = table[col].tolist()
+        memo = {value: attribute_value(value) for value in set(column)}
+        cells = [memo[value] for value in column]
+        escaped[col] = cells
+        row_prefix = f"\n| **{label}** | "
+        hash_prefix = f"{label}\x1f"
+        table_parts.append(["" if value is None else row_prefix + value + " |" for value in cells])
+        hash_parts.append(["" if value is None else hash_prefix + value + "\x1e" for value in cells])
+
+    header = TABLE_HEADER + "\n" + TABLE_SEPARATOR
+    columns = {
+        'id': [req_id or "Unknown ID" for req_id in table['req_id']],
+        'short_description': [short_desc or "No Description" for short_desc in table['short_desc']],
+        'attribute_table': [header + "".join(parts) for parts in zip(*table_parts)],
+        'source_hash': [hashlib.sha1("".join(parts).encode('utf-8')).hexdigest()
+                        for parts in zip(*hash_parts)],
+    }
+    for name, col in _ESCAPED_FIELDS.items():
+        columns[name] = ["" if value is None else value for value in escaped[col]]
+    return columns
+
+
+def _escape_braces(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _title_text(value, default):
+    return default if is_blank(value) else str(value).strip()
@@ -0,0 +1,67 @@
+import os
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Returned by write_notes for notes skipped because the run was cancelled
+CANCELLED = "cancelled"
+
+# Process umask, read once at import: os.umask can only be queried by
+# setting it, which isn't safe once writer threads are running
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _note_mode(filepath):
+    """Permissions for a note: those of the file it replaces, else what open() would give a new file"""
+    try:
+        return stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def write_note_atomic(filepath, content):
+    """Write a note via a temp file in the same directory and os.replace
+
+    The note either appears complete or not at all: an interrupted run can
+    leave at most a hidden ``.*.tmp`` file behind, never a truncated note.
+    The temp file (created 0600) gets the permissions of the note it
+    replaces, so rewrites don't lock other users of a shared vault out.
+    """
+    directory, filename = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f".{filename}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.chmod(tmp_path, _note_mode(filepath))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_notes(notes, jobs, cancel_event=None):
+    """Write (filepath, content) pairs atomically on a bounded thread pool
+
+    Returns one outcome per note in input order: None on success, CANCELLED
+    if cancel_event was set before the note was started, else the error
+    message.
+    """
+    def write_one(note):
+        if cancel_event is not None and cancel_event.is_set():
+            return CANCELLED
+        try:
+            write_note_atomic(*note)
+            return None
+        except Exception as e:
+            return str(e)
+
+    notes = list(notes)
+    if jobs <= 1 or len(notes) <= 1:
+        return [write_one(note) for note in notes]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(write_one, notes))
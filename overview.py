@@ -0,0 +1,209 @@
+import hashlib
+
+from requirement_table import sanitize_filename
+from sidecar import load_sidecar, save_sidecar
+
+
+OVERVIEW_FILENAME = "0_Requirements_Overview.md"
+
+# Sharded overviews: one note per category (split every N rows), named
+# 0_Requirements_Overview_<Category>.md so they are skipped like the index
+SHARD_PREFIX = "0_Requirements_Overview_"
+
+# Sidecar remembering the hash of every overview note last written
+MANIFEST_FILENAME = ".requirements_overview.json"
+MANIFEST_VERSION = 1
+
+TABLE_HEADER = "| ID | Category | Topic | Short Description | Description Overview | Priority | File |"
+TABLE_SEPARATOR = "|:---|:---------|:------|:------------------|:---------------------|:---------|:-----|"
+
+DESCRIPTION_PREVIEW = 100
+
+
+def content_hash(content):
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def note_link(filename, alias=None):
+    """Obsidian wikilink to a note (without the .md extension)"""
+    target = filename[:-3] if filename.endswith('.md') else filename
+    return f"[[{target}|{alias}]]" if alias else f"[[{target}]]"
+
+
+def _escape(text):
+    return text.replace('|', '\\|')
+
+
+def table_lines(store, rows):
+    """The | ID | Category | ... | File | table of the given rows of a RequirementStore"""
+    columns = store.columns
+    ids, topics, short_descriptions, descriptions, filenames = (
+        columns['requirement_id'], columns['topic'], columns['short_description'],
+        columns['description'], columns['filename'])
+    # Category and priority are escaped once per distinct value
+    categories = [_escape(value) for value in store.category.values]
+    priorities = [_escape(value) for value in store.priority.values]
+    category_codes, priority_codes = store.category.codes, store.priority.codes
+
+    lines = [TABLE_HEADER, TABLE_SEPARATOR]
+    for row in rows:
+        # Truncate long descriptions for table readability
+        desc = descriptions[row]
+        if len(desc) > DESCRIPTION_PREVIEW:
+            desc = desc[:DESCRIPTION_PREVIEW] + "..."
+        lines.append(f"| {ids[row]} | {categories[category_codes[row]]} | {_escape(topics[row])} | "
+                     f"{_escape(short_descriptions[row])} | {_escape(desc)} | "
+                     f"{priorities[priority_codes[row]]} | {note_link(filenames[row])} |")
+    return lines
+
+
+def _summary_lines(total, categories, priority_levels, category_links=None):
+    lines = ["## Summary", "", f"- **Total Requirements**: {total}", ""]
+    if categories:
+        lines.append("### Categories")
+        for cat, count in sorted(categories.items()):
+            links = (category_links or {}).get(cat)
+            if not links:
+                lines.append(f"- **{cat}**: {count} requirements")
+            elif len(links) == 1:
+                lines.append(f"- {note_link(links[0], cat)}: {count} requirements")
+            else:
+                parts = ", ".join(note_link(name, f"part {i}") for i, name in enumerate(links, start=1))
+                lines.append(f"- **{cat}**: {count} requirements ({parts})")
+        lines.append("")
+    if priority_levels:
+        lines.append("### Priority Levels")
+        for pri, count in sorted(priority_levels.items()):
+            lines.append(f"- **{pri}**: {count} requirements")
+        lines.append("")
+    return lines
+
+
+def _percent(part, whole):
+    return f"{100 * part / whole:.1f}%" if whole else "-"
+
+
+def _coverage_table(title, label, counts):
+    lines = [f"### {title}", "", f"| {label} | Linked | Unlinked | Coverage |",
+             "|:" + "-" * (len(label) + 1) + "|-------:|---------:|---------:|"]
+    for name, (linked, total) in sorted(counts.items()):
+        lines.append(f"| {_escape(name)} | {linked} | {total - linked} | {_percent(linked, total)} |")
+    lines.append("")
+    return lines
+
+
+def coverage_lines(coverage):
+    """## Traceability Coverage section: linked / unlinked requirements per category and priority
+
+    coverage holds 'linked' and 'total' counts and {name: (linked, total)}
+    'categories' and 'priorities' (see link_graph).
+    """
+    linked, total = coverage['linked'], coverage['total']
+    lines = ["## Traceability Coverage", "",
+             f"- **Linked Requirements**: {linked} of {total} ({_percent(linked, total)})",
+             f"- **Unlinked Requirements**: {total - linked}", ""]
+    lines.extend(_coverage_table("Coverage by Category", "Category", coverage['categories']))
+    lines.extend(_coverage_table("Coverage by Priority", "Priority", coverage['priorities']))
+    return lines
+
+
+def _usage_lines(sharded):
+    follow = ("Open a category note for its requirements table, then click any file link"
+              if sharded else "Click on any file link to view detailed requirement information")
+    return [
+        "---",
+        "",
+        "## Usage Instructions",
+        "",
+        "This overview provides a comprehensive view of all requirements. To analyze specific requirements:",
+        "",
+        "1. **Browse by Category**: Look for patterns in similar functional areas",
+        "2. **Filter by Priority**: Focus on high-priority requirements first",
+        f"3. **Follow Links**: {follow}",
+        "4. **Search & Filter**: Use Obsidian's search to find requirements by keywords",
+        "",
+    ]
+
+
+def render_overview(store, rows, categories, priority_levels, generated, coverage=None):
+    """The single-note overview: summary (and coverage) plus one table of every requirement (rows in order)"""
+    content = ["# Requirements Overview", "", f"*Generated on {generated}*", ""]
+    content.extend(_summary_lines(len(rows), categories, priority_levels))
+    if coverage:
+        content.extend(coverage_lines(coverage))
+    content.extend(["## All Requirements", ""])
+    content.extend(table_lines(store, rows))
+    content.append("")
+    content.extend(_usage_lines(sharded=False))
+    return "\n".join(content)
+
+
+def render_index(total, categories, priority_levels, category_links, generated, coverage=None):
+    """The sharded overview's index note: summaries (and coverage) linking to the category notes
+
+    Returns (content, hash); the hash leaves out the generation timestamp
+    so an otherwise unchanged index isn't rewritten.
+    """
+    body = _summary_lines(total, categories, priority_levels, category_links)
+    if coverage:
+        body.extend(coverage_lines(coverage))
+    body.extend(_usage_lines(sharded=True))
+    body = "\n".join(body)
+    content = "\n".join(["# Requirements Overview", "", f"*Generated on {generated}*", "", body])
+    return content, content_hash(body)
+
+
+def render_shard(store, category, rows, part, parts):
+    """One category note of a sharded overview (no timestamp, so it hashes stably)"""
+    title = f"# Requirements Overview - {category}"
+    if parts > 1:
+        title += f" (part {part} of {parts})"
+    content = [title, "", f"{note_link(OVERVIEW_FILENAME, 'Requirements Overview')}", "",
+               f"- **Requirements**: {len(rows)}", ""]
+    content.extend(table_lines(store, rows))
+    content.append("")
+    return "\n".join(content)
+
+
+def plan_shards(store, rows, shard_rows):
+    """Split the sorted rows of a RequirementStore into category shards of at most shard_rows rows
+
+    Returns {filename: (category, rows, part, parts)} and
+    {category: [filenames]}. Filenames are unique even on case-insensitive
+    filesystems. With shard_rows <= 0 each category stays in one shard.
+    """
+    by_category = store.rows_by_category(rows)
+
+    shards = {}
+    category_links = {}
+    used = set()
+    for category in sorted(by_category):
+        reqs = by_category[category]
+        base = SHARD_PREFIX + (sanitize_filename(category) or "Uncategorized")
+        name = base
+        suffix = 2
+        while name.casefold() in used:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        used.add(name.casefold())
+
+        if shard_rows > 0:
+            chunks = [reqs[i:i + shard_rows] for i in range(0, len(reqs), shard_rows)]
+        else:
+            chunks = [reqs]
+        filenames = []
+        for part, chunk in enumerate(chunks, start=1):
+            filename = f"{name}_part{part}.md" if len(chunks) > 1 else f"{name}.md"
+            shards[filename] = (category, chunk, part, len(chunks))
+            filenames.append(filename)
+        category_links[category] = filenames
+    return shards, category_links
+
+
+def load_manifest(vault_dir):
+    """{overview filename: content hash} as last written, or {} if unknown"""
+    return load_sidecar(vault_dir, MANIFEST_FILENAME, MANIFEST_VERSION, 'hashes')
+
+
+def save_manifest(vault_dir, hashes):
+    save_sidecar(vault_dir, MANIFEST_FILENAME, MANIFEST_VERSION, 'hashes', hashes, indent=1)
@@ -0,0 +1,195 @@
+"""Machine-readable export of the requirement index for downstream tools
+
+One record per Excel requirement row, joined with the vault:
+
+- exists: the row's note is in the vault
+- renamed: the row's note was found by requirement ID under another name
+  (its short description changed in Excel)
+- missing: the row is valid but has no note yet
+- invalid: the row lacks an ID or short description (see 'error')
+- note_only: a requirement note in the vault that no Excel row produces
+
+Records are streamed to JSON Lines, CSV and/or a SQLite table indexed for
+lookups such as "High priority missing notes in category X". Each file is
+written next to its final name and moved into place once complete.
+"""
+import csv
+import json
+import os
+import sqlite3
+
+
+EXPORT_BASENAME = "requirements_export"
+EXPORT_FORMATS = ('jsonl', 'csv', 'sqlite')
+
+STATUS_EXISTS = 'exists'
+STATUS_RENAMED = 'renamed'
+STATUS_MISSING = 'missing'
+STATUS_INVALID = 'invalid'
+STATUS_NOTE_ONLY = 'note_only'
+STATUSES = (STATUS_EXISTS, STATUS_RENAMED, STATUS_MISSING, STATUS_INVALID, STATUS_NOTE_ONLY)
+
+# filename is the note name the Excel row asks for, note the note actually
+# holding the requirement ('' when there is none)
+FIELDS = ('requirement_id', 'status', 'category', 'topic', 'short_description', 'description',
+          'priority', 'filename', 'note', 'source', 'row', 'error')
+STATUS_FIELD = FIELDS.index('status')
+NOTE_FIELD = FIELDS.index('note')
+
+# Excel column holding each text field
+FIELD_COLUMNS = {'category': 'B', 'topic': 'C', 'description': 'F', 'priority': 'G'}
+
+SQLITE_TABLE = 'requirements'
+SQLITE_INDEXES = {
+    'requirements_status': ('status', 'priority', 'category'),
+    'requirements_category': ('category', 'priority', 'status'),
+    'requirements_id': ('requirement_id',),
+    'requirements_filename': ('filename',),
+    'requirements_note': ('note',),
+}
+
+
+def _text(value):
+    return '' if value is None or (isinstance(value, float) and value != value) else str(value).strip()
+
+
+def table_records(table, exists, index):
+    """Export records (tuples in FIELDS order) for a requirement table
+
+    exists is a boolean column aligned with table: whether each row's
+    note is in the vault under its expected name; other valid rows are
+    looked up in the requirement ID index (see requirement_index).
+    """
+    texts = {field: [_text(value) for value in table[col]] for field, col in FIELD_COLUMNS.items()}
+    statuses = []
+    notes = []
+    for req_id, filename, valid, found in zip(table['req_id'], table['filename'], table['valid'], exists):
+        if found:
+            statuses.append(STATUS_EXISTS)
+            notes.append(filename)
+        elif not valid:
+            statuses.append(STATUS_INVALID)
+            notes.append('')
+        else:
+            note = index.note_for(req_id)
+            statuses.append(STATUS_RENAMED if note else STATUS_MISSING)
+            notes.append(note or '')
+    return list(zip(table['req_id'], statuses, texts['category'], texts['topic'], table['short_desc'],
+                    texts['description'], texts['priority'], table['filename'], notes, table['source'],
+                    (int(row) for row in table.index), table['error']))
+
+
+def note_record(req_data):
+    """Export record for a vault note that no Excel row produces"""
+    return (req_data['requirement_id'], STATUS_NOTE_ONLY, req_data['category'], req_data['topic'],
+            req_data['short_description'], req_data['description'], req_data['priority'],
+            req_data['filename'], req_data['filename'], '', None, '')
+
+
+class _JsonLinesWriter:
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8', newline='\n')
+
+    def write(self, records):
+        self.file.writelines(json.dumps(dict(zip(FIELDS, record)), ensure_ascii=False) + '\n'
+                             for record in records)
+
+    def close(self):
+        self.file.close()
+
+    abort = close
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        # utf-8-sig so Excel opens non-ASCII text correctly
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(FIELDS)
+
+    def write(self, records):
+        self.writer.writerows(records)
+
+    def close(self):
+        self.file.close()
+
+    abort = close
+
+
+class _SqliteWriter:
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        columns = ", ".join(f"{field} INTEGER" if field == 'row' else f"{field} TEXT" for field in FIELDS)
+        self.connection.execute(f"CREATE TABLE {SQLITE_TABLE} ({columns})")
+        self.insert = (f"INSERT INTO {SQLITE_TABLE} VALUES ({', '.join('?' * len(FIELDS))})")
+
+    def write(self, records):
+        self.connection.executemany(self.insert, records)
+
+    def close(self):
+        # Indexes are built once after the bulk insert, which is much faster
+        for name, columns in SQLITE_INDEXES.items():
+            self.connection.execute(f"CREATE INDEX {name} ON {SQLITE_TABLE} ({', '.join(columns)})")
+        self.connection.commit()
+        self.connection.close()
+
+    def abort(self):
+        self.connection.close()
+
+
+_WRITERS = {'jsonl': _JsonLinesWriter, 'csv': _CsvWriter, 'sqlite': _SqliteWriter}
+
+
+class RequirementExport:
+    """Streams export records to one file per format
+
+    Use as a context manager: files are written under temporary names and
+    replace the previous export only when the block completes without error.
+    """
+
+    def __init__(self, directory, formats=EXPORT_FORMATS, basename=EXPORT_BASENAME):
+        unknown = [fmt for fmt in formats if fmt not in _WRITERS]
+        if unknown:
+            raise ValueError(f"Unknown export formats {unknown} (expected some of {', '.join(_WRITERS)})")
+        self.paths = {fmt: os.path.join(directory, f"{basename}.{fmt}") for fmt in formats}
+        self.writers = {}
+        self.counts = dict.fromkeys(STATUSES, 0)
+
+    def __enter__(self):
+        try:
+            for fmt, path in self.paths.items():
+                tmp_path = path + ".tmp"
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                self.writers[fmt] = _WRITERS[fmt](tmp_path)
+        except BaseException:
+            self._discard()
+            raise
+        return self
+
+    def write(self, records):
+        for record in records:
+            self.counts[record[STATUS_FIELD]] += 1
+        for writer in self.writers.values():
+            writer.write(records)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._discard()
+            return False
+        for writer in self.writers.values():
+            writer.close()
+        for path in self.paths.values():
+            os.replace(path + ".tmp", path)
+        return False
+
+    def _discard(self):
+        for fmt, writer in self.writers.items():
+            try:
+                writer.abort()
+            except Exception:
+                pass
+            try:
+                os.remove(self.paths[fmt] + ".tmp")
+            except OSError:
+                pass
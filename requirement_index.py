@@ -0,0 +1,51 @@
+class RequirementIndex:
+    """Requirement ID → note filename index of the parsed notes of a vault
+
+    Notes are matched to Excel rows by requirement ID, so a note whose
+    short description (and hence expected filename) changed is still found.
+    The index is built from a RequirementStore and keeps nothing on disk of
+    its own: the store's notes come from the note cache, which only
+    reparses notes whose mtime/size changed.
+    """
+
+    def __init__(self, notes=None):
+        # filename → requirement ID ('' for notes without one)
+        self._notes = notes or {}
+        self._by_id = None
+
+    @classmethod
+    def from_notes(cls, store):
+        """Index the parsed notes of a RequirementStore"""
+        return cls(dict(zip(store.filenames, store.requirement_ids)))
+
+    def __len__(self):
+        return len(self._notes)
+
+    @property
+    def by_id(self):
+        """requirement ID → sorted filenames of the notes carrying it"""
+        if self._by_id is None:
+            by_id = {}
+            for filename, requirement_id in self._notes.items():
+                if requirement_id:
+                    by_id.setdefault(requirement_id, []).append(filename)
+            for filenames in by_id.values():
+                filenames.sort()
+            self._by_id = by_id
+        return self._by_id
+
+    def note_for(self, requirement_id):
+        """Filename of the note for requirement_id (the first one if several), or None"""
+        filenames = self.by_id.get(requirement_id)
+        return filenames[0] if filenames else None
+
+    def duplicates(self):
+        """[{requirement_id, filenames}] for IDs carried by more than one note"""
+        return [{'requirement_id': requirement_id, 'filenames': filenames}
+                for requirement_id, filenames in sorted(self.by_id.items()) if len(filenames) > 1]
+
+    def orphans(self, excel_ids):
+        """[{requirement_id, filename}] for notes whose ID no Excel row has"""
+        return [{'requirement_id': requirement_id, 'filename': filename}
+                for requirement_id, filenames in sorted(self.by_id.items()) if requirement_id not in excel_ids
+                for filename in filenames]
@@ -0,0 +1,146 @@
+"""Compact column store of parsed requirement notes
+
+A vault scan used to be kept as one req_data dict per note (see
+note_parser). The store holds the same data column by column instead:
+plain lists of strings for the free-text fields, and category/priority as
+small integer codes into a table of distinct values, so a 100k-note vault
+doesn't carry 100k copies of "High" or 100k dict objects. Counts and
+sorting work on the columns; record(i) rebuilds a req_data dict when a
+caller needs one note.
+"""
+import os
+import sys
+from array import array
+from collections import Counter
+from itertools import compress
+
+
+# Free-text columns, in req_data key order
+TEXT_FIELDS = ('filename', 'requirement_id', 'topic', 'short_description', 'description', 'source_hash')
+
+# Labels counted for notes without a category / priority
+UNCATEGORIZED = 'Uncategorized'
+NO_PRIORITY = 'Not specified'
+
+
+class _Codes:
+    """Interned distinct values of one column and their integer codes"""
+
+    __slots__ = ('values', 'codes', '_lookup')
+
+    def __init__(self):
+        self.values = []
+        self.codes = array('I')
+        self._lookup = {}
+
+    def code(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        return code
+
+    def append(self, value):
+        self.codes.append(self.code(value))
+
+    def counts(self, blank_label, mask=None):
+        """{value: rows}, blank values counted under blank_label (only rows where mask is true)"""
+        codes = self.codes if mask is None else compress(self.codes, mask)
+        counts = {}
+        for code, count in Counter(codes).items():
+            label = self.values[code] or blank_label
+            counts[label] = counts.get(label, 0) + count
+        return counts
+
+
+class RequirementStore:
+    """Parsed requirement notes of a vault, column by column"""
+
+    __slots__ = ('vault_dir', 'columns', 'category', 'priority')
+
+    def __init__(self, vault_dir=''):
+        self.vault_dir = vault_dir
+        self.columns = {field: [] for field in TEXT_FIELDS}
+        self.category = _Codes()
+        self.priority = _Codes()
+
+    @classmethod
+    def from_notes(cls, notes, vault_dir=''):
+        """Store parsed notes (req_data dicts, see note_parser)"""
+        store = cls(vault_dir)
+        for req_data in notes:
+            store.append(req_data)
+        return store
+
+    def append(self, req_data):
+        for field, column in self.columns.items():
+            column.append(req_data.get(field) or '')
+        self.category.append(req_data.get('category') or '')
+        self.priority.append(req_data.get('priority') or '')
+
+    def update(self, notes, removed=()):
+        """Apply a batch of edits in place: notes (req_data dicts) replace the
+        rows with their filename or are appended, removed filenames are dropped"""
+        rows = {filename: row for row, filename in enumerate(self.filenames)}
+        drop = {rows[filename] for filename in removed if filename in rows}
+        for req_data in notes:
+            row = rows.get(req_data['filename'])
+            if row is None:
+                rows[req_data['filename']] = len(self)
+                self.append(req_data)
+                continue
+            drop.discard(row)
+            for field, column in self.columns.items():
+                column[row] = req_data.get(field) or ''
+            self.category.codes[row] = self.category.code(req_data.get('category') or '')
+            self.priority.codes[row] = self.priority.code(req_data.get('priority') or '')
+        if drop:
+            keep = [row not in drop for row in range(len(self))]
+            for field, column in self.columns.items():
+                self.columns[field] = list(compress(column, keep))
+            for codes in (self.category, self.priority):
+                codes.codes = array('I', compress(codes.codes, keep))
+
+    def __len__(self):
+        return len(self.columns['filename'])
+
+    def __iter__(self):
+        return map(self.record, range(len(self)))
+
+    @property
+    def filenames(self):
+        return self.columns['filename']
+
+    @property
+    def requirement_ids(self):
+        return self.columns['requirement_id']
+
+    def record(self, row):
+        """req_data dict of one note"""
+        req_data = {field: column[row] for field, column in self.columns.items()}
+        req_data['filepath'] = os.path.join(self.vault_dir, req_data['filename'])
+        req_data['category'] = self.category.values[self.category.codes[row]]
+        req_data['priority'] = self.priority.values[self.priority.codes[row]]
+        return req_data
+
+    def counts(self, mask=None):
+        """Note counts per category and per priority (of the rows where mask is true)"""
+        return self.category.counts(UNCATEGORIZED, mask), self.priority.counts(NO_PRIORITY, mask)
+
+    def sorted_rows(self):
+        """Row numbers ordered by requirement ID, then topic (blanks last)"""
+        order = list(range(len(self)))
+        # Two stable sorts: by topic, then by ID
+        for field in ('topic', 'requirement_id'):
+            keys = [value or 'zzz' for value in self.columns[field]]
+            order.sort(key=keys.__getitem__)
+        return order
+
+    def rows_by_category(self, rows):
+        """{category label: rows in the given order}"""
+        labels = [value or UNCATEGORIZED for value in self.category.values]
+        codes = self.category.codes
+        groups = {}
+        for row in rows:
+            groups.setdefault(labels[codes[row]], []).append(row)
+        return groups
@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+
+from excel_reader import COLUMNS
+
+
+# Rows per normalized table when building from a row stream. Large enough for
+# the vectorized ops to pay off, small enough to keep memory flat.
+CHUNK_SIZE = 5000
+
+ERROR_MISSING_ID = "Missing Requirement ID (Column A)"
+ERROR_MISSING_SHORT_DESC = "Missing Short Description (Column E)"
+
+# Where a row came from ("workbook:sheet") when reading several sources;
+# '' for the single-workbook mode
+SOURCE_COLUMN = 'source'
+
+INVALID_FILENAME_CHARS = '<>:"/\\|?*'
+MAX_FILENAME_LENGTH = 100
+
+# Invalid characters and whitespace runs both become a single '_'. Invalid
+# characters are never whitespace, so one alternation does both in a single
+# pass (str.translate was measured slower on non-ASCII titles).
+_UNSAFE_RE = re.compile(r'[' + re.escape(INVALID_FILENAME_CHARS) + r']|\s+')
+
+# Distinct (ID, short description) pairs remembered by requirement_filename
+FILENAME_MEMO_SIZE = 1 << 17
+
+
+def sanitize_filename(text):
+    """Convert text to a safe filename"""
+    # Replace invalid characters and runs of whitespace with underscores
+    text = _UNSAFE_RE.sub('_', text)
+    text = text.strip('._')  # Remove leading/trailing dots and underscores
+    return text[:MAX_FILENAME_LENGTH]  # Limit length
+
+
+@lru_cache(maxsize=FILENAME_MEMO_SIZE)
+def requirement_filename(req_id, short_desc):
+    """Note filename for a stripped requirement ID and short description (memoized)"""
+    return sanitize_filename(f"{req_id}_{short_desc}") + ".md"
+
+
+def sanitize_filenames(texts):
+    """Vectorized sanitize_filename over a Series of strings"""
+    return (texts.str.replace(_UNSAFE_RE, '_', regex=True)
+                 .str.strip('._')
+                 .str[:MAX_FILENAME_LENGTH])
+
+
+def requirement_filenames(req_ids, short_descs):
+    """requirement_filename over aligned Series of IDs and short descriptions
+
+    Goes through the memo rather than sanitize_filenames: pandas string ops
+    on object columns are no faster than one regex pass per title, and the
+    memo makes repeat runs in the same session (check, then create) nearly free.
+    """
+    import pandas as pd
+
+    return pd.Series([requirement_filename(req_id, short_desc)
+                      for req_id, short_desc in zip(req_ids, short_descs)],
+                     index=req_ids.index, dtype=object)
+
+
+def _stripped_text(column):
+    """Stringify and strip a raw cell column, with '' for empty cells"""
+    return column.where(column.notna(), '').astype(str).str.strip().astype(object)
+
+
+def build_requirement_table(raw):
+    """Normalize a DataFrame of raw cells (columns A-G) into a requirement table
+
+    Everything the check and create paths need per row is computed once here
+    as whole columns:
+
+    - req_id / short_desc: stripped Column A / E text ('' when empty)
+    - valid: True when both req_id and short_desc are present
+    - error: reason the row cannot get a file ('' for valid rows)
+    - filename: sanitized ``{ID}_{short description}.md`` ('' for invalid rows)
+    - source: where the row came from (see SOURCE_COLUMN)
+
+    The raw cell columns are kept alongside for note rendering.
+    """
+    table = raw.copy()
+    if SOURCE_COLUMN in table:
+        table[SOURCE_COLUMN] = table[SOURCE_COLUMN].where(table[SOURCE_COLUMN].notna(), '')
+    else:
+        table[SOURCE_COLUMN] = ''
+    table['req_id'] = _stripped_text(raw['A'])
+    table['short_desc'] = _stripped_text(raw['E'])
+
+    has_id = table['req_id'] != ''
+    has_short_desc = table['short_desc'] != ''
+    table['valid'] = has_id & has_short_desc
+
+    # ID is checked first, so a row missing both reports the missing ID
+    table['error'] = ''
+    table.loc[~has_short_desc, 'error'] = ERROR_MISSING_SHORT_DESC
+    table.loc[~has_id, 'error'] = ERROR_MISSING_ID
+
+    table['filename'] = ''
+    if table['valid'].any():
+        valid = table['valid']
+        table.loc[valid, 'filename'] = requirement_filenames(table.loc[valid, 'req_id'],
+                                                            table.loc[valid, 'short_desc'])
+    return table
+
+
+def iter_requirement_tables(rows, chunk_size=CHUNK_SIZE):
+    """Group a stream of (excel_row, row) pairs into normalized requirement tables
+
+    Each yielded table is indexed by Excel row number and holds at most
+    chunk_size rows, so memory stays bounded however large the sheet is.
+    """
+    excel_rows = []
+    records = []
+    for excel_row, row in rows:
+        excel_rows.append(excel_row)
+        records.append(row)
+        if len(records) >= chunk_size:
+            yield _table_from_records(records, excel_rows)
+            excel_rows = []
+            records = []
+    if records:
+        yield _table_from_records(records, excel_rows)
+
+
+def _table_from_records(records, excel_rows):
+    import pandas as pd
+
+    raw = pd.DataFrame.from_records(records, columns=COLUMNS + [SOURCE_COLUMN],
+                                    index=pd.Index(excel_rows, name='excel_row'))
+    return build_requirement_table(raw.astype(object))
@@ -0,0 +1,156 @@
+"""Persistent full-text search over requirement notes (SQLite FTS5)
+
+The index lives in the vault next to the note cache and covers the
+attribute fields plus the free-text body of each note (everything after
+the attribute table, e.g. the ## Notes section). Every note is stamped
+with the mtime/size it was indexed at, so a sync only rereads the notes
+that changed and drops the ones that disappeared.
+
+Queries are plain words by default: each word must match (as a prefix),
+and results are ranked by BM25 with the requirement ID and short
+description weighted highest.
+"""
+import os
+import re
+import sqlite3
+
+
+# SQLite database kept in the vault next to the JSON sidecars
+SEARCH_FILENAME = ".requirements_search.sqlite"
+
+# Bump when the schema or what gets indexed changes
+SEARCH_VERSION = 1
+
+# Indexed columns and their BM25 weights
+COLUMNS = ('requirement_id', 'category', 'topic', 'short_description', 'description', 'priority', 'body')
+WEIGHTS = (10.0, 2.0, 2.0, 5.0, 3.0, 1.0, 1.0)
+
+_METADATA_RE = re.compile(r"<!--.*?-->", re.S)
+_WORD_RE = re.compile(r"\w+")
+
+
+def note_body(content):
+    """The free text of a note: everything after its attribute table, minus HTML comments"""
+    lines = content.splitlines()
+    in_table = False
+    for i, line in enumerate(lines):
+        if line.startswith('|'):
+            in_table = True
+        elif in_table:
+            return _METADATA_RE.sub('', "\n".join(lines[i:])).strip()
+    return '' if in_table else _METADATA_RE.sub('', content).strip()
+
+
+def read_note_body(filepath):
+    """note_body of the note at filepath"""
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        return note_body(f.read())
+
+
+def match_query(text):
+    """FTS5 query for plain search words: every word must match, as a prefix"""
+    words = _WORD_RE.findall(text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class SearchIndex:
+    """SQLite FTS5 index of the vault's requirement notes"""
+
+    def __init__(self, vault_dir, in_memory=False):
+        self.vault_dir = vault_dir
+        self.path = ":memory:" if in_memory else os.path.join(vault_dir, SEARCH_FILENAME)
+        self.connection = sqlite3.connect(self.path)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SEARCH_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS notes;")
+            self.connection.executescript(f"""
+                CREATE TABLE files (id INTEGER PRIMARY KEY, filename TEXT UNIQUE, mtime_ns INTEGER, size INTEGER);
+                CREATE VIRTUAL TABLE notes USING fts5({', '.join(COLUMNS)},
+                                                      tokenize='unicode61 remove_diacritics 2');
+                PRAGMA user_version = {SEARCH_VERSION};
+            """)
+            self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT count(*) FROM files").fetchone()[0]
+
+    def stamps(self):
+        """filename → (mtime_ns, size) the note was indexed at"""
+        return {filename: (mtime_ns, size) for filename, mtime_ns, size
+                in self.connection.execute("SELECT filename, mtime_ns, size FROM files")}
+
+    def sync(self, notes):
+        """Bring the index in line with notes: [(filename, stat, req_data)] of every live note
+
+        Only notes whose stat differs from the one they were indexed at are
+        reread (for their body) and reindexed; indexed notes not listed are
+        removed. Returns (reindexed, removed) counts.
+        """
+        stamps = self.stamps()
+        live = set()
+        stale = []
+        for filename, stat, req_data in notes:
+            live.add(filename)
+            if stamps.get(filename) != (stat.st_mtime_ns, stat.st_size):
+                stale.append((filename, stat, req_data))
+        removed = [filename for filename in stamps if filename not in live]
+
+        with self.connection:
+            for filename in removed + [filename for filename, _, _ in stale if filename in stamps]:
+                self._delete(filename)
+            for filename, stat, req_data in stale:
+                cursor = self.connection.execute(
+                    "INSERT INTO files (filename, mtime_ns, size) VALUES (?, ?, ?)",
+                    (filename, stat.st_mtime_ns, stat.st_size))
+                values = [req_data.get(column) or '' for column in COLUMNS[:-1]]
+                self.connection.execute(
+                    f"INSERT INTO notes (rowid, {', '.join(COLUMNS)}) VALUES (?, {', '.join('?' * len(COLUMNS))})",
+                    [cursor.lastrowid] + values + [self._body(filename)])
+        return len(stale), len(removed)
+
+    def _body(self, filename):
+        try:
+            return read_note_body(os.path.join(self.vault_dir, filename))
+        except OSError:
+            # Gone since the scan: its attributes are still indexed until the next sync
+            return ''
+
+    def _delete(self, filename):
+        row = self.connection.execute("SELECT id FROM files WHERE filename = ?", (filename,)).fetchone()
+        if row:
+            self.connection.execute("DELETE FROM notes WHERE rowid = ?", row)
+            self.connection.execute("DELETE FROM files WHERE id = ?", row)
+
+    def search(self, query, limit, raw=False):
+        """Ranked matches for query: [{requirement_id, short_description, filename, snippet}]
+
+        query is plain words unless raw, in which case it is passed to FTS5
+        as-is (phrases, OR/NOT, column filters such as priority:high).
+        """
+        fts_query = query if raw else match_query(query)
+        if not fts_query:
+            return []
+        weights = ", ".join(str(weight) for weight in WEIGHTS)
+        try:
+            rows = self.connection.execute(f"""
+                SELECT notes.requirement_id, notes.short_description, files.filename,
+                       snippet(notes, -1, '**', '**', '…', 12)
+                FROM notes JOIN files ON files.id = notes.rowid
+                WHERE notes MATCH ?
+                ORDER BY bm25(notes, {weights})
+                LIMIT ?""", (fts_query, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query '{query}': {e}")
+        return [{'requirement_id': requirement_id, 'short_description': short_description,
+                 'filename': filename, 'snippet': " ".join(snippet.split())}
+                for requirement_id, short_description, filename, snippet in rows]
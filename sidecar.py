@@ -0,0 +1,31 @@
+"""Versioned JSON sidecar files kept in the vault
+
+The note cache, link graph and overview manifest each persist one JSON
+object, {'version': N, <key>: data}, in a dotfile (hidden by Obsidian). A
+sidecar from another version is ignored, so bumping the version is all it
+takes to invalidate old files after a format change.
+"""
+import json
+import os
+
+from note_writer import write_note_atomic
+
+
+def load_sidecar(vault_dir, filename, version, key):
+    """The data stored under key, or {} if the sidecar is missing, unreadable or another version"""
+    try:
+        with open(os.path.join(vault_dir, filename), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != version:
+        return {}
+    return data.get(key) or {}
+
+
+def save_sidecar(vault_dir, filename, version, key, data, indent=None):
+    """Write data under key, atomically and through a temp file unique to this run"""
+    separators = (',', ':') if indent is None else None
+    content = json.dumps({'version': version, key: data}, ensure_ascii=False, indent=indent,
+                         separators=separators)
+    write_note_atomic(os.path.join(vault_dir, filename), content)
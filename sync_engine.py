@@ -0,0 +1,1111 @@
+import functools
+import logging
+import os
+import sqlite3
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+import config
+from excel_reader import iter_requirement_rows
+from excel_sources import expand_sources, is_sources_file, iter_source_rows, load_sources
+from requirement_table import iter_requirement_tables
+from excel_snapshot import (LEGACY_SNAPSHOT_FILENAME, RequirementDiff, Snapshot, SnapshotWriter,
+                            default_snapshot_dir, row_hashes, snapshot_matches, snapshot_path,
+                            workbook_fingerprint)
+from vault_index import VaultIndex
+from note_cache import NoteCache
+from requirement_index import RequirementIndex
+from requirement_store import RequirementStore
+from link_graph import LinkGraph, find_vault_root
+from search_index import SearchIndex
+from vault_scan import scan_notes
+from note_writer import CANCELLED, write_note_atomic, write_notes
+from note_sync import (attribute_rows, attribute_rows_from_note, replace_attribute_table,
+                       source_hash)
+from note_template import NoteTemplate
+from instrumentation import RunProfile, Stage, python_profiler, written_counts
+from requirement_export import (NOTE_FIELD, STATUS_EXISTS, STATUS_INVALID, STATUS_MISSING,
+                                STATUS_NOTE_ONLY, STATUS_RENAMED, RequirementExport, note_record,
+                                table_records)
+from overview import (OVERVIEW_FILENAME, SHARD_PREFIX, content_hash, load_manifest, plan_shards,
+                      render_index, render_overview, render_shard, save_manifest)
+
+# Log level for per-file lines about notes that need no action (✓ EXISTS,
+# ⏭ SKIPPED); everything else is logged at logging.INFO
+DETAIL = logging.DEBUG
+
+
+def is_requirement_note(filename):
+    """True for requirement notes (.md files other than the 0_ overview/template files)"""
+    return filename.endswith('.md') and not filename.startswith('0_')
+
+
+class OperationCancelled(Exception):
+    """Raised inside an engine operation once its cancel event is set"""
+
+
+def instrumented(operation):
+    """Record a RunProfile of each call of an engine operation (see instrumentation)
+
+    The profile's summary is logged, appended to the profile file and
+    returned in the result dict as 'profile'.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.profile is not None:
+                return method(self, *args, **kwargs)
+            self.profile = RunProfile(operation)
+            try:
+                with python_profiler(self.python_profiler, self._profiler_stats_path(operation),
+                                     self.log):
+                    result = method(self, *args, **kwargs)
+                self._report_profile()
+                if isinstance(result, dict):
+                    result['profile'] = self.profile.to_dict()
+                return result
+            finally:
+                self.profile = None
+        return wrapper
+    return decorator
+
+
+class SyncEngine:
+    """Excel → Obsidian sync operations, independent of any UI
+
+    Progress is reported line by line through log(message, level); results are
+    returned as plain dicts (JSON-serializable) and failures are raised, so
+    the same engine drives the Tk GUI and the headless CLI.
+
+    Operations may run on a worker thread: progress(done, total) is called
+    as rows/files are processed (total is None while unknown, e.g. while
+    streaming Excel), and setting cancel_event makes the running operation
+    raise OperationCancelled at the next row or file.
+    """
+
+    def __init__(self, excel_file, output_dir, log=None,
+                 case_insensitive=None, use_note_cache=None, scan_mode=None, jobs=None,
+                 progress=None, cancel_event=None, write_jobs=None, dry_run=False,
+                 use_excel_snapshot=None, note_template_file=None, python_profiler=None,
+                 use_search_index=None):
+        self.excel_file = excel_file
+        self.output_dir = output_dir
+        self._log = log or (lambda message, level=logging.INFO: None)
+        self.progress = progress or (lambda done, total=None: None)
+        self.cancel_event = cancel_event
+        self.case_insensitive = (config.CASE_INSENSITIVE_FILENAMES
+                                 if case_insensitive is None else case_insensitive)
+        self.use_note_cache = config.USE_NOTE_CACHE if use_note_cache is None else use_note_cache
+        self.scan_mode = scan_mode or config.SCAN_MODE
+        self.jobs = jobs or config.SCAN_JOBS
+        self.write_jobs = write_jobs or config.WRITE_JOBS
+        self.dry_run = dry_run
+        self.use_excel_snapshot = (config.USE_EXCEL_SNAPSHOT
+                                   if use_excel_snapshot is None else use_excel_snapshot)
+        self.use_search_index = config.USE_SEARCH_INDEX if use_search_index is None else use_search_index
+        self.note_template_file = note_template_file or config.NOTE_TEMPLATE_FILE
+        self._note_template = None
+        self.overview_shard_threshold = config.OVERVIEW_SHARD_THRESHOLD
+        self.overview_shard_rows = config.OVERVIEW_SHARD_ROWS
+        self.trace_links = config.TRACE_LINKS
+        # Set while an operation runs: its per-stage timings and counters
+        self.profile = None
+        self.log_profile_summary = config.LOG_PROFILE_SUMMARY
+        self.profile_file = config.PROFILE_FILE
+        self.python_profiler = python_profiler or config.PYTHON_PROFILER
+        # Set by read_requirement_tables: what changed in the workbook since the last run
+        self.excel_changes = None
+
+    def log(self, message, level=logging.INFO):
+        """Pass a log line to the log callback (timed while profiling)"""
+        if self.profile is None:
+            self._log(message, level)
+            return
+        start = time.perf_counter()
+        self._log(message, level)
+        self.profile.log_seconds += time.perf_counter() - start
+        self.profile.log_lines += 1
+
+    def stage(self, name):
+        """Context manager timing a stage of the running operation; yields its Stage"""
+        if self.profile is None:
+            return nullcontext(Stage(name))
+        return self.profile.stage(name)
+
+    def count(self, stage, **counters):
+        """Add to the counters of a stage of the running operation"""
+        if self.profile is not None:
+            self.profile.get(stage).add(**counters)
+
+    def _profile_path(self):
+        if not self.profile_file or not self.output_dir:
+            return None
+        return os.path.join(self.output_dir, self.profile_file)
+
+    def _profiler_stats_path(self, operation):
+        if self.python_profiler != 'cprofile' or self.dry_run or not os.path.isdir(self.output_dir or ''):
+            return None
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return os.path.join(self.output_dir, f".requirements_profile_{operation}_{stamp}.prof")
+
+    def _report_profile(self):
+        profile = self.profile
+        profile.finish()
+        if self.log_profile_summary:
+            for line in profile.summary_lines():
+                self.log(line)
+        path = self._profile_path()
+        if path and not self.dry_run and os.path.isdir(self.output_dir):
+            try:
+                profile.save(path, config.PROFILE_FILE_MAX_BYTES)
+            except OSError as e:
+                self.log(f"⚠ Could not save profile: {e}")
+
+    @property
+    def note_template(self):
+        """The compiled note template (loaded on first use)"""
+        if self._note_template is None:
+            self._note_template = NoteTemplate.load(self.output_dir, self.note_template_file)
+            if self._note_template.source:
+                self.log(f"📄 Using note template: {self._note_template.source}")
+        return self._note_template
+
+    @property
+    def multi_source(self):
+        """True when the Excel file setting names a sources file (see excel_sources)"""
+        return is_sources_file(self.excel_file)
+
+    def read_excel_requirements(self):
+        """Stream meaningful requirement rows from the Excel file
+
+        Yields (excel_row, row) pairs lazily so the whole sheet is never
+        loaded into memory at once. With a sources file, the rows of every
+        listed workbook/sheet are yielded in turn (parsed in parallel), each
+        tagged with its 'source'.
+        """
+        try:
+            if self.multi_source:
+                sources = load_sources(self.excel_file)
+                self.log(f"📚 Reading {len(sources)} requirement sources from {os.path.basename(self.excel_file)}")
+                if self.profile is not None:
+                    self.count('excel_read', bytes_read=sum(os.path.getsize(path)
+                                                            for path, _ in expand_sources(sources)))
+                yield from iter_source_rows(sources, self.jobs)
+            else:
+                self.count('excel_read', bytes_read=os.path.getsize(self.excel_file))
+                yield from iter_requirement_rows(self.excel_file)
+        except Exception as e:
+            raise Exception(f"Error reading Excel file: {e}")
+
+    @staticmethod
+    def row_label(req):
+        """Where a requirement row is, for log lines ("Row 7" or "RTM.xlsx:Sheet1 row 7")"""
+        return f"{req.source} row {req.Index}" if req.source else f"Row {req.Index}"
+
+    def find_duplicate_ids(self, table, seen):
+        """Rows of table whose requirement ID already appeared
+
+        seen maps each requirement ID to the label of its first row and is
+        updated in place, so duplicates are found across tables and sources.
+        """
+        duplicates = []
+        for req in table[table['valid']].itertuples():
+            location = self.row_label(req)
+            first = seen.setdefault(req.req_id, location)
+            if first != location:
+                duplicates.append({'requirement_id': req.req_id, 'first': first, 'duplicate': location})
+        return duplicates
+
+    def scan_vault(self):
+        """Snapshot the vault directory once so existence checks are in-memory lookups"""
+        with self.stage('vault_snapshot') as stage:
+            vault = VaultIndex.scan(self.output_dir, case_insensitive=self.case_insensitive)
+            stage.add(files=len(vault))
+        return vault
+
+    def read_requirement_tables(self):
+        """Stream the Excel file as normalized requirement tables (see requirement_table)
+
+        With the Excel snapshot enabled, an unchanged workbook is replayed
+        from its snapshot (in EXCEL_SNAPSHOT_DIR) instead of being parsed, and
+        self.excel_changes holds the added/removed/modified requirement IDs:
+        while a table is being processed it already covers that table's
+        added and modified rows, and removed rows are filled in once the
+        tables have been consumed. Both the snapshot and the diff are built
+        one table at a time. Sources files are always parsed.
+        """
+        # The snapshot fingerprints a single workbook
+        if not self.use_excel_snapshot or self.multi_source:
+            tables = iter_requirement_tables(self.read_excel_requirements())
+        else:
+            tables = self._read_tables_with_snapshot()
+        if self.profile is None:
+            return tables
+        return self._profiled_tables(tables)
+
+    def _profiled_tables(self, tables):
+        for table in self.profile.timed('excel_read', tables):
+            self.count('excel_read', rows=len(table))
+            yield table
+
+    def _read_tables_with_snapshot(self):
+        self._remove_legacy_snapshot()
+        path = snapshot_path(config.EXCEL_SNAPSHOT_DIR or default_snapshot_dir(),
+                             self.output_dir, self.excel_file)
+        try:
+            fingerprint = workbook_fingerprint(self.excel_file)
+        except OSError as e:
+            raise Exception(f"Error reading Excel file: {e}")
+
+        snapshot = Snapshot.open(path)
+        try:
+            if snapshot is not None and snapshot_matches(fingerprint, snapshot.fingerprint):
+                self.log("⚡ Workbook unchanged since last run - using saved snapshot")
+                self.count('excel_read', cache_hits=1, bytes_read=os.path.getsize(path))
+                self.excel_changes = {'changed': False, 'added': [], 'removed': [], 'modified': []}
+                # Same bytes, new mtime: resave it so the hash isn't needed next time
+                resave = fingerprint['mtime_ns'] != snapshot.fingerprint['mtime_ns']
+                yield from self._saving_snapshot(snapshot.chunks(), path, fingerprint, resave)
+            else:
+                yield from self._saving_snapshot(self._parse_tables(snapshot), path, fingerprint)
+        finally:
+            if snapshot is not None:
+                snapshot.close()
+
+    def _parse_tables(self, snapshot):
+        """Parse the workbook, yielding (table, row hashes) and diffing it against snapshot as it goes"""
+        self.count('excel_read', cache_misses=1)
+        diff = RequirementDiff(snapshot.row_hashes() if snapshot is not None else None)
+        # Shares diff's lists, so it grows as the tables are read
+        self.excel_changes = dict(diff.changes, changed=True)
+        for table in iter_requirement_tables(self.read_excel_requirements()):
+            hashes = row_hashes(table)
+            diff.add(hashes)
+            yield table, hashes
+        self.excel_changes.update(diff.finish())
+        if snapshot is not None:
+            changes = self.excel_changes
+            self.log(f"📈 Excel changes since last run: {len(changes['added'])} added, "
+                     f"{len(changes['removed'])} removed, {len(changes['modified'])} modified")
+
+    def _saving_snapshot(self, chunks, path, fingerprint, save=True):
+        """Yield the tables of chunks ((table, row hashes) pairs), saving them as the snapshot
+
+        Chunks are written as they stream past, so neither saving nor
+        replaying a snapshot holds more than one table in memory. Nothing is
+        saved in a dry run or when the stream isn't read to the end.
+        """
+        writer = None
+        if save and not self.dry_run and os.path.isdir(self.output_dir):
+            try:
+                writer = SnapshotWriter(path, fingerprint)
+            except OSError as e:
+                self.log(f"⚠ Could not save Excel snapshot: {e}")
+        try:
+            for table, hashes in chunks:
+                if writer is not None:
+                    try:
+                        writer.add(table, hashes)
+                    except OSError as e:
+                        self.log(f"⚠ Could not save Excel snapshot: {e}")
+                        writer = None
+                yield table
+            if writer is not None:
+                try:
+                    if not writer.commit():
+                        self.log("⚠ Workbook changed while it was read - snapshot not saved")
+                except OSError as e:
+                    self.log(f"⚠ Could not save Excel snapshot: {e}")
+        finally:
+            if writer is not None:
+                writer.discard()
+
+    def _remove_legacy_snapshot(self):
+        """Delete a snapshot an earlier version left in the vault (never loaded: it is a pickle)"""
+        legacy_path = os.path.join(self.output_dir, LEGACY_SNAPSHOT_FILENAME)
+        if self.dry_run or not os.path.exists(legacy_path):
+            return
+        try:
+            os.remove(legacy_path)
+        except OSError as e:
+            self.log(f"⚠ Could not remove old Excel snapshot {LEGACY_SNAPSHOT_FILENAME}: {e}")
+
+    def check_cancelled(self):
+        """Raise OperationCancelled if the caller asked to stop"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise OperationCancelled("Operation cancelled")
+
+    def _require_paths(self, excel=True):
+        if excel and not self.excel_file:
+            raise ValueError("Please select an Excel file")
+        if not self.output_dir:
+            raise ValueError("Please select output directory")
+
+    @instrumented('check')
+    def check_missing_files(self):
+        """Check which Excel requirements are missing files
+
+        Rows without a note under their expected filename are looked up by
+        requirement ID, so a note whose short description changed is
+        reported as renamed rather than missing. Returns a dict with the
+        total row count and lists of existing, renamed, missing and invalid
+        requirements, duplicate IDs in Excel, orphaned notes (ID not in
+        Excel) and notes sharing an ID.
+        """
+        self._require_paths()
+
+        self.log("=" * 60)
+        self.log("CHECKING FOR MISSING REQUIREMENT FILES")
+        self.log("=" * 60)
+
+        # Stream Excel requirements
+        self.log("📊 Reading requirements from Excel...")
+        total_count = 0
+
+        # Check which files exist against a single snapshot of the vault;
+        # notes renamed since are found by requirement ID in the parsed notes
+        vault = self.scan_vault()
+        index = RequirementIndex.from_notes(self.get_all_requirement_files())
+        missing_files = []
+        existing_files = []
+        renamed_notes = []
+        invalid_requirements = []
+        duplicate_ids = []
+        seen_ids = {}
+        excel_ids = set()
+
+        for table in self.read_requirement_tables():
+            total_count += len(table)
+            excel_ids.update(table['req_id'])
+            for entry in self.find_duplicate_ids(table, seen_ids):
+                duplicate_ids.append(entry)
+                self.log(f"⚠ DUPLICATE ID ({entry['duplicate']}): {entry['requirement_id']} "
+                         f"already used at {entry['first']}")
+            with self.stage('existence_check') as stage:
+                table['exists'] = table['valid'] & vault.existing_mask(table['filename'])
+                stage.add(rows=len(table))
+            for req in table.itertuples():
+                self.check_cancelled()
+                if not req.valid:
+                    invalid_requirements.append({
+                        'row': int(req.Index),
+                        'source': req.source,
+                        'requirement_id': req.req_id or "Missing",
+                        'short_description': req.short_desc or "Missing",
+                        'error': req.error,
+                    })
+                    self.log(f"⚠ INVALID ({self.row_label(req)}): {req.error} - "
+                             f"ID: '{req.req_id or 'Missing'}', Short Desc: '{req.short_desc or 'Missing'}'")
+                    continue
+
+                entry = {'filename': req.filename, 'requirement_id': req.req_id,
+                         'short_description': req.short_desc}
+                if req.exists:
+                    existing_files.append(entry)
+                    self.log(f"✓ EXISTS: {req.filename}", DETAIL)
+                    continue
+                note = index.note_for(req.req_id)
+                if note:
+                    renamed_notes.append(dict(entry, note=note))
+                    self.log(f"🔀 RENAMED: {req.req_id} is in {note} (Excel now names it {req.filename})")
+                else:
+                    missing_files.append(entry)
+                    self.log(f"❌ MISSING: {req.filename} ({req.req_id} - {req.short_desc})")
+            self.progress(total_count)
+
+        orphaned_notes = index.orphans(excel_ids)
+        duplicate_notes = index.duplicates()
+
+        # Summary
+        self.log("=" * 60)
+        self.log("SUMMARY")
+        self.log(f"📊 Total requirements: {total_count}")
+        self.log(f"✓ Existing files: {len(existing_files)}")
+        self.log(f"🔀 Renamed notes (found by ID): {len(renamed_notes)}")
+        self.log(f"❌ Missing files: {len(missing_files)}")
+        self.log(f"⚠ Invalid requirements: {len(invalid_requirements)}")
+        self.log(f"⚠ Duplicate requirement IDs: {len(duplicate_ids)}")
+        self.log(f"📭 Orphaned notes (ID not in Excel): {len(orphaned_notes)}")
+        self.log(f"⚠ Notes sharing a requirement ID: {len(duplicate_notes)}")
+
+        if missing_files:
+            self.log("=" * 60)
+            self.log("MISSING REQUIREMENTS:")
+            for entry in missing_files:
+                self.log(f"  • {entry['requirement_id']}: {entry['short_description']}")
+            self.log(f"\nUse 'Create Missing Files' to create these {len(missing_files)} files")
+
+        if invalid_requirements:
+            self.log("=" * 60)
+            self.log("INVALID REQUIREMENTS (cannot create files):")
+            for entry in invalid_requirements:
+                where = f"{entry['source']} row {entry['row']}" if entry['source'] else f"Row {entry['row']}"
+                self.log(f"  • {where}: {entry['error']} "
+                         f"(ID: '{entry['requirement_id']}', Short Desc: '{entry['short_description']}')")
+
+        if duplicate_ids:
+            self.log("=" * 60)
+            self.log("DUPLICATE REQUIREMENT IDS:")
+            for entry in duplicate_ids:
+                self.log(f"  • {entry['requirement_id']}: {entry['duplicate']} (first at {entry['first']})")
+
+        if renamed_notes:
+            self.log("=" * 60)
+            self.log("RENAMED NOTES (short description changed in Excel):")
+            for entry in renamed_notes:
+                self.log(f"  • {entry['requirement_id']}: {entry['note']} → {entry['filename']}")
+
+        if orphaned_notes:
+            self.log("=" * 60)
+            self.log("ORPHANED NOTES (requirement ID no longer in Excel):")
+            for entry in orphaned_notes:
+                self.log(f"  • {entry['requirement_id']}: {entry['filename']}")
+
+        if duplicate_notes:
+            self.log("=" * 60)
+            self.log("NOTES SHARING A REQUIREMENT ID:")
+            for entry in duplicate_notes:
+                self.log(f"  • {entry['requirement_id']}: {', '.join(entry['filenames'])}")
+
+        if not missing_files and not invalid_requirements:
+            self.log("🎉 All valid requirements have corresponding files!")
+
+        return {
+            'total': total_count,
+            'existing': existing_files,
+            'renamed': renamed_notes,
+            'missing': missing_files,
+            'invalid': invalid_requirements,
+            'duplicates': duplicate_ids,
+            'orphaned': orphaned_notes,
+            'duplicate_notes': duplicate_notes,
+            'excel_changes': self.excel_changes,
+        }
+
+    @instrumented('create')
+    def create_missing_files(self):
+        """Create files for Excel requirements that don't have corresponding files
+
+        Each table chunk is handled as a batch: all missing notes are rendered
+        at once through the compiled note template (sharing one creation
+        timestamp), then written atomically on a bounded thread pool. In dry-run
+        mode nothing is written and the notes that would be created are
+        reported instead. Requirements whose note exists under another name
+        (found by requirement ID) are not recreated.
+
+        Returns a dict with created/skipped/error counts and the created filenames.
+        """
+        self._require_paths()
+
+        self.log("=" * 60)
+        self.log("CREATING MISSING REQUIREMENT FILES" + (" (DRY RUN)" if self.dry_run else ""))
+        self.log("=" * 60)
+
+        # Stream Excel requirements
+        self.log("📊 Reading requirements from Excel...")
+        total_count = 0
+
+        # Create missing files
+        created_files = []
+        skipped_count = 0
+        error_count = 0
+
+        # Ensure output directory exists
+        if not self.dry_run:
+            os.makedirs(self.output_dir, exist_ok=True)
+        vault = self.scan_vault()
+        index = RequirementIndex.from_notes(self.get_all_requirement_files())
+        template = self.note_template
+        creation_date = datetime.now().isoformat()
+        seen_ids = {}
+        renamed_count = 0
+
+        for table in self.read_requirement_tables():
+            total_count += len(table)
+            for entry in self.find_duplicate_ids(table, seen_ids):
+                self.log(f"⚠ DUPLICATE ID ({entry['duplicate']}): {entry['requirement_id']} "
+                         f"already used at {entry['first']}")
+
+            # Pick out this batch of missing notes (by position: with several
+            # sources, Excel row numbers repeat)
+            batch = []
+            positions = []
+            for position, req in enumerate(table.itertuples()):
+                self.check_cancelled()
+                if not req.valid:
+                    error_count += 1
+                    self.log(f"❌ ERROR ({self.row_label(req)}): {req.error} - "
+                             f"ID: '{req.req_id or 'Missing'}', Short Desc: '{req.short_desc or 'Missing'}'")
+                    continue
+
+                if req.filename in vault:
+                    skipped_count += 1
+                    self.log(f"⏭ SKIPPED: {req.filename} (already exists)", DETAIL)
+                    continue
+
+                # Don't duplicate a note whose short description changed in Excel
+                note = index.note_for(req.req_id)
+                if note:
+                    renamed_count += 1
+                    self.log(f"🔀 SKIPPED: {req.filename} ({req.req_id} already has note {note})")
+                    continue
+
+                # Claim the name so duplicate rows in the sheet are skipped
+                vault.add(req.filename)
+                batch.append(req)
+                positions.append(position)
+
+            # Render the batch in one pass over whole columns
+            try:
+                with self.stage('note_render') as stage:
+                    contents = template.render_table(table.iloc[positions], creation_date) if batch else []
+                    stage.add(rows=len(contents))
+            except Exception as e:
+                error_count += len(batch)
+                self.log(f"❌ UNEXPECTED ERROR ({self.row_label(batch[0])} - {self.row_label(batch[-1])}): {str(e)}")
+                batch = []
+                contents = []
+            batch = list(zip(batch, contents))
+
+            # Write the batch
+            if self.dry_run:
+                outcomes = [None] * len(batch)
+            else:
+                with self.stage('note_write') as stage:
+                    outcomes = write_notes([(os.path.join(self.output_dir, req.filename), content)
+                                            for req, content in batch],
+                                           self.write_jobs, cancel_event=self.cancel_event)
+                    stage.add(**written_counts(batch, outcomes))
+
+            for (req, content), outcome in zip(batch, outcomes):
+                if outcome is None:
+                    created_files.append(req.filename)
+                    if self.dry_run:
+                        self.log(f"📝 WOULD CREATE: {req.filename} ({req.req_id} - {req.short_desc}, "
+                                 f"{len(content.encode('utf-8'))} bytes)")
+                    else:
+                        self.log(f"✅ CREATED: {req.filename} ({req.req_id} - {req.short_desc})")
+                elif outcome != CANCELLED:
+                    error_count += 1
+                    self.log(f"❌ UNEXPECTED ERROR ({self.row_label(req)}): {outcome}")
+            self.check_cancelled()
+            self.progress(total_count)
+
+        # Summary
+        self.log("=" * 60)
+        if self.dry_run:
+            self.log("DRY RUN COMPLETE (no files written)")
+            self.log(f"📝 Files that would be created: {len(created_files)}")
+        else:
+            self.log("CREATION COMPLETE")
+            self.log(f"✅ Files created: {len(created_files)}")
+        self.log(f"⏭ Files skipped: {skipped_count}")
+        self.log(f"🔀 Skipped, note found by ID under another name: {renamed_count}")
+        self.log(f"❌ Errors (files not created): {error_count}")
+        self.log(f"📊 Total processed: {total_count}")
+
+        if error_count > 0:
+            self.log(f"\n⚠ {error_count} requirements could not be processed due to missing ID or Short Description")
+
+        return {
+            'total': total_count,
+            'created': len(created_files),
+            'skipped': skipped_count,
+            'renamed': renamed_count,
+            'errors': error_count,
+            'created_files': created_files,
+            'dry_run': self.dry_run,
+            'excel_changes': self.excel_changes,
+        }
+
+    @instrumented('update')
+    def update_changed_files(self):
+        """Rewrite the attribute table of notes whose Excel row changed
+
+        Each valid row is matched to its existing note by filename (or by
+        requirement ID, for notes whose short description changed) and
+        compared by the source_hash stored in the note's CREATION_METADATA
+        (parsed notes come from the note cache, so unchanged notes are not
+        even read). Notes from before hashes were recorded are compared
+        attribute by attribute instead. Only the attribute table and the
+        source_hash line of changed notes are rewritten; the ## Notes section
+        is left alone.
+
+        Returns a dict with updated/unchanged/missing/invalid/error counts and
+        the updated filenames.
+        """
+        self._require_paths()
+
+        self.log("=" * 60)
+        self.log("UPDATING CHANGED REQUIREMENT FILES" + (" (DRY RUN)" if self.dry_run else ""))
+        self.log("=" * 60)
+
+        vault = self.scan_vault()
+        parsed = self.get_all_requirement_files()
+        notes = {vault.key(filename): row for row, filename in enumerate(parsed.filenames)}
+        index = RequirementIndex.from_notes(parsed)
+
+        self.log("📊 Reading requirements from Excel...")
+        total_count = 0
+        updated_files = []
+        unchanged_count = 0
+        missing_count = 0
+        invalid_count = 0
+        error_count = 0
+
+        for table in self.read_requirement_tables():
+            total_count += len(table)
+
+            # Hash comparison only; collect the notes that need rewriting
+            changed = []
+            for req in table.itertuples():
+                self.check_cancelled()
+                if not req.valid:
+                    invalid_count += 1
+                    continue
+
+                # Popped so a duplicated sheet row can't update the same note twice;
+                # notes renamed since are found by requirement ID
+                row = notes.pop(vault.key(req.filename), None)
+                if row is None:
+                    renamed = index.note_for(req.req_id)
+                    if renamed:
+                        row = notes.pop(vault.key(renamed), None)
+                if row is None:
+                    missing_count += 1
+                    self.log(f"⏭ NO FILE: {req.filename} (use 'Create Missing Files')", DETAIL)
+                    continue
+                note = parsed.record(row)
+
+                attributes = attribute_rows(req._asdict())
+                if note['source_hash']:
+                    unchanged = note['source_hash'] == source_hash(attributes)
+                else:
+                    unchanged = attribute_rows_from_note(note) == attributes
+                if unchanged:
+                    unchanged_count += 1
+                    self.log(f"✓ UNCHANGED: {note['filename']}", DETAIL)
+                else:
+                    changed.append((req, note, attributes))
+
+            # Rewrite just the attribute tables of changed notes
+            rewrites = []
+            with self.stage('note_read') as stage:
+                for req, note, attributes in changed:
+                    try:
+                        with open(note['filepath'], 'r', encoding='utf-8') as f:
+                            content = f.read()
+                        stage.add(files=1, bytes_read=len(content.encode('utf-8')))
+                        rewrites.append((req, note['filepath'], replace_attribute_table(content, attributes)))
+                    except Exception as e:
+                        error_count += 1
+                        self.log(f"❌ ERROR updating {note['filename']}: {str(e)}")
+
+            if self.dry_run:
+                outcomes = [None] * len(rewrites)
+            else:
+                with self.stage('note_write') as stage:
+                    outcomes = write_notes([(filepath, content) for _, filepath, content in rewrites],
+                                           self.write_jobs, cancel_event=self.cancel_event)
+                    stage.add(**written_counts([(filepath, content) for _, filepath, content in rewrites],
+                                               outcomes))
+
+            for (req, filepath, _), outcome in zip(rewrites, outcomes):
+                filename = os.path.basename(filepath)
+                if outcome is None:
+                    updated_files.append(filename)
+                    verb = "WOULD UPDATE" if self.dry_run else "UPDATED"
+                    self.log(f"🔄 {verb}: {filename} ({req.req_id} - {req.short_desc})")
+                elif outcome != CANCELLED:
+                    error_count += 1
+                    self.log(f"❌ ERROR updating {filename}: {outcome}")
+            self.check_cancelled()
+            self.progress(total_count)
+
+        # Summary
+        self.log("=" * 60)
+        self.log("DRY RUN COMPLETE (no files written)" if self.dry_run else "UPDATE COMPLETE")
+        self.log(f"🔄 Files {'that would be ' if self.dry_run else ''}updated: {len(updated_files)}")
+        self.log(f"✓ Unchanged: {unchanged_count}")
+        self.log(f"⏭ No file yet: {missing_count}")
+        self.log(f"⚠ Invalid requirements: {invalid_count}")
+        self.log(f"❌ Errors: {error_count}")
+        self.log(f"📊 Total processed: {total_count}")
+
+        return {
+            'total': total_count,
+            'updated': len(updated_files),
+            'unchanged': unchanged_count,
+            'missing': missing_count,
+            'invalid': invalid_count,
+            'errors': error_count,
+            'updated_files': updated_files,
+            'dry_run': self.dry_run,
+            'excel_changes': self.excel_changes,
+        }
+
+    def get_all_requirement_files(self, search_index=None):
+        """Parse every requirement note in the vault into a RequirementStore
+
+        The notes are also synced into search_index if given, else into the
+        vault's search index (with USE_SEARCH_INDEX, outside dry runs).
+        """
+        output_dir = self.output_dir
+
+        if not os.path.exists(output_dir):
+            return RequirementStore(output_dir)
+
+        cache = NoteCache.load(output_dir) if self.use_note_cache else None
+        vault = VaultIndex.scan(output_dir, case_insensitive=False)
+
+        md_files = []
+        note_names = []
+        stats = []
+        to_parse = []
+        for filename in sorted(vault.names()):
+            if is_requirement_note(filename):  # Skip overview files
+                note_names.append(filename)
+
+                # Only reparse notes whose mtime/size changed since the last run
+                stat = vault.stat(filename) if cache or self.use_search_index or search_index or self.profile else None
+                req_data = cache.lookup(filename, stat) if cache else None
+                if req_data is None:
+                    to_parse.append((len(md_files), filename, stat))
+                md_files.append(req_data)
+                stats.append(stat)
+
+        # Parse changed notes in parallel; errors are reported here, not from workers
+        self.check_cancelled()
+        self.progress(len(md_files) - len(to_parse), len(md_files))
+        with self.stage('vault_parse') as stage:
+            results, errors = scan_notes([os.path.join(output_dir, filename) for _, filename, _ in to_parse],
+                                         mode=self.scan_mode, jobs=self.jobs)
+            stage.add(files=len(note_names), cache_hits=len(md_files) - len(to_parse),
+                      cache_misses=len(to_parse),
+                      bytes_read=sum(stat.st_size for _, _, stat in to_parse if stat))
+        for (position, filename, stat), req_data in zip(to_parse, results):
+            md_files[position] = req_data
+            if req_data and cache:
+                cache.store(filename, stat, req_data)
+        for filepath, error in errors:
+            self.log(f"Error reading file {filepath}: {error}")
+        # A dry run writes nothing, sidecars included
+        if search_index is not None or (self.use_search_index and not self.dry_run):
+            self.sync_search_index([(filename, stat, req_data)
+                                    for filename, stat, req_data in zip(note_names, stats, md_files) if req_data],
+                                   search_index)
+        store = RequirementStore.from_notes((req_data for req_data in md_files if req_data), output_dir)
+        self.progress(len(note_names), len(note_names))
+
+        if cache:
+            evicted = cache.prune(note_names)
+            try:
+                if not self.dry_run:
+                    cache.save()
+            except OSError as e:
+                self.log(f"⚠ Could not save note cache: {e}")
+            self.log(f"📦 Note cache: {cache.hits} unchanged, {cache.misses} parsed, {evicted} evicted")
+
+        return store
+
+    def sync_search_index(self, notes, index=None):
+        """Bring a search index (default: the vault's) in line with notes: [(filename, stat, req_data)]
+
+        Only notes changed since they were indexed are reread; notes not
+        listed are dropped. A vault the index can't be written to is
+        reported, not fatal.
+        """
+        with self.stage('search_index') as stage:
+            try:
+                with nullcontext(index) if index is not None else SearchIndex(self.output_dir) as index:
+                    reindexed, removed = index.sync(notes)
+            except sqlite3.Error as e:
+                self.log(f"⚠ Could not update search index: {e}")
+                return
+            stage.add(files=reindexed)
+        if reindexed or removed:
+            self.log(f"🔎 Search index: {reindexed} notes indexed, {removed} removed")
+
+    def search_requirements(self, query, limit=None, raw=False):
+        """Full-text search of the vault's notes, best matches first
+
+        Uses the search index kept next to the vault, brought up to date
+        first (only notes changed since the last sync are reread); a dry run
+        indexes the notes in memory instead, writing nothing. query is plain
+        words, each matched as a prefix against the attributes and the notes
+        body (raw: an FTS5 query, e.g. priority:high AND "login page").
+        Returns a dict with the query, the matches
+        ({requirement_id, short_description, filename, snippet}) and the
+        query time in seconds.
+        """
+        self._require_paths(excel=False)
+        if not os.path.exists(self.output_dir):
+            raise FileNotFoundError("Obsidian vault directory does not exist")
+        limit = limit or config.SEARCH_LIMIT
+
+        with SearchIndex(self.output_dir, in_memory=self.dry_run) as index:
+            self.get_all_requirement_files(search_index=index)
+            start = time.perf_counter()
+            results = index.search(query, limit, raw=raw)
+            seconds = time.perf_counter() - start
+
+        self.log(f"🔎 '{query}': {len(results)} matches in {seconds * 1000:.1f} ms")
+        for rank, match in enumerate(results, 1):
+            self.log(f"  {rank:>3}. {match['requirement_id'] or '(no ID)'} - {match['short_description']}")
+            self.log(f"       {match['snippet']}", DETAIL)
+        return {'query': query, 'results': results, 'seconds': seconds}
+
+    @instrumented('overview')
+    def generate_overview(self, requirements=None, changed=None):
+        """Generate overview file of all requirements
+
+        requirements is the parsed notes to summarize (a RequirementStore or
+        req_data dicts, see note_parser); by default the vault is scanned
+        for them. changed optionally lists the requirement notes edited since
+        the last overview (see trace_coverage). Returns a dict with the
+        requirement total, category and priority counts and the overview
+        path (None when the vault has no notes). Above
+        OVERVIEW_SHARD_THRESHOLD requirements the overview note becomes an
+        index of per-category notes, listed in 'shard_files'. With
+        TRACE_LINKS the overview gets a traceability coverage section, also
+        returned as 'coverage' (see trace_coverage). In a dry run nothing is
+        written; the notes that would be are logged.
+        """
+        self._require_paths(excel=False)
+        if not os.path.exists(self.output_dir):
+            raise FileNotFoundError("Obsidian vault directory does not exist")
+
+        self.log("=" * 50)
+        self.log("GENERATING REQUIREMENTS OVERVIEW")
+
+        # Get all requirement files
+        if requirements is None:
+            store = self.get_all_requirement_files()
+        elif isinstance(requirements, RequirementStore):
+            store = requirements
+        else:
+            store = RequirementStore.from_notes(requirements, self.output_dir)
+        self.check_cancelled()
+
+        if not len(store):
+            self.log("⚠ No requirement files found in vault")
+            return {'total': 0, 'categories': {}, 'priorities': {}, 'overview_file': None,
+                    'shard_files': [], 'coverage': None, 'dry_run': self.dry_run}
+
+        rows = store.sorted_rows()
+        categories, priority_levels = store.counts()
+        coverage = self.trace_coverage(store, categories, priority_levels, changed) if self.trace_links else None
+        generated = datetime.now().strftime('%Y-%m-%d at %H:%M:%S')
+        overview_path = os.path.join(self.output_dir, OVERVIEW_FILENAME)
+        previous = load_manifest(self.output_dir)
+
+        threshold = self.overview_shard_threshold
+        if threshold and len(rows) > threshold:
+            shard_files = self._write_sharded_overview(store, rows, categories, priority_levels,
+                                                       generated, previous, coverage)
+        else:
+            with self.stage('overview_render') as stage:
+                content = render_overview(store, rows, categories, priority_levels, generated, coverage)
+                stage.add(rows=len(rows))
+            shard_files = []
+            if self.dry_run:
+                self.log(f"📝 WOULD WRITE: {OVERVIEW_FILENAME} ({len(content.encode('utf-8'))} bytes)")
+            else:
+                # Write overview file (atomically, since Obsidian may have it open)
+                with self.stage('overview_write') as stage:
+                    write_note_atomic(overview_path, content)
+                    stage.add(files=1, bytes_written=len(content.encode('utf-8')))
+                if previous:
+                    self._remove_stale_shards(previous, {})
+                    save_manifest(self.output_dir, {})
+                self.log(f"✓ Created overview file: {OVERVIEW_FILENAME}")
+
+        self.log(f"  - {len(rows)} requirements included")
+        self.log("=" * 50)
+
+        return {
+            'total': len(rows),
+            'categories': categories,
+            'priorities': priority_levels,
+            'overview_file': overview_path,
+            'shard_files': shard_files,
+            'coverage': coverage,
+            'dry_run': self.dry_run,
+        }
+
+    def trace_coverage(self, store, categories, priority_levels, changed=None):
+        """Traceability coverage of the requirement notes in store (see link_graph)
+
+        Brings the link graph of the whole vault (VAULT_ROOT, else the
+        nearest folder above the requirements holding .obsidian) up to
+        date, rereading only notes changed since the last run, and counts
+        linked requirements overall and per category/priority, given the
+        total counts. With changed (requirement filenames, e.g. from the
+        watcher's polls) only those notes are looked at instead of walking
+        the vault. The returned dict also lists the unlinked notes.
+        """
+        with self.stage('link_graph') as stage:
+            graph = LinkGraph.load(config.VAULT_ROOT or find_vault_root(self.output_dir), self.output_dir)
+            paths = None if changed is None else graph.note_paths(self.output_dir, changed)
+            parsed, removed = graph.update(paths)
+            linked = graph.linked(self.output_dir, store.filenames)
+            stage.add(files=len(graph), cache_hits=len(graph) - parsed, cache_misses=parsed)
+        if not self.dry_run:
+            try:
+                graph.save()
+            except OSError as e:
+                self.log(f"⚠ Could not save link graph: {e}")
+
+        linked_categories, linked_priorities = store.counts(linked)
+        coverage = {
+            'linked': sum(linked),
+            'total': len(store),
+            'categories': {name: (linked_categories.get(name, 0), total) for name, total in categories.items()},
+            'priorities': {name: (linked_priorities.get(name, 0), total)
+                           for name, total in priority_levels.items()},
+            'unlinked': sorted(filename for filename, is_linked in zip(store.filenames, linked) if not is_linked),
+        }
+        self.log(f"🔗 Traceability: {coverage['linked']} of {coverage['total']} requirements linked "
+                 f"({parsed} notes scanned for links, {removed} removed)",
+                 logging.INFO if changed is None else DETAIL)
+        return coverage
+
+    @instrumented('export')
+    def export_requirements(self, directory=None, formats=None):
+        """Export the requirement index to JSON Lines, CSV and/or SQLite
+
+        Each Excel row is joined with the vault (exists / missing /
+        invalid), followed by the notes no row produces (note_only); see
+        requirement_export. Records are streamed table by table. Files go
+        to directory (default: EXPORT_DIR, else the vault). Returns the
+        per-status counts and the exported file paths.
+        """
+        self._require_paths()
+        if not os.path.exists(self.output_dir):
+            raise FileNotFoundError("Obsidian vault directory does not exist")
+        directory = directory or config.EXPORT_DIR or self.output_dir
+        formats = formats or config.EXPORT_FORMATS
+
+        self.log("=" * 60)
+        self.log("EXPORTING REQUIREMENT INDEX")
+        self.log("=" * 60)
+
+        notes = self.get_all_requirement_files()
+        vault = self.scan_vault()
+        index = RequirementIndex.from_notes(notes)
+        matched_notes = set()
+
+        # A dry run streams the same records but only counts them
+        export = RequirementExport(directory, () if self.dry_run else formats)
+        total_count = 0
+        with export:
+            for table in self.read_requirement_tables():
+                self.check_cancelled()
+                total_count += len(table)
+                with self.stage('existence_check') as stage:
+                    exists = table['valid'] & vault.existing_mask(table['filename'])
+                    stage.add(rows=len(table))
+                with self.stage('export_write') as stage:
+                    records = table_records(table, exists, index)
+                    export.write(records)
+                    stage.add(rows=len(table))
+                matched_notes.update(vault.key(record[NOTE_FIELD]) for record in records if record[NOTE_FIELD])
+                self.progress(total_count)
+            with self.stage('export_write') as stage:
+                orphans = [note_record(notes.record(row)) for row, filename in enumerate(notes.filenames)
+                           if vault.key(filename) not in matched_notes]
+                export.write(orphans)
+                stage.add(rows=len(orphans))
+        self.count('export_write', bytes_written=sum(os.path.getsize(path) for path in export.paths.values()))
+
+        counts = export.counts
+        self.log(f"📊 Excel requirements: {total_count}")
+        self.log(f"✓ With notes: {counts[STATUS_EXISTS]}")
+        self.log(f"🔀 Notes found by ID under another name: {counts[STATUS_RENAMED]}")
+        self.log(f"❌ Missing notes: {counts[STATUS_MISSING]}")
+        self.log(f"⚠ Invalid rows: {counts[STATUS_INVALID]}")
+        self.log(f"📝 Notes without an Excel row: {counts[STATUS_NOTE_ONLY]}")
+        if self.dry_run:
+            self.log(f"📝 WOULD EXPORT: {', '.join(formats)} to {directory}")
+        for path in export.paths.values():
+            self.log(f"💾 Exported: {path}")
+        self.log("=" * 60)
+
+        return {
+            'total': total_count,
+            'counts': counts,
+            'files': list(export.paths.values()),
+        }
+
+    def _write_sharded_overview(self, store, rows, categories, priority_levels, generated, previous,
+                                coverage=None):
+        """Write the overview index plus one note per category (or per N rows of one)
+
+        previous maps overview notes to the content hash they were last
+        written with; notes whose hash is unchanged are left alone. Returns
+        the shard note paths.
+        """
+        with self.stage('overview_render') as stage:
+            shards, category_links = plan_shards(store, rows, self.overview_shard_rows)
+            index, index_hash = render_index(len(rows), categories, priority_levels,
+                                             category_links, generated, coverage)
+
+            notes = [(OVERVIEW_FILENAME, index, index_hash)]
+            for filename, shard in shards.items():
+                content = render_shard(store, *shard)
+                notes.append((filename, content, content_hash(content)))
+            stage.add(rows=len(rows))
+
+        hashes = {}
+        writes = []
+        for filename, content, digest in notes:
+            hashes[filename] = digest
+            filepath = os.path.join(self.output_dir, filename)
+            # Also rewrite notes deleted since they were last written
+            if previous.get(filename) != digest or not os.path.exists(filepath):
+                writes.append((filepath, content))
+        self.check_cancelled()
+
+        if self.dry_run:
+            for filepath, content in writes:
+                self.log(f"📝 WOULD WRITE: {os.path.basename(filepath)} ({len(content.encode('utf-8'))} bytes)")
+            self.log(f"📝 Sharded overview: {len(writes)} of {len(notes)} notes would be written")
+            return [os.path.join(self.output_dir, filename) for filename in shards]
+
+        with self.stage('overview_write') as stage:
+            outcomes = write_notes(writes, self.write_jobs, cancel_event=self.cancel_event)
+            stage.add(**written_counts(writes, outcomes))
+        for (filepath, _), outcome in zip(writes, outcomes):
+            if outcome is not None:
+                # Forget the hash so the note is retried on the next run
+                hashes.pop(os.path.basename(filepath), None)
+                if outcome != CANCELLED:
+                    self.log(f"❌ Could not write {os.path.basename(filepath)}: {outcome}")
+        self._remove_stale_shards(previous, shards)
+        try:
+            save_manifest(self.output_dir, hashes)
+        except OSError as e:
+            self.log(f"⚠ Could not save overview manifest: {e}")
+        self.check_cancelled()
+
+        written = sum(1 for outcome in outcomes if outcome is None)
+        self.log(f"✓ Sharded overview: {OVERVIEW_FILENAME} + {len(shards)} category notes "
+                 f"({written} written, {len(shards) + 1 - len(writes)} unchanged)")
+        return [os.path.join(self.output_dir, filename) for filename in shards]
+
+    def _remove_stale_shards(self, previous, current):
+        """Delete category notes of an earlier sharded overview that are no longer written"""
+        removed = 0
+        for filename in previous:
+            if filename.startswith(SHARD_PREFIX) and filename not in current:
+                try:
+                    os.remove(os.path.join(self.output_dir, filename))
+                    removed += 1
+                    self.log(f"🗑 Removed stale overview note: {filename}", DETAIL)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    self.log(f"⚠ Could not remove {filename}: {e}")
+        if removed:
+            self.log(f"🗑 Removed {removed} stale category overview notes")
@@ -0,0 +1,66 @@
+import os
+import sys
+
+
+# Windows and macOS filesystems treat REQ-1_Foo.md and req-1_foo.md as the same file
+DEFAULT_CASE_INSENSITIVE = sys.platform in ('win32', 'darwin')
+
+
+class VaultIndex:
+    """In-memory snapshot of the files in a vault directory
+
+    Built with a single os.scandir so every existence check afterwards is a
+    set lookup instead of a filesystem round trip (slow on synced/network
+    drives). Stat results come from the cached DirEntry and are only fetched
+    when asked for.
+    """
+
+    def __init__(self, directory, entries=(), case_insensitive=DEFAULT_CASE_INSENSITIVE):
+        self.directory = directory
+        self.case_insensitive = case_insensitive
+        self._entries = {}
+        for entry in entries:
+            self._entries[self.key(entry.name)] = entry
+
+    @classmethod
+    def scan(cls, directory, case_insensitive=DEFAULT_CASE_INSENSITIVE):
+        """Snapshot all regular files in directory (an empty index if it doesn't exist)"""
+        if not os.path.isdir(directory):
+            return cls(directory, case_insensitive=case_insensitive)
+        with os.scandir(directory) as it:
+            entries = [entry for entry in it if entry.is_file()]
+        return cls(directory, entries, case_insensitive=case_insensitive)
+
+    def key(self, filename):
+        """Normalized lookup key for a filename"""
+        return filename.casefold() if self.case_insensitive else filename
+
+    def __contains__(self, filename):
+        return self.key(filename) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def names(self):
+        """Actual on-disk names of all indexed files"""
+        return [entry if isinstance(entry, str) else entry.name
+                for entry in self._entries.values()]
+
+    def stat(self, filename):
+        """Stat result for an indexed file, or None if it isn't in the snapshot"""
+        entry = self._entries.get(self.key(filename))
+        if entry is None:
+            return None
+        if isinstance(entry, str):
+            return os.stat(os.path.join(self.directory, entry))
+        return entry.stat()
+
+    def add(self, filename):
+        """Record a file created after the snapshot was taken"""
+        self._entries.setdefault(self.key(filename), filename)
+
+    def existing_mask(self, filenames):
+        """Vectorized membership test for a pandas Series of filenames"""
+        if self.case_insensitive:
+            filenames = filenames.str.casefold()
+        return filenames.isin(self._entries.keys())
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from note_parser import parse_requirement_note, parse_requirement_text, read_note_text
+
+
+# Scan modes:
+#   serial  - read and parse on the calling thread
+#   thread  - read and parse on a thread pool (best for network/synced drives,
+#             where workers spend their time waiting on I/O)
+#   process - read on a thread pool, parse on a process pool (large local
+#             vaults, where table parsing is the CPU-bound part)
+SCAN_MODES = ('serial', 'thread', 'process')
+
+# Below this many notes pool startup costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Notes handed to a worker process per task
+PROCESS_CHUNKSIZE = 64
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def _safe_call(func, *args):
+    """Run func, returning (result, None) or (None, error message)"""
+    try:
+        return func(*args), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _safe_parse_note(filepath):
+    return _safe_call(parse_requirement_note, filepath)
+
+
+def _safe_read_note(filepath):
+    return _safe_call(read_note_text, filepath)
+
+
+def _safe_parse_text(content, filepath):
+    return _safe_call(parse_requirement_text, content, filepath)
+
+
+def scan_notes(filepaths, mode='thread', jobs=None):
+    """Parse requirement notes, optionally in parallel
+
+    Returns (results, errors): results holds one req_data (or None on
+    failure) per input path in input order, and errors is a list of
+    (filepath, message) pairs so the caller can report them from its own
+    thread.
+    """
+    if mode not in SCAN_MODES:
+        raise ValueError(f"Unknown scan mode '{mode}' (expected one of {', '.join(SCAN_MODES)})")
+    filepaths = list(filepaths)
+    jobs = jobs or default_jobs()
+    if jobs <= 1 or len(filepaths) < PARALLEL_THRESHOLD:
+        mode = 'serial'
+
+    if mode == 'serial':
+        outcomes = [_safe_parse_note(path) for path in filepaths]
+    elif mode == 'thread':
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(_safe_parse_note, filepaths))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            reads = list(pool.map(_safe_read_note, filepaths))
+        outcomes = [None] * len(filepaths)
+        to_parse = []
+        for i, (content, error) in enumerate(reads):
+            if error is None:
+                to_parse.append(i)
+            else:
+                outcomes[i] = (None, error)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = pool.map(_safe_parse_text,
+                              [reads[i][0] for i in to_parse],
+                              [filepaths[i] for i in to_parse],
+                              chunksize=PROCESS_CHUNKSIZE)
+            for i, outcome in zip(to_parse, parsed):
+                outcomes[i] = outcome
+
+    results = []
+    errors = []
+    for path, (req_data, error) in zip(filepaths, outcomes):
+        results.append(req_data)
+        if error is not None:
+            errors.append((path, error))
+    return results, errors
@@ -0,0 +1,214 @@
+import os
+import time
+
+import config
+from excel_sources import expand_sources, load_sources
+from instrumentation import RunProfile
+from note_cache import NoteCache
+from requirement_store import RequirementStore
+from sync_engine import OVERVIEW_FILENAME, OperationCancelled, is_requirement_note
+from vault_scan import scan_notes
+
+
+class VaultWatcher:
+    """Keeps the requirements overview current while notes and the workbook change
+
+    Polls the vault with os.scandir and compares mtimes and sizes, so it
+    needs no extra dependencies and works on any filesystem (including
+    synced/network drives where change notifications are unreliable).
+    Parsed notes are held in memory (a RequirementStore): after a burst of
+    edits settles only the notes that changed are reparsed, and the overview
+    is regenerated from the store instead of a rescan of the whole vault.
+
+    When the workbook changes it is checked against the vault (or, with
+    sync_excel, changed notes are updated and missing ones created; the
+    writes are then picked up like any other edit).
+    """
+
+    def __init__(self, engine, interval=None, debounce=None, sync_excel=None):
+        self.engine = engine
+        self.interval = config.WATCH_INTERVAL if interval is None else interval
+        self.debounce = config.WATCH_DEBOUNCE if debounce is None else debounce
+        self.sync_excel = config.WATCH_SYNC_EXCEL if sync_excel is None else sync_excel
+        self.store = RequirementStore()
+        self.stamps = {}
+        self.excel_stamp = None
+        self.cache = None
+        self.overviews = 0
+
+    def note_stamps(self):
+        """Stat of every requirement note in the vault, by filename"""
+        stamps = {}
+        try:
+            with os.scandir(self.engine.output_dir) as it:
+                for entry in it:
+                    if is_requirement_note(entry.name) and entry.is_file():
+                        stamps[entry.name] = entry.stat()
+        except FileNotFoundError:
+            pass
+        return stamps
+
+    def workbook_stamp(self):
+        """(path, mtime_ns, size) of the workbook, or of the sources file and
+        every workbook it lists; None if there is nothing to watch"""
+        if not self.engine.excel_file:
+            return None
+        paths = [self.engine.excel_file]
+        try:
+            if self.engine.multi_source:
+                paths.extend(path for path, _ in expand_sources(load_sources(self.engine.excel_file)))
+            stamps = []
+            for path in paths:
+                stat = os.stat(path)
+                stamps.append((path, stat.st_mtime_ns, stat.st_size))
+        except (OSError, ValueError):
+            return None
+        return tuple(stamps)
+
+    def load(self):
+        """Index every note and write a fresh overview"""
+        self.stamps = self.note_stamps()
+        self.excel_stamp = self.workbook_stamp()
+        self.store = self.engine.get_all_requirement_files()
+        if self.engine.use_note_cache:
+            self.cache = NoteCache.load(self.engine.output_dir)
+        self.write_overview()
+
+    def poll(self):
+        """Names of notes added, changed or removed since the last poll, and
+        whether the workbook changed"""
+        stamps = self.note_stamps()
+        changed = {name for name, stat in stamps.items()
+                   if not _same_stat(self.stamps.get(name), stat)}
+        changed.update(name for name in self.stamps if name not in stamps)
+        self.stamps = stamps
+
+        excel_stamp = self.workbook_stamp()
+        excel_changed = excel_stamp != self.excel_stamp
+        self.excel_stamp = excel_stamp
+        return changed, excel_changed
+
+    def apply(self, changed):
+        """Reparse the changed notes, drop removed ones and rewrite the overview"""
+        removed = [name for name in changed if name not in self.stamps]
+        to_parse = sorted(name for name in changed if name in self.stamps)
+
+        paths = [os.path.join(self.engine.output_dir, name) for name in to_parse]
+        results, errors = scan_notes(paths, mode=self.engine.scan_mode, jobs=self.engine.jobs)
+        # Notes that can't be read are dropped until they change again
+        self.store.update([req_data for req_data in results if req_data],
+                          removed + [name for name, req_data in zip(to_parse, results) if not req_data])
+        for filepath, error in errors:
+            self.engine.log(f"Error reading file {filepath}: {error}")
+
+        # A dry run writes nothing, sidecars included
+        if self.cache and not self.engine.dry_run:
+            self.remember(to_parse, results)
+        if self.engine.use_search_index and not self.engine.dry_run:
+            # Indexed under the stat seen before parsing, like the note cache
+            self.engine.sync_search_index((name, self.stamps[name], req_data)
+                                          for name, req_data in zip(self.store.filenames, self.store)
+                                          if name in self.stamps)
+        self.engine.log(f"👀 {len(to_parse)} notes changed, {len(removed)} removed")
+        self.write_overview(changed)
+
+    def remember(self, names, results):
+        """Keep the note cache in step so the next full scan is fast too"""
+        # Stored under the stat seen before parsing: a note edited since then
+        # looks changed to the cache and to the next poll
+        for name, req_data in zip(names, results):
+            if req_data:
+                self.cache.store(name, self.stamps[name], req_data)
+        self.cache.prune(self.stamps)
+        try:
+            self.cache.save()
+        except OSError as e:
+            self.engine.log(f"⚠ Could not save note cache: {e}")
+
+    def write_overview(self, changed=None):
+        """Regenerate the overview; changed limits the link graph update to those notes"""
+        if len(self.store):
+            self.engine.generate_overview(self.store, changed)
+            self.overviews += 1
+
+    def excel_changed(self):
+        """Check (or sync) the vault against the workbook after it was saved"""
+        self.engine.log("👀 Workbook changed")
+        try:
+            if self.sync_excel:
+                self.engine.update_changed_files()
+                self.engine.create_missing_files()
+            else:
+                self.engine.check_missing_files()
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            # Keep watching; the next save of the workbook triggers another try
+            self.engine.log(f"⚠ Could not process workbook: {e}")
+
+    def run(self):
+        """Watch until the engine's cancel event is set
+
+        Changes are applied once nothing has changed for debounce seconds,
+        so a burst of saves (or a sync client catching up) costs one
+        reparse and one overview write. The link graph is walked once at
+        the start; refreshes only reread the notes the polls saw change, so
+        links edited elsewhere in the vault show up on the next full run.
+        The whole session is profiled as one 'watch' operation, logged and
+        saved when watching stops. Returns a summary dict.
+        """
+        engine = self.engine
+        engine._require_paths(excel=False)
+        if not os.path.isdir(engine.output_dir):
+            raise FileNotFoundError("Obsidian vault directory does not exist")
+
+        engine.log("=" * 50)
+        engine.log(f"WATCHING {engine.output_dir}" +
+                   (f" AND {os.path.basename(engine.excel_file)}" if engine.excel_file else ""))
+        # Refreshes run inside this profile instead of each logging and saving one
+        engine.profile = RunProfile('watch')
+        try:
+            return self._watch()
+        finally:
+            engine._report_profile()
+            engine.profile = None
+
+    def _watch(self):
+        engine = self.engine
+        self.load()
+        engine.log(f"👀 Watching {len(self.store)} notes - {OVERVIEW_FILENAME} "
+                   f"will refresh as notes change (Cancel / Ctrl+C to stop)")
+
+        pending = set()
+        excel_pending = False
+        last_change = None
+        while not self._stopped(self.interval):
+            changed, excel_changed = self.poll()
+            if changed or excel_changed:
+                pending |= changed
+                excel_pending = excel_pending or excel_changed
+                last_change = time.monotonic()
+            if last_change is None or time.monotonic() - last_change < self.debounce:
+                continue
+
+            if excel_pending:
+                self.excel_changed()
+                excel_pending = False
+            if pending:
+                self.apply(pending)
+                pending = set()
+            last_change = None
+
+        engine.log(f"⏹ Stopped watching ({self.overviews} overview refreshes)")
+        return {'notes': len(self.store), 'overviews': self.overviews}
+
+    def _stopped(self, timeout):
+        cancel_event = self.engine.cancel_event
+        if cancel_event is None:
+            time.sleep(timeout)
+            return False
+        return cancel_event.wait(timeout)
+
+
+def _same_stat(old, new):
+    return old is not None and old.st_mtime_ns == new.st_mtime_ns and old.st_size == new.st_size